@@ -0,0 +1,86 @@
+"""
+Utils shared by the benchmark scripts.
+
+This module contains the following:
+
+- generate_log_file
+- parse_size
+"""
+
+import random
+
+
+DAEMONS = ['fortishield-analysisd', 'fortishield-remoted', 'fortishield-modulesd:syscollector', 'fortishield-syscheckd',
+           'fortishield-logcollector', 'fortishield-db', 'fortishield-execd', 'fortishield-monitord']
+LEVELS = ['INFO', 'DEBUG', 'WARNING', 'ERROR']
+MESSAGES = [
+    'Reading message from agent {number}',
+    'Analyzing file: /var/ossec/etc/shared/agent-{number}.conf',
+    'Starting evaluation of policy {number}',
+    'Unable to connect to the socket (retry {number})',
+    'Received 1024 bytes from 192.168.0.{number}',
+    'Database synchronization finished for agent {number}'
+]
+SIZE_UNITS = {'B': 1, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+
+def parse_size(size):
+    """Parse a human readable size like 10MB or 1GB.
+
+    Args:
+        size (str): Size with unit. Enum units: [B, KB, MB, GB].
+
+    Returns:
+        int: Size in bytes.
+    """
+    size = size.strip().upper()
+    for unit in sorted(SIZE_UNITS, key=len, reverse=True):
+        if size.endswith(unit):
+            return int(float(size[:-len(unit)]) * SIZE_UNITS[unit])
+
+    return int(size)
+
+
+def generate_log_line(number, extra_messages=None):
+    """Build a synthetic ossec.log line.
+
+    Args:
+        number (int): Line number, used to vary the content.
+        extra_messages (list(str)): Additional messages that can be chosen for the line.
+
+    Returns:
+        str: Log line (with line break).
+    """
+    messages = MESSAGES + extra_messages if extra_messages else MESSAGES
+    second = number % 86400
+    timestamp = f"2023/02/14 {second // 3600:02d}:{second // 60 % 60:02d}:{second % 60:02d}"
+    message = random.choice(messages).format(number=number % 1000)
+
+    return f"{timestamp} {random.choice(DAEMONS)}: {random.choice(LEVELS)}: {message}\n"
+
+
+def generate_log_file(file_path, size, extra_messages=None, seed=0):
+    """Write a synthetic ossec.log file of (approximately) the specified size.
+
+    Args:
+        file_path (str): File path to write.
+        size (int): Size in bytes.
+        extra_messages (list(str)): Additional messages that can be chosen for the lines.
+        seed (int): Random seed, to generate reproducible files.
+
+    Returns:
+        int: Number of written lines.
+    """
+    random.seed(seed)
+    written_bytes = 0
+    number = 0
+
+    with open(file_path, 'w') as _file:
+        while written_bytes < size:
+            lines = [generate_log_line(number + index, extra_messages) for index in range(1000)]
+            chunk = ''.join(lines)
+            _file.write(chunk)
+            written_bytes += len(chunk)
+            number += len(lines)
+
+    return number
@@ -0,0 +1,122 @@
+"""
+Benchmark to compare the FileRegexMonitor wakeup backends.
+
+For each backend, it starts N concurrent monitors waiting on the same log file, measures the process CPU usage while
+all of them are idle and then logs a matching line, measuring the time each monitor takes to detect it.
+
+Usage:
+    python benchmarks/file_regex_monitor_wakeup.py [--monitors N] [--idle-time SECONDS] [--backends B1 B2 ...]
+
+The results are printed in JSON format.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import psutil
+
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.tools.file_watcher import INOTIFY_BACKEND, POLLING_BACKEND
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+MATCHING_LINE = '2023/02/14 09:49:47 fortishield-modulesd:aws-s3: INFO: Executing Service Analysis\n'
+PATTERN = r'fortishield-modulesd:aws-s3: INFO: Executing Service Analysis'
+
+
+def get_script_parameters():
+    """Process the script parameters.
+
+    Returns:
+        argparse.Namespace: Parameters and their values.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--monitors', '-n', type=int, default=100, help='Number of concurrent monitors')
+    parser.add_argument('--idle-time', '-i', type=float, default=2, help='Seconds to measure the idle CPU usage')
+    parser.add_argument('--backends', '-b', nargs='+', default=[POLLING_BACKEND, INOTIFY_BACKEND],
+                        help='Wakeup backends to benchmark')
+
+    return parser.parse_args()
+
+
+def run_monitor(monitoring, backend):
+    """Run a monitor until it matches and return the time when it has finished.
+
+    Args:
+        monitoring (MonitoringObject): Monitoring object.
+        backend (str): Wakeup backend.
+
+    Returns:
+        float: perf_counter value when the monitor has finished.
+    """
+    FileRegexMonitor(monitoring, only_new_events=True, wakeup_backend=backend)
+
+    return time.perf_counter()
+
+
+def benchmark_backend(backend, monitors, idle_time):
+    """Measure the idle CPU and the match latency of N monitors using the specified backend.
+
+    Args:
+        backend (str): Wakeup backend.
+        monitors (int): Number of concurrent monitors.
+        idle_time (float): Seconds to measure the idle CPU usage.
+
+    Returns:
+        dict: Benchmark results.
+    """
+    log_file = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+    process = psutil.Process()
+
+    try:
+        threads = []
+        for _ in range(monitors):
+            monitoring = MonitoringObject(pattern=PATTERN, timeout=idle_time + 30, monitored_file=log_file)
+            thread = Thread(target=run_monitor, parameters={'monitoring': monitoring, 'backend': backend})
+            thread.start()
+            threads.append(thread)
+
+        # Let every monitor reach its waiting loop
+        time.sleep(0.5)
+
+        # Measure the CPU used while the monitors are idle
+        cpu_start = sum(process.cpu_times()[:2])
+        time.sleep(idle_time)
+        idle_cpu_seconds = sum(process.cpu_times()[:2]) - cpu_start
+
+        # Log the matching line and measure how long every monitor takes to detect it
+        write_time = time.perf_counter()
+        with open(log_file, 'a') as _file:
+            _file.write(MATCHING_LINE)
+
+        latencies = [(thread.join() - write_time) * 1000 for thread in threads]
+    finally:
+        os.remove(log_file)
+
+    return {
+        'backend': backend,
+        'monitors': monitors,
+        'idle_cpu_percent': round(idle_cpu_seconds / idle_time * 100, 2),
+        'latency_ms': {
+            'mean': round(statistics.mean(latencies), 3),
+            'median': round(statistics.median(latencies), 3),
+            'max': round(max(latencies), 3)
+        }
+    }
+
+
+def main():
+    parameters = get_script_parameters()
+    results = [benchmark_backend(backend, parameters.monitors, parameters.idle_time)
+               for backend in parameters.backends]
+
+    json.dump(results, sys.stdout, indent=4)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Benchmark to compare matching each line against N patterns one by one with the PatternSet single scan.
+
+It generates a synthetic ossec.log file and, for each number of patterns, measures the time needed to get the
+matching patterns of every line with both approaches.
+
+Usage:
+    python benchmarks/pattern_set.py [--size 1GB] [--patterns 1 10 100 1000] [--max-individual-patterns 100]
+
+The results are printed in JSON format.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+
+from fortishield_qa_framework.generic_modules.tools.pattern_set import PatternSet
+from benchmark_utils import generate_log_file, parse_size
+
+
+def get_script_parameters():
+    """Process the script parameters.
+
+    Returns:
+        argparse.Namespace: Parameters and their values.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', '-s', type=str, default='1GB', help='Synthetic log size. Example: 100MB')
+    parser.add_argument('--patterns', '-p', type=int, nargs='+', default=[1, 10, 100, 1000],
+                        help='Number of patterns of each run')
+    parser.add_argument('--max-individual-patterns', '-m', type=int, default=100,
+                        help='Skip the one by one matching when there are more patterns (it is too slow)')
+
+    return parser.parse_args()
+
+
+def get_patterns(number):
+    """Build the benchmark patterns, similar to the ones used by the monitoring objects.
+
+    Args:
+        number (int): Number of patterns.
+
+    Returns:
+        list(str): Regex patterns.
+    """
+    return [rf".*fortishield-modulesd:module-{index}: INFO: Event (\d+) processed" for index in range(number)]
+
+
+def match_individually(log_file, regexes):
+    """Match every line against every regex.
+
+    Args:
+        log_file (str): Log file path.
+        regexes (list(re.Pattern)): Compiled regexes.
+
+    Returns:
+        int: Number of matches.
+    """
+    matches = 0
+    with open(log_file) as _file:
+        for line in _file:
+            for regex in regexes:
+                if regex.match(line):
+                    matches += 1
+
+    return matches
+
+
+def match_pattern_set(log_file, pattern_set):
+    """Match every line against the pattern set.
+
+    Args:
+        log_file (str): Log file path.
+        pattern_set (PatternSet): Pattern set.
+
+    Returns:
+        int: Number of matches.
+    """
+    matches = 0
+    with open(log_file) as _file:
+        for line in _file:
+            matches += len(pattern_set.match(line))
+
+    return matches
+
+
+def measure(function, *args):
+    """Measure the time that takes to run a function.
+
+    Returns:
+        float, *: Elapsed seconds and function result.
+    """
+    start_time = time.perf_counter()
+    result = function(*args)
+
+    return time.perf_counter() - start_time, result
+
+
+def main():
+    parameters = get_script_parameters()
+    log_file = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+    # Some lines match the patterns of the first modules
+    extra_messages = ['fortishield-modulesd:module-{number}: INFO: Event 10 processed']
+
+    try:
+        lines = generate_log_file(log_file, parse_size(parameters.size), extra_messages)
+        size = os.path.getsize(log_file)
+        results = []
+
+        for number in parameters.patterns:
+            patterns = get_patterns(number)
+            result = {'patterns': number, 'lines': lines, 'size_bytes': size}
+
+            elapsed_time, matches = measure(match_pattern_set, log_file, PatternSet(patterns))
+            result['pattern_set'] = {'seconds': round(elapsed_time, 3), 'lines_per_second': int(lines / elapsed_time),
+                                     'matches': matches}
+
+            if number <= parameters.max_individual_patterns:
+                elapsed_time, matches = measure(match_individually, log_file, [re.compile(p) for p in patterns])
+                result['individual'] = {'seconds': round(elapsed_time, 3),
+                                        'lines_per_second': int(lines / elapsed_time), 'matches': matches}
+
+            results.append(result)
+    finally:
+        os.remove(log_file)
+
+    json.dump(results, sys.stdout, indent=4)
+    print()
+
+
+if __name__ == '__main__':
+    main()
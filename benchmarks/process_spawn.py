@@ -0,0 +1,97 @@
+"""
+Benchmark to compare the cost of spawning commands with the different ways that LinuxProcess can run them.
+
+For each mode, it runs N times the same command and waits for it, measuring the time per 1000 commands:
+
+- double_shell: /bin/sh running /bin/bash running the command (how LinuxProcess ran the string commands before).
+- single_shell: A single bash running the command (how LinuxProcess runs the commands that need shell features).
+- direct_exec: The command executed directly (how LinuxProcess runs the commands without shell features).
+
+Usage:
+    python benchmarks/process_spawn.py [--commands N] [--command 'true']
+
+The results are printed in JSON format.
+"""
+
+import sys
+import json
+import time
+import argparse
+import shlex
+
+from fortishield_qa_framework.generic_modules.process.process import Process
+from fortishield_qa_framework.generic_modules.process.linux_process import LinuxProcess
+
+
+def get_script_parameters():
+    """Process the script parameters.
+
+    Returns:
+        argparse.Namespace: Parameters and their values.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--commands', '-n', type=int, default=1000, help='Number of commands to run in each mode')
+    parser.add_argument('--command', '-c', type=str, default='true',
+                        help='Command without shell features to run. Example: "ls /"')
+
+    return parser.parse_args()
+
+
+def get_process(mode, command):
+    """Build a process of the specified mode.
+
+    Args:
+        mode (str): Spawn mode. Enum: [double_shell, single_shell, direct_exec].
+        command (str): Command to run.
+
+    Returns:
+        Process: Process object.
+    """
+    if mode == 'double_shell':
+        return Process(command=f"/bin/bash -c \"{command}\"", wait=True)
+
+    if mode == 'single_shell':
+        return Process(command=['/bin/bash', '-c', command], wait=True)
+
+    return LinuxProcess(command=command, wait=True)
+
+
+def benchmark_mode(mode, command, commands):
+    """Measure the time to run the commands with the specified mode.
+
+    Args:
+        mode (str): Spawn mode.
+        command (str): Command to run.
+        commands (int): Number of commands to run.
+
+    Returns:
+        dict: Benchmark results.
+    """
+    start_time = time.perf_counter()
+    for _ in range(commands):
+        get_process(mode, command).run()
+    elapsed_time = time.perf_counter() - start_time
+
+    return {
+        'mode': mode,
+        'commands': commands,
+        'seconds_per_1000_commands': round(elapsed_time / commands * 1000, 3),
+        'commands_per_second': int(commands / elapsed_time)
+    }
+
+
+def main():
+    parameters = get_script_parameters()
+    # The command must be executable directly, so that the modes can be compared
+    if LinuxProcess(parameters.command).command != shlex.split(parameters.command):
+        sys.exit(f"The command {parameters.command} can not be executed without shell")
+
+    results = [benchmark_mode(mode, parameters.command, parameters.commands)
+               for mode in ['double_shell', 'single_shell', 'direct_exec']]
+
+    json.dump(results, sys.stdout, indent=4)
+    print()
+
+
+if __name__ == '__main__':
+    main()
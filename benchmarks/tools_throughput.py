@@ -0,0 +1,286 @@
+"""
+Benchmark suite of the throughput of the file tools (FileRegexChecker, FileRegexMonitor and MonitoringObject), to
+track their performance between releases.
+
+For each size, it generates a synthetic ossec.log file whose last line is the searched event and measures:
+
+- file_regex_checker: Time to find the event scanning the whole file.
+- file_regex_checker_reverse: Time to find the event scanning the file from its end.
+- file_regex_monitor_text/file_regex_monitor_binary: Time to first match of a monitor that checks the whole file, in
+  text and binary mode.
+- monitoring_object_callback: Time to evaluate the default callback of a MonitoringObject with the file lines (up to
+  the max number of callback lines), without reading the file.
+
+Each measurement runs in a new process, so its peak RSS is not affected by the previous ones.
+
+Then, for each wakeup backend, it measures the detection latency of a monitor while a concurrent writer logs lines at
+a fixed rate: every batch of lines ends with a marker event with the time when it was written.
+
+Usage:
+    python benchmarks/tools_throughput.py [--sizes 10MB 100MB 1GB 5GB] [--writer-rate 50000] [--writer-time 5]
+                                          [--output results.json]
+
+The results are printed in JSON format (and saved in the output file if it is specified).
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import statistics
+from itertools import islice
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
+
+from fortishield_qa_framework.generic_modules.tools.file_regex_checker import FileRegexChecker
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.tools.file_watcher import INOTIFY_BACKEND, POLLING_BACKEND
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+from benchmark_utils import generate_log_file, generate_log_line, parse_size
+
+
+MATCHING_LINE = '2023/02/14 23:59:59 fortishield-modulesd:aws-s3: INFO: Benchmark event found\n'
+PATTERN = r'fortishield-modulesd:aws-s3: INFO: Benchmark event found'
+MARKER_PATTERN = r'fortishield-remoted: DEBUG: Benchmark marker (\d+\.\d+)'
+# Number of batches of lines logged per second by the concurrent writer
+WRITER_BATCHES_PER_SECOND = 100
+
+
+def get_script_parameters():
+    """Process the script parameters.
+
+    Returns:
+        argparse.Namespace: Parameters and their values.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', '-s', type=str, nargs='+', default=['10MB', '100MB', '1GB'],
+                        help='Synthetic log sizes. Example: 10MB 5GB')
+    parser.add_argument('--max-callback-lines', '-c', type=int, default=1000000,
+                        help='Max number of lines to evaluate with the MonitoringObject callback')
+    parser.add_argument('--writer-rate', '-r', type=int, default=50000,
+                        help='Lines per second logged by the concurrent writer')
+    parser.add_argument('--writer-time', '-t', type=float, default=5, help='Seconds of concurrent writing')
+    parser.add_argument('--backends', '-b', nargs='+', default=[POLLING_BACKEND, INOTIFY_BACKEND],
+                        help='Wakeup backends to benchmark with the concurrent writer')
+    parser.add_argument('--output', '-o', type=str, help='File to save the JSON results')
+
+    return parser.parse_args()
+
+
+def get_peak_rss_mb():
+    """Get the peak resident set size of the current process.
+
+    Returns:
+        float: Peak RSS in MiB.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports it in KiB and macOS in bytes
+    return round(peak_rss / (1024 ** 2 if sys.platform == 'darwin' else 1024), 2)
+
+
+def run_file_regex_checker(log_file, lines, max_callback_lines, reverse=False):
+    """Search the matching line with a FileRegexChecker.
+
+    Returns:
+        float, int: Elapsed seconds and number of lines of the file (None in reverse, it only reads the last ones).
+    """
+    start_time = time.perf_counter()
+    FileRegexChecker(log_file, [rf".*{PATTERN}"], reverse=reverse)
+
+    return time.perf_counter() - start_time, None if reverse else lines
+
+
+def run_file_regex_monitor(log_file, lines, max_callback_lines, binary=False):
+    """Monitor the whole file until the matching line is found.
+
+    Returns:
+        float, int: Elapsed seconds and number of lines of the file.
+    """
+    start_time = time.perf_counter()
+    monitoring = MonitoringObject(pattern=PATTERN, timeout=3600, monitored_file=log_file)
+    FileRegexMonitor(monitoring, only_new_events=False, binary=binary)
+
+    return time.perf_counter() - start_time, lines
+
+
+def run_monitoring_object_callback(log_file, lines, max_callback_lines):
+    """Evaluate the default callback of a MonitoringObject with the first lines of the file.
+
+    Returns:
+        float, int: Elapsed seconds (not including the file reading) and number of evaluated lines.
+    """
+    # The lines are loaded in memory before, so the peak RSS of this case depends on the max number of lines
+    callback = MonitoringObject(pattern=PATTERN, monitored_file=log_file).callback
+    with open(log_file) as _file:
+        lines = list(islice(_file, max_callback_lines))
+
+    start_time = time.perf_counter()
+    for line in lines:
+        callback(line)
+
+    return time.perf_counter() - start_time, len(lines)
+
+
+CASES = {
+    'file_regex_checker': run_file_regex_checker,
+    'file_regex_checker_reverse': lambda *args: run_file_regex_checker(*args, reverse=True),
+    'file_regex_monitor_text': run_file_regex_monitor,
+    'file_regex_monitor_binary': lambda *args: run_file_regex_monitor(*args, binary=True),
+    'monitoring_object_callback': run_monitoring_object_callback
+}
+
+
+def measure_case(case, log_file, lines, max_callback_lines):
+    """Run a benchmark case and measure it. It is run in a new process.
+
+    Args:
+        case (str): Case name.
+        log_file (str): Log file path.
+        lines (int): Number of lines of the file.
+        max_callback_lines (int): Max number of lines to evaluate with the MonitoringObject callback.
+
+    Returns:
+        dict: Case results.
+    """
+    elapsed_time, processed_lines = CASES[case](log_file, lines, max_callback_lines)
+    result = {'seconds': round(elapsed_time, 4), 'peak_rss_mb': get_peak_rss_mb()}
+
+    if processed_lines is not None:
+        result['lines_per_second'] = int(processed_lines / elapsed_time)
+    if case.startswith('file_regex_monitor'):
+        result['time_to_first_match_seconds'] = result['seconds']
+
+    return result
+
+
+def benchmark_size(size, max_callback_lines):
+    """Run the cases that read a synthetic log file of the specified size.
+
+    Args:
+        size (str): Synthetic log size.
+        max_callback_lines (int): Max number of lines to evaluate with the MonitoringObject callback.
+
+    Returns:
+        dict: Benchmark results.
+    """
+    log_file = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+
+    try:
+        lines = generate_log_file(log_file, parse_size(size)) + 1
+        with open(log_file, 'a') as _file:
+            _file.write(MATCHING_LINE)
+
+        result = {'size': size, 'size_bytes': os.path.getsize(log_file), 'lines': lines}
+        for case in CASES:
+            # A new process for each case, so that the peak RSS of the previous ones is not counted
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+                result[case] = executor.submit(measure_case, case, log_file, lines, max_callback_lines).result()
+    finally:
+        os.remove(log_file)
+
+    return result
+
+
+def write_lines(log_file, rate, duration):
+    """Log lines at a fixed rate. Each batch of lines ends with a marker with the time when it is written.
+
+    Args:
+        log_file (str): Log file path.
+        rate (int): Lines per second.
+        duration (float): Seconds of writing.
+
+    Returns:
+        int: Number of written lines.
+    """
+    batch_size = max(rate // WRITER_BATCHES_PER_SECOND, 1)
+    batch = ''.join(generate_log_line(number) for number in range(batch_size - 1))
+    batches = int(duration * WRITER_BATCHES_PER_SECOND)
+    start_time = time.perf_counter()
+
+    with open(log_file, 'a') as _file:
+        for number in range(batches):
+            # Keep the rate, sleeping until the time of the next batch
+            time.sleep(max(start_time + number / WRITER_BATCHES_PER_SECOND - time.perf_counter(), 0))
+            _file.write(f"{batch}2023/02/14 23:59:59 fortishield-remoted: DEBUG: Benchmark marker "
+                        f"{time.perf_counter()}\n")
+            _file.flush()
+
+    return batches * batch_size
+
+
+def benchmark_writer(backend, rate, duration):
+    """Measure the detection latency of a monitor while a concurrent writer logs lines at a fixed rate.
+
+    Args:
+        backend (str): Wakeup backend.
+        rate (int): Lines per second logged by the writer.
+        duration (float): Seconds of writing.
+
+    Returns:
+        dict: Benchmark results.
+    """
+    log_file = tempfile.NamedTemporaryFile(suffix='.log', delete=False).name
+    marker_regex = re.compile(rf".*{MARKER_PATTERN}")
+    latencies = []
+
+    def get_latency(line):
+        match = marker_regex.match(line)
+        if match:
+            latencies.append((time.perf_counter() - float(match.group(1))) * 1000)
+        return match is not None
+
+    try:
+        monitoring = MonitoringObject(callback=get_latency, timeout=duration + 60, monitored_file=log_file)
+        monitor_parameters = {'monitoring': monitoring, 'accumulations': int(duration * WRITER_BATCHES_PER_SECOND),
+                              'only_new_events': True, 'wakeup_backend': backend}
+        monitor = Thread(target=FileRegexMonitor, parameters=monitor_parameters)
+        monitor.start()
+
+        # Let the monitor reach the end of the file before writing
+        time.sleep(0.5)
+        start_time = time.perf_counter()
+        lines = write_lines(log_file, rate, duration)
+        monitor.join()
+        elapsed_time = time.perf_counter() - start_time
+    finally:
+        os.remove(log_file)
+
+    latencies.sort()
+
+    return {
+        'backend': backend,
+        'lines': lines,
+        'lines_per_second': int(lines / elapsed_time),
+        'latency_ms': {
+            'median': round(statistics.median(latencies), 3),
+            'p99': round(latencies[int(len(latencies) * 0.99) - 1], 3),
+            'max': round(latencies[-1], 3)
+        }
+    }
+
+
+def main():
+    parameters = get_script_parameters()
+    results = {
+        'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                        'cpus': os.cpu_count()},
+        'files': [benchmark_size(size, parameters.max_callback_lines) for size in parameters.sizes],
+        'concurrent_writer': [benchmark_writer(backend, parameters.writer_rate, parameters.writer_time)
+                              for backend in parameters.backends]
+    }
+
+    json.dump(results, sys.stdout, indent=4)
+    print()
+
+    if parameters.output:
+        with open(parameters.output, 'w') as _file:
+            json.dump(results, _file, indent=4)
+
+
+if __name__ == '__main__':
+    main()
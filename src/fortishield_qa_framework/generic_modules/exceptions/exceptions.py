@@ -13,6 +13,7 @@ This module contains the following:
 - FileRegexMonitorError(QAFrameworkException)
 - TimeoutError(QAFrameworkException)
 - ElementNotFoundError(QAFrameworkException)
+- ResourceLeakError(QAFrameworkException)
 """
 
 import sys
@@ -89,3 +90,9 @@ class ElementNotFoundError(QAFrameworkException):
     """Class to manage elements not found cases."""
     def __init__(self, message, color=True, traceback=True):
         super().__init__(message, color, traceback)
+
+
+class ResourceLeakError(QAFrameworkException):
+    """Class to manage resource leak cases."""
+    def __init__(self, message, color=True, traceback=True):
+        super().__init__(message, color, traceback)
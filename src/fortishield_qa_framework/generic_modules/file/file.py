@@ -5,19 +5,54 @@ to encapsulate behaviors and avoid code redundancy, in addition to speeding up d
 This module contains the following functions:
 
 - get_file_encoding
+- is_ascii_compatible_encoding
+- read_lines
+- read_lines_reverse
+- get_file_change
+- open_file
 """
 
 import os
-import chardet
+import bz2
+import gzip
+from functools import lru_cache
+from chardet.universaldetector import UniversalDetector
 
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValueError, ValidationError
 
 
-def get_file_encoding(file_path):
+# Size of the reads done by read_lines (1 MiB)
+DEFAULT_CHUNK_SIZE = 1048576
+# Max number of bytes analyzed to detect a file encoding (1 MiB)
+DEFAULT_ENCODING_SAMPLE_SIZE = 1048576
+# Size of each piece of data fed to the encoding detector
+ENCODING_DETECTION_BLOCK_SIZE = 65536
+# Changes of an opened file detected by get_file_change
+FILE_ROTATED = 'rotated'
+FILE_TRUNCATED = 'truncated'
+FILE_REMOVED = 'removed'
+# Magic numbers of the compressed files that can be read transparently
+GZIP_MAGIC_NUMBER = b'\x1f\x8b'
+BZIP2_MAGIC_NUMBER = b'BZh'
+
+
+def get_file_encoding(file_path, sample_size=DEFAULT_ENCODING_SAMPLE_SIZE, sample_tail=True, use_cache=True):
     """Detect and return the file encoding.
 
+    Only a sample of the file is analyzed: its head and, optionally, its tail, up to sample_size bytes in total. The
+    detection stops as soon as the detector is sure about the encoding (for example, when the file starts with a BOM).
+    If only a part of the file has been analyzed and it is ASCII, utf-8 is returned, because the rest of the file could
+    contain non ASCII characters (ASCII is a subset of UTF-8). As the rest of the file could also contain bytes of
+    another encoding, the file should be decoded replacing the invalid bytes (errors='replace').
+
+    The results are cached using the file identity (path, inode, size and modification time) as key, so checking the
+    same file again does not repeat the detection unless it has changed.
+
     Args:
         file_path (str): File path to check.
+        sample_size (int): Max number of bytes to analyze. None to analyze the whole file.
+        sample_tail (boolean): True for analyzing the end of the file too (half of the sample), False otherwise.
+        use_cache (boolean): True for using the cached results, False otherwise.
 
     Returns:
         str: File encoding.
@@ -29,17 +64,217 @@ def get_file_encoding(file_path):
     if not os.path.exists(file_path) or not os.path.isfile(file_path):
         raise ValidationError(f"{file_path} was not found or is not a file.")
 
-    # Read the file as bytes
+    file_stat = os.stat(file_path)
+
+    if file_stat.st_size == 0:
+        return 'utf-8'
+
+    if use_cache:
+        return _get_cached_file_encoding(os.path.realpath(file_path), file_stat.st_ino, file_stat.st_size,
+                                         file_stat.st_mtime_ns, sample_size, sample_tail)
+
+    return _detect_file_encoding(file_path, file_stat.st_size, sample_size, sample_tail)
+
+
+def _detect_file_encoding(file_path, file_size, sample_size, sample_tail):
+    """Detect the file encoding feeding its head and tail samples to an incremental detector.
+
+    Args:
+        file_path (str): File path to check.
+        file_size (int): File size.
+        sample_size (int): Max number of bytes to analyze. None to analyze the whole file.
+        sample_tail (boolean): True for analyzing the end of the file too (half of the sample), False otherwise.
+
+    Returns:
+        str: File encoding.
+
+    Raises:
+        ValueError: If could not detect the file encoding.
+    """
+    if sample_size is None or sample_size >= file_size:
+        head_size, tail_size = file_size, 0
+    elif sample_tail:
+        head_size = sample_size // 2
+        tail_size = sample_size - head_size
+    else:
+        head_size, tail_size = sample_size, 0
+
+    detector = UniversalDetector()
+
     with open(file_path, 'rb') as _file:
-        data = _file.read()
+        while head_size > 0 and not detector.done:
+            data = _file.read(min(ENCODING_DETECTION_BLOCK_SIZE, head_size))
+            if not data:
+                break
+            detector.feed(data)
+            head_size -= len(data)
 
-    # Detect the content encoding
-    encoding = chardet.detect(data)['encoding']
+        if tail_size > 0 and not detector.done:
+            _file.seek(file_size - tail_size)
+            data = _file.read(tail_size)
+            # Start from a line beginning, so that the detector does not receive a split character
+            data = data[data.find(b'\n') + 1:]
+            for index in range(0, len(data), ENCODING_DETECTION_BLOCK_SIZE):
+                if detector.done:
+                    break
+                detector.feed(data[index:index + ENCODING_DETECTION_BLOCK_SIZE])
 
-    if len(data) == 0:
-        return 'utf-8'
+    encoding = detector.close()['encoding']
 
     if encoding is None:
         raise ValueError(f"Could not detect the {file_path} encoding")
 
+    # The part of the file that has not been analyzed could contain UTF-8 characters
+    if encoding == 'ascii' and sample_size is not None and sample_size < file_size:
+        return 'utf-8'
+
     return encoding
+
+
+@lru_cache(maxsize=256)
+def _get_cached_file_encoding(file_path, inode, file_size, modification_time, sample_size, sample_tail):
+    """Detect the file encoding caching the result by file identity.
+
+    The inode, size and modification time args are not used in the detection, they are part of the cache key.
+
+    Returns:
+        str: File encoding.
+    """
+    return _detect_file_encoding(file_path, file_size, sample_size, sample_tail)
+
+
+def is_ascii_compatible_encoding(encoding):
+    """Check if an encoding represents the ASCII characters (including line breaks) as single ASCII bytes.
+
+    The content of files with these encodings can be split into lines and matched with bytes regex without decoding it.
+
+    Args:
+        encoding (str): Encoding name.
+
+    Returns:
+        boolean: True if the encoding is ASCII compatible, False otherwise.
+    """
+    try:
+        return '\n\r.azAZ09'.encode(encoding) == b'\n\r.azAZ09'
+    except LookupError:
+        return False
+
+
+def read_lines(file_object, chunk_size=DEFAULT_CHUNK_SIZE, required=None):
+    """Read the available lines of a binary file object using large reads.
+
+    The lines are split in bulk from each read, instead of reading them one by one. The last line is yielded even if it
+    is not complete (it has not line break) because there is no more available data, like readline does.
+
+    If a required substring is given, the blocks of lines that do not contain it are skipped without splitting them.
+    This allows to discard most of the file content with a fast substring search when looking for specific lines.
+
+    Args:
+        file_object (io.BufferedReader): File object opened in binary mode.
+        chunk_size (int): Number of bytes of each read.
+        required (bytes): Substring that the yielded lines must contain. Some lines without it could also be yielded.
+
+    Yields:
+        bytes: File line, including the line break.
+    """
+    remainder = b''
+    while True:
+        chunk = file_object.read(chunk_size)
+        if not chunk:
+            break
+
+        data = remainder + chunk if remainder else chunk
+        # The last line could continue in the next chunk, so it is kept until the next read
+        lines_end = data.rfind(b'\n') + 1
+        block, remainder = data[:lines_end], data[lines_end:]
+
+        if block and (required is None or required in block):
+            yield from block.splitlines(keepends=True)
+
+    if remainder and (required is None or required in remainder):
+        yield from remainder.splitlines(keepends=True)
+
+
+def read_lines_reverse(file_object, block_size=DEFAULT_CHUNK_SIZE):
+    """Read the lines of a binary file object from its end to its beginning using large reads.
+
+    The file is read backwards in blocks aligned to the block size. The first line of each block could start in the
+    previous one, so it is kept and joined to the end of the previous block when it is read.
+
+    Args:
+        file_object (io.BufferedReader): Seekable file object opened in binary mode.
+        block_size (int): Number of bytes of each read.
+
+    Yields:
+        bytes: File line, including the line break, from the last one to the first one.
+    """
+    block_end = file_object.seek(0, 2)
+    # The first read goes from the last aligned position to the end of the file, the next ones are whole blocks
+    block_start = (block_end - 1) // block_size * block_size if block_end else 0
+    remainder = b''
+
+    while block_end > 0:
+        file_object.seek(block_start)
+        block = file_object.read(block_end - block_start)
+        lines = (block + remainder).splitlines(keepends=True)
+
+        # The first line is complete only at the beginning of the file
+        remainder = lines.pop(0) if block_start > 0 and lines else b''
+        yield from reversed(lines)
+
+        block_end = block_start
+        block_start = max(block_start - block_size, 0)
+
+
+def get_file_change(file_object, file_path, position):
+    """Check if an opened file has been rotated, truncated or removed.
+
+    The file is rotated when its path refers to a different file (for example, it has been renamed and a new one has
+    been created in its place), and it is truncated when it is smaller than the reached position.
+
+    Args:
+        file_object (file): Opened file.
+        file_path (str): Path of the opened file.
+        position (int): Offset of the next byte to read from the opened file.
+
+    Returns:
+        str: Detected change. Enum: [rotated, truncated, removed]. None if the file has not changed.
+    """
+    try:
+        path_status = os.stat(file_path)
+    except FileNotFoundError:
+        # The file could have been renamed and the new one has not been created yet
+        return FILE_REMOVED
+
+    file_status = os.fstat(file_object.fileno())
+
+    if (path_status.st_dev, path_status.st_ino) != (file_status.st_dev, file_status.st_ino):
+        return FILE_ROTATED
+
+    if file_status.st_size < position:
+        return FILE_TRUNCATED
+
+    return None
+
+
+def open_file(file_path):
+    """Open a file in binary mode, decompressing it transparently if it is a gzip or bzip2 file.
+
+    The compression is detected from the magic number at the beginning of the file, not from its extension.
+
+    Args:
+        file_path (str): File path.
+
+    Returns:
+        file: File object opened in binary mode, which returns the decompressed content.
+    """
+    with open(file_path, 'rb') as _file:
+        magic_number = _file.read(len(BZIP2_MAGIC_NUMBER))
+
+    if magic_number.startswith(GZIP_MAGIC_NUMBER):
+        return gzip.open(file_path, 'rb')
+
+    if magic_number.startswith(BZIP2_MAGIC_NUMBER):
+        return bz2.open(file_path, 'rb')
+
+    return open(file_path, 'rb')
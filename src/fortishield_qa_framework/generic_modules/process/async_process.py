@@ -0,0 +1,258 @@
+"""
+Module to build an asyncio tool that allow us to run local commands and process the output in a custom way, without
+blocking the event loop.
+
+Unlike the Process class, the processes are created with the asyncio subprocess API, so many processes can be run and
+waited concurrently in the same event loop without a thread for each one. Their stdout can also be consumed line by line
+while they are running.
+
+If a process exceeds its timeout while it is awaited, it is killed (with its children) and subprocess.TimeoutExpired is
+raised, as the Process class does.
+
+This module contains the following:
+
+- AsyncProcess:
+    - start
+    - run
+    - wait
+    - iter_stdout
+    - get_stdout
+    - get_stderr
+    - get_status
+    - get_pid
+    - kill
+    - get_return_code
+- AsyncLinuxProcess(AsyncProcess)
+"""
+
+import asyncio
+import subprocess
+import psutil
+
+from fortishield_qa_framework.generic_modules.process.linux_process import get_linux_command
+
+
+class AsyncProcess:
+    """Class to run processes from an asyncio event loop.
+
+    Args:
+        command (str or list(str)): Command (string or splitted in list) to run.
+        capture_stdout (boolean): True for capturing the process stdout, False otherwise.
+        capture_stderr (boolean): True for capturing the process stderr, False otherwise.
+        timeout (int): Num seconds to wait until the process is finished. If it's exceeded, the process is killed and
+            an exception will be generated.
+
+    Attributes:
+        command (str or list(str)): Command (string or splitted in list) to run.
+        capture_stdout (boolean): True for capturing the process stdout, False otherwise.
+        capture_stderr (boolean): True for capturing the process stderr, False otherwise.
+        stdout (str): Process stdout if captured with capture_stdout=True (and not consumed with iter_stdout).
+        stderr (str): Process stderr if captured with capture_stderr=True.
+        timeout (int): Num seconds to wait until the process is finished.
+        process (asyncio.subprocess.Process): Process object.
+        return_code (int): Process return code, once it has finished.
+    """
+    def __init__(self, command, capture_stdout=False, capture_stderr=False, timeout=None):
+        self.command = command
+        self.shell = True if isinstance(command, str) else False
+        self.capture_stdout = capture_stdout
+        self.capture_stderr = capture_stderr
+        self.stdout = None
+        self.stderr = None
+        self.timeout = timeout
+        self.process = None
+        self.return_code = None
+        self.__output_collected = False
+
+    async def start(self):
+        """Start the process without waiting until it is finished."""
+        args = {
+            'stdout': asyncio.subprocess.PIPE if self.capture_stdout else None,
+            'stderr': asyncio.subprocess.PIPE if self.capture_stderr else None
+        }
+
+        if self.shell:
+            self.process = await asyncio.create_subprocess_shell(self.command, **args)
+        else:
+            self.process = await asyncio.create_subprocess_exec(*self.command, **args)
+
+    async def run(self):
+        """Run the process and wait until it is finished, capturing its output if it is set.
+
+        Raises:
+            subprocess.TimeoutExpired: If the process time taken is greater than the timeout set.
+        """
+        await self.start()
+        await self.wait()
+
+    async def wait(self):
+        """Wait until the process is finished, capturing its output if it is set and it has not been consumed.
+
+        Returns:
+            int: Process return code.
+
+        Raises:
+            subprocess.TimeoutExpired: If the process time taken is greater than the timeout set.
+        """
+        try:
+            if (self.capture_stdout or self.capture_stderr) and not self.__output_collected:
+                stdout, stderr = await asyncio.wait_for(self.process.communicate(), self.timeout)
+                self.stdout = stdout.decode() if type(stdout) is bytes else stdout
+                self.stderr = stderr.decode() if type(stderr) is bytes else stderr
+                self.__output_collected = True
+
+            self.return_code = await asyncio.wait_for(self.process.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            await self.__kill_process_tree()
+            raise subprocess.TimeoutExpired(self.command, self.timeout)
+
+        return self.return_code
+
+    async def iter_stdout(self):
+        """Iterate over the stdout lines while the process is running, until it is finished.
+
+        The process must have been started with capture_stdout=True. The stderr is captured meanwhile (if it is set).
+        If the iteration is stopped before the process has finished, the process is killed when the iterator is closed
+        (call its aclose method to do it right away).
+
+        Yields:
+            str: Process stdout line.
+
+        Raises:
+            subprocess.TimeoutExpired: If the process time taken is greater than the timeout set.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        # The stderr is read meanwhile, so that the process does not get blocked when its pipe is full
+        stderr_task = asyncio.ensure_future(self.process.stderr.read()) if self.capture_stderr else None
+        self.__output_collected = True
+
+        try:
+            while True:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                line = await asyncio.wait_for(self.__read_line(), timeout)
+                if not line:
+                    break
+                yield line.decode()
+
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            if stderr_task is not None:
+                self.stderr = (await asyncio.wait_for(stderr_task, timeout)).decode()
+
+            timeout = None if deadline is None else max(deadline - loop.time(), 0)
+            self.return_code = await asyncio.wait_for(self.process.wait(), timeout)
+        except asyncio.TimeoutError:
+            await self.__kill_process_tree()
+            raise subprocess.TimeoutExpired(self.command, self.timeout)
+        finally:
+            if stderr_task is not None and not stderr_task.done():
+                stderr_task.cancel()
+            # The iteration has been stopped before the process has finished
+            if self.process.returncode is None:
+                await self.__kill_process_tree()
+
+    async def __read_line(self):
+        """Read a stdout line, even if it is longer than the stream buffer limit.
+
+        Returns:
+            bytes: Line, or an empty bytes object if the stdout has finished.
+        """
+        chunks = []
+
+        while True:
+            try:
+                chunks.append(await self.process.stdout.readuntil(b'\n'))
+                break
+            except asyncio.IncompleteReadError as error:
+                # Last line without line break
+                chunks.append(error.partial)
+                break
+            except asyncio.LimitOverrunError as error:
+                # The line does not fit in the buffer, so it is read in chunks
+                chunks.append(await self.process.stdout.readexactly(error.consumed))
+
+        return b''.join(chunks)
+
+    async def __kill_process_tree(self):
+        """Kill the process and all its children (for example, the commands launched by a shell) and wait for it."""
+        try:
+            children = psutil.Process(self.process.pid).children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+
+        self.kill()
+        for child in children:
+            try:
+                child.kill()
+            except psutil.NoSuchProcess:
+                pass
+
+        self.return_code = await self.process.wait()
+
+    def get_stdout(self):
+        """Get process stdout.
+
+        Returns:
+            str: Process stdout.
+        """
+        return self.stdout
+
+    def get_stderr(self):
+        """Get process stderr.
+
+        Returns:
+            str: Process stderr.
+        """
+        return self.stderr
+
+    def get_status(self):
+        """Get process status.
+
+        Returns:
+            str: Process status.
+        """
+        if self.process.returncode is not None:
+            return psutil.STATUS_DEAD
+
+        try:
+            return psutil.Process(self.process.pid).status()
+        except psutil.NoSuchProcess:
+            return psutil.STATUS_DEAD
+
+    def get_pid(self):
+        """Get process PID.
+
+        Returns:
+            int: Process PID.
+        """
+        return self.process.pid
+
+    def kill(self):
+        """Kill the process if it exists"""
+        try:
+            self.process.kill()
+        except ProcessLookupError:
+            pass
+
+    def get_return_code(self):
+        """Get the process return code.
+
+        Returns:
+            int: Process return code.
+        """
+        return self.return_code
+
+
+class AsyncLinuxProcess(AsyncProcess):
+    """Class to run Linux commands using bash from an asyncio event loop.
+
+    Args:
+        command (str or list(str)): Command (string or splitted in list) to run.
+        capture_stdout (boolean): True for capturing the process stdout, False otherwise.
+        capture_stderr (boolean): True for capturing the process stderr, False otherwise.
+        timeout (int): Num seconds to wait until the process is finished. If it's exceeded, the process is killed and
+            an exception will be generated.
+    """
+    def __init__(self, command, capture_stdout=False, capture_stderr=False, timeout=None):
+        super().__init__(command=get_linux_command(command), capture_stdout=capture_stdout,
+                         capture_stderr=capture_stderr, timeout=timeout)
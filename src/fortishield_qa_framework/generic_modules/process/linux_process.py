@@ -1,5 +1,13 @@
 """
 Module to build a tool that allow us to run local Linux commands using bash and process the output in a custom way.
+
+To avoid spawning shells that are not needed, the commands are executed directly when it is possible:
+
+- The list commands are executed directly, without shell.
+- The string commands that do not use shell features (pipes, redirections, variables, globs, builtins...) are split
+  as the shell would do and executed directly.
+- The rest of string commands are run with a single bash process.
+
 It contains the following:
 
 - LinuxProcess(Process):
@@ -10,14 +18,69 @@ It contains the following:
     - get_pid
     - kill
     - get_return_code
+- get_linux_command
 """
 
+import os
+import shlex
+import shutil
+from functools import lru_cache
+
 from fortishield_qa_framework.generic_modules.process.process import Process
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
 
 
+# Characters with a special meaning for the shell. The quotes are not included because shlex handles them
+SHELL_CHARACTERS = frozenset('|&;<>()$`\\*?[]#~{}!\n')
+
+
+@lru_cache(maxsize=1024)
+def _find_executable(name, path):
+    """Find the path of an executable, caching the result.
+
+    Args:
+        name (str): Executable name.
+        path (str): PATH environment variable value, so that the cache is not valid if it changes.
+
+    Returns:
+        str: Executable path, or None if it is not found.
+    """
+    return shutil.which(name, path=path)
+
+
+def get_linux_command(command):
+    """Build the arguments to run a Linux command, executing it directly when it does not need a shell.
+
+    Args:
+        command (str or list(str)): Command (string or splitted in list) to run.
+
+    Returns:
+        list(str): Arguments to execute (without shell).
+
+    Raises:
+        ValidationError: If the command is not a string or a list.
+    """
+    if type(command) is list:
+        return command
+
+    if type(command) is not str:
+        raise ValidationError('The type of command variable is not the expected one. Allowed list or string')
+
+    if not SHELL_CHARACTERS.intersection(command):
+        try:
+            arguments = shlex.split(command)
+        except ValueError:
+            arguments = None
+
+        # Variable assignments, builtins and keywords need a shell, as well as the commands that are not found
+        if arguments and '=' not in arguments[0] and _find_executable(arguments[0], os.environ.get('PATH')):
+            return arguments
+
+    return ['/bin/bash', '-c', command]
+
+
 class LinuxProcess(Process):
-    """Class to run processes.
+    """Class to run processes. The commands that need a shell are run with bash, and the rest are executed directly.
 
     Args:
         command (str or list(str)): Command (string or splitted in list) to run.
@@ -38,12 +101,5 @@ class LinuxProcess(Process):
         process (psutil.Process): Process object.
     """
     def __init__(self, command, capture_stdout=False, capture_stderr=False, wait=False, timeout=None):
-        if type(command) is list:
-            linux_command = ['/bin/bash', '-c'] + command
-        elif type(command) is str:
-            linux_command = f"/bin/bash -c \"{command}\""
-        else:
-            raise ValidationError('The type of command variable is not the expected one. Allowed list or string')
-
-        super().__init__(command=linux_command, capture_stdout=capture_stdout, capture_stderr=capture_stderr, wait=wait,
-                         timeout=timeout)
+        super().__init__(command=get_linux_command(command), capture_stdout=capture_stdout,
+                         capture_stderr=capture_stderr, wait=wait, timeout=timeout)
@@ -0,0 +1,127 @@
+"""
+Module to build a tool that measures the CPU usage of a process without blocking.
+
+Instead of measuring the CPU usage during an interval (sleeping meanwhile), the tracker stores the CPU times of the
+process and its threads in each measure (or when it is reset), and each measure is computed from the CPU times used
+since the previous one. So the measures do not block, and their accuracy depends on the time between them. The first
+measure of a tracker that has not been reset is 0.
+
+The CPU time of the process can be passed to the measure if it has already been read (for example, with the rest of the
+process metrics in a single psutil oneshot), so that the tracker does not read it again.
+
+This module contains the following:
+
+- CpuTracker:
+    - reset
+    - get_cpu_usage
+    - get_threads_cpu_usage
+"""
+
+import time
+
+
+def _get_usage_percentage(cpu_time, last_cpu_time, elapsed_time):
+    """Get the CPU usage percentage from the CPU time used during some time.
+
+    Args:
+        cpu_time (float): Current CPU time, in seconds.
+        last_cpu_time (float): CPU time at the beginning of the measure, in seconds.
+        elapsed_time (float): Seconds since the beginning of the measure.
+
+    Returns:
+        float: CPU usage percentage. It can be greater than 100 if several CPUs are used.
+    """
+    return (cpu_time - last_cpu_time) / elapsed_time * 100 if elapsed_time > 0 else 0.0
+
+
+class CpuTracker:
+    """Class to measure the CPU usage of a process and its threads since the previous measure.
+
+    Args:
+        process (psutil.Process): Process object.
+
+    Attributes:
+        process (psutil.Process): Process object.
+    """
+    def __init__(self, process):
+        self.process = process
+        self.__last_cpu_time = None
+        self.__last_time = None
+        self.__last_threads_cpu_times = None
+        self.__last_threads_time = None
+
+    def __get_cpu_time(self):
+        """Get the CPU time (user and system) used by the process.
+
+        Returns:
+            float: CPU time in seconds.
+        """
+        cpu_times = self.process.cpu_times()
+
+        return cpu_times.user + cpu_times.system
+
+    def __get_threads_cpu_times(self):
+        """Get the CPU time (user and system) used by each thread of the process.
+
+        Returns:
+            dict: CPU time in seconds of each thread ID.
+        """
+        return {thread.id: thread.user_time + thread.system_time for thread in self.process.threads()}
+
+    def reset(self):
+        """Start the next measures from the current CPU times of the process and its threads.
+
+        Raises:
+            psutil.AccessDenied: If there are not enough permissions to get the CPU times of the process.
+        """
+        # Each baseline is only set if it has been read
+        self.__last_cpu_time = self.__get_cpu_time()
+        self.__last_time = time.monotonic()
+        self.__last_threads_cpu_times = self.__get_threads_cpu_times()
+        self.__last_threads_time = time.monotonic()
+
+    def get_cpu_usage(self, cpu_time=None):
+        """Get the CPU usage percentage of the process since the previous measure (or the tracker reset).
+
+        Args:
+            cpu_time (float): Current CPU time (user and system) of the process in seconds, if it has already been read.
+                None to read it.
+
+        Returns:
+            float: CPU usage percentage. It can be greater than 100 if several CPUs are used.
+        """
+        current_time = time.monotonic()
+        cpu_time = self.__get_cpu_time() if cpu_time is None else cpu_time
+        cpu_usage = 0.0 if self.__last_time is None else \
+            _get_usage_percentage(cpu_time, self.__last_cpu_time, current_time - self.__last_time)
+
+        self.__last_time = current_time
+        self.__last_cpu_time = cpu_time
+
+        return cpu_usage
+
+    def get_threads_cpu_usage(self):
+        """Get the CPU usage percentage of each thread of the process since the previous measure (or the tracker
+        reset).
+
+        The threads started after the previous measure are measured since they started, and the finished ones are not
+        included.
+
+        Returns:
+            dict: CPU usage percentage of each thread ID.
+        """
+        current_time = time.monotonic()
+        threads_cpu_times = self.__get_threads_cpu_times()
+        if self.__last_threads_time is None:
+            threads_cpu_usage = dict.fromkeys(threads_cpu_times, 0.0)
+        else:
+            elapsed_time = current_time - self.__last_threads_time
+            threads_cpu_usage = {thread_id: _get_usage_percentage(cpu_time,
+                                                                  self.__last_threads_cpu_times.get(thread_id, 0),
+                                                                  elapsed_time)
+                                 for thread_id, cpu_time in threads_cpu_times.items()}
+
+        self.__last_threads_time = current_time
+        self.__last_threads_cpu_times = threads_cpu_times
+
+        return threads_cpu_usage
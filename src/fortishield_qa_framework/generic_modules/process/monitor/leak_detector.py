@@ -0,0 +1,253 @@
+"""
+Module to build a tool that detects resource leaks in long-running processes.
+
+The process is sampled at a fixed rate in background (or manually) and, for each resource (RSS memory, file descriptors
+and threads), a linear regression of its value over time is fitted. The regression is updated with each sample in
+constant time and memory, so the process can be sampled during hours without storing the samples.
+
+A resource is leaking if its growth slope exceeds its budget (units per second) and the slope is statistically
+significant: its t-statistic (slope divided by its standard error) must reach a minimum, so that the noise of a stable
+process is not reported as a leak. At least MIN_SAMPLES samples of a resource are needed to report it as leaking.
+
+If the background sampling fails (for example, without permissions to read the process resources), the error is
+raised when the detector is stopped or checked, so that it can not go unnoticed.
+
+This module contains the following:
+
+- StreamingLinearRegression:
+    - add
+    - get_slope
+    - get_t_statistic
+- LeakDetector:
+    - start
+    - stop
+    - sample
+    - get_slopes
+    - get_leaks
+    - get_undersampled_metrics
+    - check
+"""
+
+import math
+import time
+import threading
+
+import psutil
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError, ResourceLeakError
+
+
+RSS = 'rss'
+NUM_FDS = 'num_fds'
+NUM_THREADS = 'num_threads'
+LEAK_METRICS = [RSS, NUM_FDS, NUM_THREADS]
+# Min number of samples needed to know if a slope is significant
+MIN_SAMPLES = 3
+# A stable resource reaches a t-statistic of 3 by chance in about 0.1% of the checks with many samples (more with few)
+DEFAULT_MIN_T_STATISTIC = 3
+
+
+class StreamingLinearRegression:
+    """Class to fit a least squares line to some points, adding them one by one in constant memory.
+
+    The means and the sums of squares are updated incrementally (Welford's method), so the result is numerically
+    stable even with large values, such as memory sizes.
+
+    Attributes:
+        samples (int): Number of points added.
+    """
+    def __init__(self):
+        self.samples = 0
+        self.__mean_x = 0.0
+        self.__mean_y = 0.0
+        self.__sum_xx = 0.0
+        self.__sum_xy = 0.0
+        self.__sum_yy = 0.0
+
+    def add(self, x, y):
+        """Add a point to the regression.
+
+        Args:
+            x (float): Independent value (for example, the time).
+            y (float): Dependent value (for example, the memory used).
+        """
+        self.samples += 1
+        delta_x = x - self.__mean_x
+        delta_y = y - self.__mean_y
+        self.__mean_x += delta_x / self.samples
+        self.__mean_y += delta_y / self.samples
+        self.__sum_xx += delta_x * (x - self.__mean_x)
+        self.__sum_xy += delta_x * (y - self.__mean_y)
+        self.__sum_yy += delta_y * (y - self.__mean_y)
+
+    def get_slope(self):
+        """Get the slope of the regression line.
+
+        Returns:
+            float: Slope, or 0 if there are not enough points to fit a line.
+        """
+        return self.__sum_xy / self.__sum_xx if self.__sum_xx > 0 else 0.0
+
+    def get_t_statistic(self):
+        """Get the t-statistic of the slope, that is, the slope divided by its standard error.
+
+        The greater its absolute value, the less likely is that the slope is caused by noise.
+
+        Returns:
+            float: Slope t-statistic. It is infinite if the points fit the line exactly, and 0 if there are less than 3
+                points.
+        """
+        slope = self.get_slope()
+        if self.samples < MIN_SAMPLES or slope == 0:
+            return 0.0
+
+        # The residual sum of squares can be slightly negative due to rounding errors
+        residual_sum = max(self.__sum_yy - slope * self.__sum_xy, 0.0)
+        standard_error = math.sqrt(residual_sum / (self.samples - 2) / self.__sum_xx)
+
+        return slope / standard_error if standard_error > 0 else math.copysign(math.inf, slope)
+
+
+class LeakDetector:
+    """Class to detect resource leaks in a process, from the growth of its resources over time.
+
+    Args:
+        process_monitor (ProcessMonitor): Monitor of the process to check.
+        budgets (dict): Max growth allowed for each resource, in units per second (bytes for rss). Enum keys: [rss,
+            num_fds, num_threads]. By default, any significant growth is a leak.
+        interval (float): Seconds between two consecutive samples when sampling in background.
+        min_t_statistic (float): Min t-statistic of a growth slope to be significant.
+
+    Attributes:
+        process_monitor (ProcessMonitor): Monitor of the process to check.
+        budgets (dict): Max growth allowed for each resource, in units per second.
+        interval (float): Seconds between two consecutive samples when sampling in background.
+        min_t_statistic (float): Min t-statistic of a growth slope to be significant.
+        regressions (dict): Regression (StreamingLinearRegression) of each resource over time.
+    """
+    def __init__(self, process_monitor, budgets=None, interval=1, min_t_statistic=DEFAULT_MIN_T_STATISTIC):
+        budgets = budgets if budgets else {}
+        invalid_metrics = set(budgets) - set(LEAK_METRICS)
+
+        if invalid_metrics:
+            raise ValidationError(f"Metrics {sorted(invalid_metrics)} are not valid. Accepted ones: {LEAK_METRICS}")
+
+        if interval <= 0:
+            raise ValidationError('The sampling interval must be greater than 0')
+
+        self.process_monitor = process_monitor
+        self.budgets = {metric: budgets.get(metric, 0) for metric in LEAK_METRICS}
+        self.interval = interval
+        self.min_t_statistic = min_t_statistic
+        self.regressions = {metric: StreamingLinearRegression() for metric in LEAK_METRICS}
+        self.__start_timestamp = None
+        self.__stop = threading.Event()
+        self.__thread = None
+        self.__exception = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start sampling the process in background."""
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop sampling the process, waiting for the background thread to finish.
+
+        Raises:
+            Exception: The error that stopped the background sampling, if any.
+        """
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+        self.__raise_sampling_error()
+
+    def __raise_sampling_error(self):
+        """Raise the error that stopped the background sampling, if any, only once."""
+        if self.__exception is not None:
+            exception, self.__exception = self.__exception, None
+            raise exception
+
+    def __run(self):
+        """Sample the process at a fixed rate until the detector is stopped or the process finishes."""
+        next_time = time.monotonic()
+
+        while not self.__stop.is_set():
+            try:
+                self.sample()
+            except psutil.NoSuchProcess:
+                return
+            except Exception as exception:
+                self.__exception = exception
+                return
+
+            next_time += self.interval
+            self.__stop.wait(max(next_time - time.monotonic(), 0))
+
+    def sample(self):
+        """Take a sample of the process resources and add it to the regressions.
+
+        The resources that can not be read (for example, the file descriptors without permissions) are not added.
+
+        Raises:
+            psutil.NoSuchProcess: If the process does not exist anymore.
+        """
+        metrics = self.process_monitor.get_metrics()
+
+        if self.__start_timestamp is None:
+            self.__start_timestamp = metrics.timestamp
+
+        elapsed_time = metrics.timestamp - self.__start_timestamp
+        for metric in LEAK_METRICS:
+            if getattr(metrics, metric) is not None:
+                self.regressions[metric].add(elapsed_time, getattr(metrics, metric))
+
+    def get_slopes(self):
+        """Get the growth slope of each resource.
+
+        Returns:
+            dict: Growth of each resource, in units per second.
+        """
+        return {metric: regression.get_slope() for metric, regression in self.regressions.items()}
+
+    def get_leaks(self):
+        """Get the resources whose growth is significant and exceeds their budget.
+
+        Returns:
+            dict: Growth of each leaking resource, in units per second.
+        """
+        return {metric: regression.get_slope() for metric, regression in self.regressions.items()
+                if regression.get_slope() > self.budgets[metric] and
+                regression.get_t_statistic() >= self.min_t_statistic}
+
+    def get_undersampled_metrics(self):
+        """Get the resources without enough samples to know if they are leaking.
+
+        Returns:
+            list(str): Names of the resources with less than MIN_SAMPLES samples.
+        """
+        return [metric for metric, regression in self.regressions.items() if regression.samples < MIN_SAMPLES]
+
+    def check(self):
+        """Check that no resource is leaking.
+
+        Raises:
+            Exception: The error that stopped the background sampling, if any.
+            ResourceLeakError: If any resource is leaking.
+        """
+        self.__raise_sampling_error()
+        leaks = self.get_leaks()
+
+        if leaks:
+            leaks_description = ', '.join(f"{metric} grows {slope:.3f}/s (budget {self.budgets[metric]}/s)"
+                                          for metric, slope in leaks.items())
+            raise ResourceLeakError(f"Process {self.process_monitor.pid} is leaking resources: {leaks_description}")
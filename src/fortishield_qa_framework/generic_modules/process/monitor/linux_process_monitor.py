@@ -51,7 +51,7 @@ class LinuxProcessMonitor(ProcessMonitor):
         if unit not in units:
             raise ValidationError(f"unit parameters is not valid. Accepted ones: {units.keys()}")
 
-        return f"{int(self.process.memory_info()[0] / units[unit])}{unit}"
+        return f"{int(self.process.memory_info().rss / units[unit])}{unit}"
 
     def get_memory_usage_percentage(self):
         """Get the memory usage percentage of monitored process.
@@ -62,12 +62,12 @@ class LinuxProcessMonitor(ProcessMonitor):
         return f"{round(self.process.memory_percent(), 3)}%"
 
     def get_total_cpu_usage(self):
-        """Get the total cpu usage percentage of monitored process.
+        """Get the total cpu usage percentage of monitored process, since the previous call (or the monitor creation).
 
         Returns:
-            str: Process total cpu usage percentage. Example: 5%
+            str: Process total cpu usage percentage. Example: 5.0%
         """
-        return f"{self.process.cpu_percent(interval=0.1)}%"
+        return f"{round(self.get_cpu_usage(), 1)}%"
 
     def get_num_file_descriptors(self):
         """Get the number of file descriptors opened by the monitored process.
@@ -0,0 +1,132 @@
+"""
+Module to build a tool that monitors the resources used by many processes at once, for example all the Fortishield
+daemons (global_variables.daemons.FORTISHIELD_MANAGER_DAEMONS).
+
+The process names are resolved to PIDs once, with a single pass over the running processes, instead of looking for each
+one separately. A name can match several processes (for example, a daemon with worker processes). Then, each snapshot
+reads all the metrics of each process in a single psutil oneshot, and the CPU usage is computed from the CPU times of
+consecutive snapshots by a CpuTracker per process, so taking a snapshot does not block.
+
+Each snapshot is returned in columns: a list per metric with a value per process, in the same order as the names and
+PIDs columns.
+
+This module contains the following:
+
+- ProcessesSnapshot
+- MultiProcessMonitor:
+    - resolve_pids
+    - get_pids
+    - get_snapshot
+"""
+
+import os
+import time
+from collections import namedtuple
+
+import psutil
+
+from fortishield_qa_framework.generic_modules.process.monitor.process_monitor import get_process_metrics
+from fortishield_qa_framework.generic_modules.process.monitor.cpu_tracker import CpuTracker
+
+
+ProcessesSnapshot = namedtuple('ProcessesSnapshot', ['timestamp', 'names', 'pids', 'rss', 'vms', 'cpu_percent',
+                                                     'num_fds', 'num_threads'])
+
+
+def _get_process_names(process_info):
+    """Get the names that a process can be identified by.
+
+    Besides the process name, the executable and script names of its command line are taken into account, so that the
+    daemons run by an interpreter (for example, a Python script) can be found too.
+
+    Args:
+        process_info (dict): Process name and cmdline, as returned by psutil.process_iter.
+
+    Returns:
+        set(str): Process names.
+    """
+    names = {process_info['name']}
+
+    for argument in (process_info['cmdline'] or [])[:2]:
+        names.add(os.path.splitext(os.path.basename(argument))[0])
+
+    return names
+
+
+class MultiProcessMonitor:
+    """Class to get data from many processes at once.
+
+    Args:
+        process_names (list(str)): Names of the processes to monitor.
+
+    Attributes:
+        process_names (list(str)): Names of the processes to monitor.
+        processes (dict): Monitored processes (list of psutil.Process) of each name. Empty if it is not running.
+    """
+    def __init__(self, process_names):
+        self.process_names = process_names
+        self.processes = {}
+        self.__cpu_trackers = {}
+
+        self.resolve_pids()
+
+    def resolve_pids(self):
+        """Look for the running processes of each name, in a single pass over all the running processes."""
+        self.processes = {name: [] for name in self.process_names}
+
+        for process in psutil.process_iter(['name', 'cmdline']):
+            for name in _get_process_names(process.info) & self.processes.keys():
+                self.processes[name].append(process)
+
+        self.__cpu_trackers = {}
+
+    def get_pids(self):
+        """Get the PIDs of the monitored processes.
+
+        Returns:
+            dict: List of PIDs of each process name.
+        """
+        return {name: [process.pid for process in processes] for name, processes in self.processes.items()}
+
+    def get_snapshot(self):
+        """Get the resources used by all the monitored processes.
+
+        The processes that have finished are not monitored anymore. The CPU usage is the one since the last snapshot,
+        so it is 0 in the first one. The number of file descriptors is None for the processes that can not be accessed
+        with the current permissions.
+
+        Returns:
+            ProcessesSnapshot: Snapshot with a list of values per metric, with a value per process.
+
+        Raises:
+            psutil.AccessDenied: If there are not enough permissions to get data from a process.
+        """
+        columns = {field: [] for field in ProcessesSnapshot._fields if field != 'timestamp'}
+        cpu_trackers = {}
+        cpu_percents = {}
+        timestamp = time.time()
+
+        for name, processes in self.processes.items():
+            for process in list(processes):
+                try:
+                    metrics = get_process_metrics(process)
+                except psutil.NoSuchProcess:
+                    processes.remove(process)
+                    continue
+
+                # A process can be monitored with several names, but its CPU usage is measured once per snapshot
+                if process.pid not in cpu_percents:
+                    cpu_trackers[process.pid] = self.__cpu_trackers.get(process.pid) or CpuTracker(process)
+                    cpu_percents[process.pid] = cpu_trackers[process.pid].get_cpu_usage(cpu_time=metrics.cpu_time)
+
+                columns['names'].append(name)
+                columns['pids'].append(process.pid)
+                columns['rss'].append(metrics.rss)
+                columns['vms'].append(metrics.vms)
+                columns['cpu_percent'].append(cpu_percents[process.pid])
+                columns['num_fds'].append(metrics.num_fds)
+                columns['num_threads'].append(metrics.num_threads)
+
+        self.__cpu_trackers = cpu_trackers
+
+        return ProcessesSnapshot(timestamp=timestamp, **columns)
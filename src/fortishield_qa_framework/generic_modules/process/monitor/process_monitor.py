@@ -4,15 +4,66 @@ Module to define a process monitor.
 This module defines the basis for creating methods that allow us to obtain information about resources and process
 information. For this purpose, psutil.Process is used, which practically provides us with the necessary information.
 
+The resources used by a process can be obtained as numbers in a ProcessMetrics tuple, reading all of them in a single
+psutil oneshot, so that they can be compared or stored without parsing the formatted strings of the monitors.
+
+The CPU usage is measured without blocking by a CpuTracker, created with the monitor: each measure is the CPU usage
+since the previous one (or since the monitor creation). Without permissions to read the CPU times when the monitor is
+created (for example, for a process of another user), the monitor can still be used for the rest of the resources, and
+the CPU usage is tracked from the first measure.
+
 This module contains the following:
 
+- ProcessMetrics
+- get_process_metrics
 - ProcessMonitor(ABC):
+    - get_metrics
+    - get_cpu_usage
+    - get_threads_cpu_usage
 """
 
+import sys
+import time
 import psutil
 from abc import ABC
+from collections import namedtuple
 
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValueError
+from fortishield_qa_framework.generic_modules.process.monitor.cpu_tracker import CpuTracker
+
+
+# Memory in bytes, memory_percent over the total physical memory, cpu_time in seconds (user and system) since the
+# process started, and num_fds is the number of handles on Windows (None if there are not permissions to get it)
+ProcessMetrics = namedtuple('ProcessMetrics', ['timestamp', 'rss', 'vms', 'memory_percent', 'cpu_time', 'num_fds',
+                                               'num_threads'])
+
+
+def get_process_metrics(process):
+    """Get the resources used by a process, reading all of them in a single psutil oneshot.
+
+    Args:
+        process (psutil.Process): Process object.
+
+    Returns:
+        ProcessMetrics: Process metrics.
+
+    Raises:
+        psutil.NoSuchProcess: If the process does not exist anymore.
+    """
+    with process.oneshot():
+        memory_info = process.memory_info()
+        memory_percent = process.memory_percent()
+        cpu_times = process.cpu_times()
+        num_threads = process.num_threads()
+        # The file descriptors of the processes of other users can not be listed without privileges
+        try:
+            num_fds = process.num_handles() if sys.platform == 'win32' else process.num_fds()
+        except psutil.AccessDenied:
+            num_fds = None
+
+    return ProcessMetrics(timestamp=time.time(), rss=memory_info.rss, vms=memory_info.vms,
+                          memory_percent=memory_percent, cpu_time=cpu_times.user + cpu_times.system, num_fds=num_fds,
+                          num_threads=num_threads)
 
 
 class ProcessMonitor(ABC):
@@ -24,11 +75,49 @@ class ProcessMonitor(ABC):
     Attributes:
         pid (int): Process PID.
         process (psutil.Process): Process object.
+        cpu_tracker (CpuTracker): Tracker to measure the CPU usage of the process without blocking.
     """
     def __init__(self, pid):
         self.pid = pid
 
         try:
             self.process = psutil.Process(pid)
+            self.cpu_tracker = CpuTracker(self.process)
+            self.cpu_tracker.reset()
         except psutil.NoSuchProcess as exception:
             raise ValueError(f"PID {self.pid} was not found", traceback=False) from exception
+        except psutil.AccessDenied:
+            # The CPU usage will be tracked from the first measure, which can fail if the permissions are still denied
+            pass
+
+    def get_metrics(self):
+        """Get the resources used by the monitored process as numbers.
+
+        Returns:
+            ProcessMetrics: Process metrics.
+        """
+        return get_process_metrics(self.process)
+
+    def get_cpu_usage(self, interval=None):
+        """Get the cpu usage percentage of the monitored process as a number.
+
+        Args:
+            interval (float): Seconds to measure the cpu usage, blocking meanwhile. If it is None, the cpu usage since
+                the previous measure (or the monitor creation) is returned without blocking.
+
+        Returns:
+            float: Process cpu usage percentage.
+        """
+        if interval is None:
+            return self.cpu_tracker.get_cpu_usage()
+
+        return self.process.cpu_percent(interval=interval)
+
+    def get_threads_cpu_usage(self):
+        """Get the cpu usage percentage of each thread of the monitored process, since the previous measure (or the
+        monitor creation), without blocking.
+
+        Returns:
+            dict: Cpu usage percentage of each thread ID.
+        """
+        return self.cpu_tracker.get_threads_cpu_usage()
@@ -0,0 +1,210 @@
+"""
+Module to build a tool that samples the resources used by a process at a fixed rate in background.
+
+Each sample records the RSS and VMS memory, the CPU usage percentage, the number of file descriptors (handles on
+Windows, NaN if there are not permissions to get them) and the number of threads of the process. All the metrics of a
+sample are read in a single psutil oneshot, and the CPU usage is computed from the CPU times of consecutive samples by a
+CpuTracker, so sampling does not block.
+
+The samples are stored in a preallocated numeric ring buffer (an array per metric), so the memory used does not grow
+with the sampling time: when it is full, the oldest samples are overwritten. They can be exported as percentiles, as a
+CSV file or as columns (a dictionary with a list per metric, that can be loaded in a pandas DataFrame or a Parquet
+table).
+
+This module contains the following:
+
+- ProcessSampler:
+    - start
+    - stop
+    - sample
+    - get_samples
+    - get_percentiles
+    - get_columns
+    - write_csv
+"""
+
+import csv
+import math
+import time
+import threading
+from array import array
+
+import psutil
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
+from fortishield_qa_framework.generic_modules.process.monitor.cpu_tracker import CpuTracker
+
+
+TIMESTAMP = 'timestamp'
+RSS = 'rss'
+VMS = 'vms'
+CPU_PERCENT = 'cpu_percent'
+NUM_FDS = 'num_fds'
+NUM_THREADS = 'num_threads'
+METRICS = [TIMESTAMP, RSS, VMS, CPU_PERCENT, NUM_FDS, NUM_THREADS]
+
+
+def _get_percentile(sorted_values, percentile):
+    """Get a percentile of some values, interpolating linearly between the closest ranks.
+
+    Args:
+        sorted_values (list(float)): Values in ascending order.
+        percentile (float): Percentile (0-100).
+
+    Returns:
+        float: Percentile value.
+    """
+    position = (len(sorted_values) - 1) * percentile / 100
+    lower_index = int(position)
+    upper_index = min(lower_index + 1, len(sorted_values) - 1)
+
+    return sorted_values[lower_index] + (sorted_values[upper_index] - sorted_values[lower_index]) * \
+        (position - lower_index)
+
+
+class ProcessSampler:
+    """Class to sample the resources used by a process in background.
+
+    Args:
+        process_monitor (ProcessMonitor): Monitor of the process to sample.
+        interval (float): Seconds between two consecutive samples.
+        capacity (int): Max number of samples stored. The oldest ones are overwritten.
+
+    Attributes:
+        process_monitor (ProcessMonitor): Monitor of the process to sample.
+        interval (float): Seconds between two consecutive samples.
+        capacity (int): Max number of samples stored.
+        samples (int): Number of samples taken, including the overwritten ones.
+    """
+    def __init__(self, process_monitor, interval=1, capacity=3600):
+        if interval <= 0:
+            raise ValidationError('The sampling interval must be greater than 0')
+
+        if capacity <= 0:
+            raise ValidationError('The sampler capacity must be greater than 0')
+
+        self.process_monitor = process_monitor
+        self.interval = interval
+        self.capacity = capacity
+        self.samples = 0
+        self.__buffers = {metric: array('d', [0]) * capacity for metric in METRICS}
+        self.__cpu_tracker = CpuTracker(process_monitor.process)
+        self.__stop = threading.Event()
+        self.__thread = None
+        # The samples are stored and read holding the lock, so that the columns are always aligned
+        self.__lock = threading.RLock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start sampling the process in background."""
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """Stop sampling the process, waiting for the background thread to finish."""
+        self.__stop.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self):
+        """Sample the process at a fixed rate until the sampler is stopped or the process finishes."""
+        next_time = time.monotonic()
+
+        while not self.__stop.is_set():
+            try:
+                self.sample()
+            except psutil.NoSuchProcess:
+                return
+
+            # Keep the rate, not counting the time needed to take the sample
+            next_time += self.interval
+            self.__stop.wait(max(next_time - time.monotonic(), 0))
+
+    def sample(self):
+        """Take a sample of the process resources and store it.
+
+        Raises:
+            psutil.NoSuchProcess: If the process does not exist anymore.
+        """
+        metrics = self.process_monitor.get_metrics()
+
+        # The CPU usage is the CPU time used since the previous sample. It is 0 in the first one
+        cpu_percent = self.__cpu_tracker.get_cpu_usage(cpu_time=metrics.cpu_time)
+
+        with self.__lock:
+            index = self.samples % self.capacity
+            num_fds = math.nan if metrics.num_fds is None else metrics.num_fds
+            for metric, value in zip(METRICS, (metrics.timestamp, metrics.rss, metrics.vms, cpu_percent, num_fds,
+                                               metrics.num_threads)):
+                self.__buffers[metric][index] = value
+            self.samples += 1
+
+    def get_samples(self, metric):
+        """Get the stored values of a metric, from the oldest to the newest.
+
+        Args:
+            metric (str): Metric name. Enum: [timestamp, rss, vms, cpu_percent, num_fds, num_threads].
+
+        Returns:
+            list(float): Metric values.
+
+        Raises:
+            ValidationError: If the metric is not valid.
+        """
+        if metric not in self.__buffers:
+            raise ValidationError(f"Metric {metric} is not valid. Accepted ones: {METRICS}")
+
+        buffer = self.__buffers[metric]
+        with self.__lock:
+            if self.samples <= self.capacity:
+                return buffer[:self.samples].tolist()
+
+            # The buffer is full, so the oldest sample is the next one to be overwritten
+            oldest_index = self.samples % self.capacity
+            return buffer[oldest_index:].tolist() + buffer[:oldest_index].tolist()
+
+    def get_percentiles(self, metric, percentiles=(50, 90, 99)):
+        """Get percentiles of the stored values of a metric.
+
+        Args:
+            metric (str): Metric name. Enum: [timestamp, rss, vms, cpu_percent, num_fds, num_threads].
+            percentiles (tuple(float)): Percentiles to get (0-100).
+
+        Returns:
+            dict: Value of each percentile, or an empty dictionary if there are no samples.
+        """
+        # The values that could not be read (NaN) are not taken into account
+        sorted_values = sorted(value for value in self.get_samples(metric) if not math.isnan(value))
+        if not sorted_values:
+            return {}
+
+        return {percentile: _get_percentile(sorted_values, percentile) for percentile in percentiles}
+
+    def get_columns(self):
+        """Get the stored samples as columns.
+
+        Returns:
+            dict: List of values of each metric, from the oldest to the newest sample.
+        """
+        with self.__lock:
+            return {metric: self.get_samples(metric) for metric in METRICS}
+
+    def write_csv(self, file_path):
+        """Write the stored samples in a CSV file, with a header and a row per sample.
+
+        Args:
+            file_path (str): CSV file path.
+        """
+        columns = self.get_columns()
+        with open(file_path, 'w', newline='') as _file:
+            writer = csv.writer(_file)
+            writer.writerow(METRICS)
+            writer.writerows(zip(*columns.values()))
@@ -0,0 +1,74 @@
+"""
+Pytest plugin to fail the tests that make a process leak resources.
+
+The leak_detector fixture provides a function to start checking a process by its PID. The process is sampled in
+background while the test runs and, in the teardown, the test fails if any of its resources (RSS memory, file
+descriptors or threads) has grown more than its budget. It also fails if the sampling has failed or a resource has not
+enough samples to be checked (the test was shorter than a few sampling intervals, or the resource could not be read).
+
+To use it, load the plugin from a conftest.py file:
+
+    pytest_plugins = ['fortishield_qa_framework.generic_modules.process.monitor.pytest_leak_detector']
+
+    def test_daemon(leak_detector):
+        leak_detector(daemon_pid, budgets={'rss': 1024, 'num_fds': 0})
+        ...
+
+This module contains the following:
+
+- leak_detector
+"""
+
+import sys
+import pytest
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ResourceLeakError
+from fortishield_qa_framework.generic_modules.process.monitor.leak_detector import LeakDetector, MIN_SAMPLES
+from fortishield_qa_framework.generic_modules.process.monitor.linux_process_monitor import LinuxProcessMonitor
+from fortishield_qa_framework.generic_modules.process.monitor.windows_process_monitor import WindowsProcessMonitor
+
+
+@pytest.fixture
+def leak_detector():
+    """Check the processes started by the test for resource leaks, failing the test in the teardown if any leaks or
+    can not be checked."""
+    detectors = []
+
+    def start_leak_detector(pid, budgets=None, interval=1):
+        """Start checking a process for resource leaks until the test finishes.
+
+        Args:
+            pid (int): Process PID.
+            budgets (dict): Max growth allowed for each resource, in units per second (bytes for rss). Enum keys: [rss,
+                num_fds, num_threads]. By default, any significant growth is a leak.
+            interval (float): Seconds between two consecutive samples.
+
+        Returns:
+            LeakDetector: Leak detector of the process.
+        """
+        process_monitor = WindowsProcessMonitor(pid) if sys.platform == 'win32' else LinuxProcessMonitor(pid)
+        detector = LeakDetector(process_monitor, budgets=budgets, interval=interval)
+        detector.start()
+        detectors.append(detector)
+
+        return detector
+
+    yield start_leak_detector
+
+    errors = []
+    for detector in detectors:
+        try:
+            detector.stop()
+            detector.check()
+        except ResourceLeakError as exception:
+            errors.append(exception.message)
+        except Exception as exception:
+            errors.append(f"Could not sample process {detector.process_monitor.pid}: {exception!r}")
+
+        undersampled_metrics = detector.get_undersampled_metrics()
+        if undersampled_metrics:
+            errors.append(f"Process {detector.process_monitor.pid} has less than {MIN_SAMPLES} samples of "
+                          f"{undersampled_metrics}, so their leaks can not be detected")
+
+    if errors:
+        pytest.fail('\n'.join(errors))
@@ -1,22 +1,46 @@
 """
 Module to build a tool that allow us to run local commands and process the output in a custom way.
 
+The output can be captured when the process finishes (run) or streamed line by line while it is running (iter_output),
+so commands with huge outputs can be processed without keeping them in memory. While streaming, the output is read in
+chunks by a thread for each stream and its lines are passed through a bounded queue, so the memory used does not depend
+on the output size.
+
 This module contains the following:
 
 - Process:
     - run
+    - iter_output
+    - search_output
     - get_stdout
     - get_stderr
     - get_status
     - get_pid
     - kill
+    - kill_tree
     - get_return_code
 """
 
+import re
+import time
+import queue
+import threading
 import subprocess
 import json
 import psutil
 
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
+
+
+STDOUT = 'stdout'
+STDERR = 'stderr'
+# Max bytes read at once while streaming the output. It is also the max size of a streamed line (longer ones are split)
+STREAM_CHUNK_SIZE = 65536
+# Max number of chunks buffered while streaming the output
+STREAM_QUEUE_SIZE = 64
+# Max seconds to wait for the stream readers when the streaming finishes
+STREAM_READER_JOIN_TIMEOUT = 0.5
+
 
 class Process:
     """Class to run processes.
@@ -61,12 +85,8 @@ class Process:
         del(attributes['process'])
         return json.dumps(attributes)
 
-    def run(self):
-        """Run the process
-
-        Raises:
-            subprocess.TimeoutExpired: If the process time taken is grater than the timeout set.
-        """
+    def __popen(self):
+        """Start the process, with a pipe for each captured stream."""
         args = {
             'args': self.command,
             'shell': self.shell,
@@ -78,9 +98,17 @@ class Process:
         if self.capture_stderr:
             args['stderr'] = subprocess.PIPE
 
-        # Run the process
         self.process = psutil.Popen(**args)
 
+    def run(self):
+        """Run the process
+
+        Raises:
+            subprocess.TimeoutExpired: If the process time taken is grater than the timeout set.
+        """
+        # Run the process
+        self.__popen()
+
         # If we capture the stdout or stderr, we have to wait until process is finished and save it into attributes.
         if self.capture_stdout or self.capture_stderr:
             output = self.process.communicate(timeout=self.timeout)
@@ -92,6 +120,159 @@ class Process:
         if not(self.capture_stdout or self.capture_stderr) and self.wait:
             self.return_code = self.process.wait(timeout=self.timeout)
 
+    def iter_output(self):
+        """Run the process and iterate over its output lines while it is running, until it is finished.
+
+        Only the captured streams are read. The output is not saved in the stdout and stderr attributes. If the
+        iteration is stopped before the process has finished, the process is killed.
+
+        Yields:
+            str, str: Stream (stdout or stderr) and line. The lines are decoded replacing the non valid characters.
+
+        Raises:
+            ValidationError: If neither the stdout nor the stderr are captured.
+            subprocess.TimeoutExpired: If the process time taken is greater than the timeout set. The process is killed.
+        """
+        if not (self.capture_stdout or self.capture_stderr):
+            raise ValidationError('The stdout or the stderr must be captured to iterate over the process output')
+
+        self.__popen()
+        start_time = time.time()
+        lines = queue.Queue(STREAM_QUEUE_SIZE)
+        stop = threading.Event()
+        readers = [threading.Thread(target=self.__read_stream, args=(stream, pipe, lines, stop), daemon=True)
+                   for stream, pipe in [(STDOUT, self.process.stdout), (STDERR, self.process.stderr)] if pipe]
+
+        for reader in readers:
+            reader.start()
+
+        try:
+            finished_readers = 0
+            while finished_readers < len(readers):
+                try:
+                    item = lines.get(timeout=self.__get_remaining_time(start_time))
+                except queue.Empty:
+                    raise subprocess.TimeoutExpired(self.command, self.timeout)
+
+                # Each reader puts None when its stream has finished
+                if item is None:
+                    finished_readers += 1
+                else:
+                    stream, stream_lines = item
+                    for line in stream_lines:
+                        yield stream, line
+
+            try:
+                self.return_code = self.process.wait(timeout=self.__get_remaining_time(start_time))
+            except psutil.TimeoutExpired:
+                raise subprocess.TimeoutExpired(self.command, self.timeout)
+        finally:
+            stop.set()
+            if self.process.poll() is None:
+                self.kill_tree()
+                self.return_code = self.process.wait()
+            # A background descendant that has not been killed with the tree (for example, because the process had
+            # finished before) could keep the pipes opened, blocking their readers. They are not waited for long, and
+            # each reader closes its pipe when it finishes.
+            for reader in readers:
+                reader.join(STREAM_READER_JOIN_TIMEOUT)
+
+    def __get_remaining_time(self, start_time):
+        """Get the time left until the timeout.
+
+        Args:
+            start_time (float): Process start time.
+
+        Returns:
+            float: Seconds left, or None if there is no timeout.
+        """
+        return None if self.timeout is None else max(self.timeout - (time.time() - start_time), 0)
+
+    @staticmethod
+    def __read_stream(stream, pipe, lines, stop):
+        """Read the lines of a process stream and put them in the queue, until the stream finishes or it is stopped.
+
+        The stream is read in chunks of the available data, and the complete lines of each chunk are put together. The
+        pipe is closed when the reading finishes.
+
+        Args:
+            stream (str): Stream name (stdout or stderr).
+            pipe (io.BufferedReader): Stream pipe.
+            lines (queue.Queue): Queue to put the stream name and lines in. None is put when the stream has finished.
+            stop (threading.Event): Event set when the lines are not consumed anymore.
+        """
+        def put(item):
+            # Wait while the queue is full, unless the lines are not consumed anymore
+            while not stop.is_set():
+                try:
+                    lines.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        remainder = b''
+        with pipe:
+            for chunk in iter(lambda: pipe.read1(STREAM_CHUNK_SIZE), b''):
+                data = remainder + chunk if remainder else chunk
+                # The last line could continue in the next chunk. A line longer than a chunk is split
+                lines_end = data.rfind(b'\n') + 1
+                if not lines_end and len(data) >= STREAM_CHUNK_SIZE:
+                    lines_end = len(data)
+                block, remainder = data[:lines_end], data[lines_end:]
+
+                if block and not put((stream, Process.__split_lines(block))):
+                    return
+
+        if remainder:
+            put((stream, Process.__split_lines(remainder)))
+        put(None)
+
+    @staticmethod
+    def __split_lines(block):
+        """Decode a block of output and split it in lines.
+
+        Args:
+            block (bytes): Output block.
+
+        Returns:
+            list(str): Lines, including the line break (except the last one if the block does not end with it).
+        """
+        lines = block.decode(errors='replace').split('\n')
+        # The last item is empty if the block ends with a line break
+        last_line = lines.pop()
+        lines = [f"{line}\n" for line in lines]
+        if last_line:
+            lines.append(last_line)
+
+        return lines
+
+    def search_output(self, pattern):
+        """Run the process until one of its output lines matches with the pattern, killing it then.
+
+        Args:
+            pattern (str): Regex to search in each line.
+
+        Returns:
+            re.Match: Match of the first matching line, or None if the process has finished without matching lines.
+
+        Raises:
+            ValidationError: If neither the stdout nor the stderr are captured.
+            subprocess.TimeoutExpired: If the process time taken is greater than the timeout set. The process is killed.
+        """
+        regex = re.compile(pattern)
+        output = self.iter_output()
+
+        try:
+            for _, line in output:
+                match = regex.search(line)
+                if match:
+                    return match
+        finally:
+            output.close()
+
+        return None
+
     def get_stdout(self):
         """Get process stdout.
 
@@ -134,6 +315,20 @@ class Process:
         except psutil.NoSuchProcess:
             pass
 
+    def kill_tree(self):
+        """Kill the process and all its children (for example, the commands launched by a shell) if they exist."""
+        try:
+            children = self.process.children(recursive=True)
+        except psutil.NoSuchProcess:
+            children = []
+
+        self.kill()
+        for child in children:
+            try:
+                child.kill()
+            except psutil.NoSuchProcess:
+                pass
+
     def get_return_code(self):
         """Get the process return code.
 
@@ -0,0 +1,101 @@
+"""
+Module to build a tool that allow us to run many processes concurrently and collect their results.
+
+The processes (Process, LinuxProcess or WindowsProcess objects that have not been run yet) are run by a pool of worker
+threads, so at most max_workers of them are running at the same time. Each worker waits for its process to finish,
+collecting its stdout, stderr (if they are captured) and return code. If the process exceeds its timeout, it is killed
+with its children and the output produced until then is collected.
+
+The results are returned in the same order as the processes were submitted, regardless of the order in which they
+finish.
+
+This module contains the following:
+
+- ProcessResult
+- run_processes
+"""
+
+import os
+import subprocess
+import psutil
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+ProcessResult = namedtuple('ProcessResult', ['command', 'return_code', 'stdout', 'stderr', 'timed_out'])
+
+
+def _decode_output(output):
+    """Decode a process output.
+
+    Args:
+        output (bytes): Process output, or None if it has not been captured.
+
+    Returns:
+        str: Decoded output, or None if it has not been captured.
+    """
+    return output.decode() if type(output) is bytes else output
+
+
+def _run_process(process, timeout):
+    """Run a process until it finishes or its timeout expires.
+
+    The process is always waited for, whatever its wait setting. Its wait and timeout settings are only changed while
+    it is running, and they are restored afterwards.
+
+    Args:
+        process (Process): Process to run.
+        timeout (float): Timeout to use if the process does not have one.
+
+    Returns:
+        ProcessResult: Process result.
+    """
+    wait, process_timeout = process.wait, process.timeout
+    process.wait = True
+    if process.timeout is None:
+        process.timeout = timeout
+
+    try:
+        process.run()
+        timed_out = False
+    # The processes without captured output are waited with psutil, which raises its own timeout exception
+    except (subprocess.TimeoutExpired, psutil.TimeoutExpired):
+        process.kill_tree()
+        # Collect the output produced until the process was killed
+        stdout, stderr = process.process.communicate()
+        process.stdout = _decode_output(stdout)
+        process.stderr = _decode_output(stderr)
+        process.return_code = process.process.returncode
+        timed_out = True
+    finally:
+        process.wait, process.timeout = wait, process_timeout
+
+    return ProcessResult(process.command, process.get_return_code(), process.get_stdout(), process.get_stderr(),
+                         timed_out)
+
+
+def run_processes(processes, max_workers=None, timeout=None):
+    """Run many processes concurrently and wait until all of them have finished.
+
+    Each process is always waited for, even if its wait setting is False. The wait and timeout settings of the
+    processes are not modified.
+
+    Args:
+        processes (list(Process)): Processes to run. They must not have been run before.
+        max_workers (int): Max number of processes running at the same time. By default, the number of CPUs.
+        timeout (float): Num seconds to wait until each process is finished, for the processes without timeout. If it
+            is exceeded, the process is killed.
+
+    Returns:
+        list(ProcessResult): Result of each process, in the same order as the processes.
+
+    Raises:
+        OSError: If any process could not be started.
+    """
+    if not processes:
+        return []
+
+    max_workers = max_workers if max_workers else os.cpu_count()
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(processes))) as executor:
+        return list(executor.map(_run_process, processes, [timeout] * len(processes)))
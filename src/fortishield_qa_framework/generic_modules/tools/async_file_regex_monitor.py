@@ -0,0 +1,313 @@
+"""
+Module to build an asyncio tool that allow us to monitor a file content and check if the content matches with a
+specified callback, without blocking the event loop.
+
+Unlike the FileRegexMonitor, the monitoring does not start when the object is created but when it is awaited, so many
+monitors can wait concurrently in the same event loop without a thread for each one. The start position of the file is
+taken when the object is created, so the events logged between the creation and the await are not lost.
+
+The new lines are read without blocking and, while there are no new lines, the monitor waits for the inotify events of
+the file in the event loop (or sleeps the polling interval when inotify is not available). When the file is rotated or
+truncated, the new content is read from its beginning.
+
+This module contains the following:
+
+- AsyncFileRegexMonitor:
+    - wait
+    - iter_matches
+- wait_first
+- wait_all
+"""
+
+import os
+import time
+import asyncio
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError, TimeoutError
+from fortishield_qa_framework.generic_modules.file.file import get_file_encoding, get_file_change, FILE_ROTATED, \
+    FILE_TRUNCATED
+from fortishield_qa_framework.generic_modules.tools.file_watcher import get_file_watcher, InotifyFileWatcher, \
+    AUTO_BACKEND, WAKEUP_BACKENDS, DEFAULT_POLLING_INTERVAL
+
+
+# Number of lines processed before giving control back to the event loop
+LINES_PER_ITERATION = 1000
+
+
+class AsyncFileRegexMonitor:
+    """Class to monitor a file from an asyncio event loop and check if the content matches with the specified callback.
+
+    Args:
+        monitoring (MonitoringObject): Monitoring object with the file, callback and timeout.
+        accumulations (int): Number of expected times to match with the callback.
+        only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
+        error_message (str): Error message to show if the timeout exception is raised.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+
+    Attributes:
+        monitoring (MonitoringObject): Monitoring object with the file, callback and timeout.
+        accumulations (int): Number of expected times to match with the callback.
+        only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
+        error_message (str): Error message to show if the timeout exception is raised.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+        callback_result (*): It will store the result returned by the callback call if it is not None.
+        matches (int): Number of times that the callback has been matched.
+    """
+
+    def __init__(self, monitoring, accumulations=1, only_new_events=False, error_message=None,
+                 wakeup_backend=AUTO_BACKEND):
+        self.monitoring = monitoring
+        self.accumulations = accumulations
+        self.only_new_events = only_new_events
+        self.error_message = error_message
+        self.wakeup_backend = wakeup_backend
+        self.callback_result = None
+        self.matches = 0
+
+        self.__validate_parameters()
+        self.__start_offset = os.path.getsize(self.monitoring.monitored_file) if self.only_new_events else 0
+
+    def __validate_parameters(self):
+        """Validate if the specified file can be monitored."""
+        # Check that the monitored file exists
+        if not os.path.exists(self.monitoring.monitored_file):
+            raise ValidationError(f"File {self.monitoring.monitored_file} does not exist")
+
+        # Check that the monitored file is a file
+        if not os.path.isfile(self.monitoring.monitored_file):
+            raise ValidationError(f"{self.monitoring.monitored_file} is not a file")
+
+        # Check that the program can read the content of the file
+        if not os.access(self.monitoring.monitored_file, os.R_OK):
+            raise ValidationError(f"{self.monitoring.monitored_file} is not readable")
+
+        # Check that the wakeup backend is valid
+        if self.wakeup_backend not in WAKEUP_BACKENDS:
+            raise ValidationError(f"Wakeup backend {self.wakeup_backend} is not valid. "
+                                  f"Accepted ones: {WAKEUP_BACKENDS}")
+
+    def __aiter__(self):
+        """Iterate over the callback results of the matching lines with async for."""
+        return self.iter_matches()
+
+    def __get_timeout_message(self):
+        """Get the message of the timeout exception.
+
+        Returns:
+            str: Timeout exception message.
+        """
+        return f"Events from {self.monitoring.monitored_file} did not match with the callback" + \
+            f" from {self.monitoring}" if self.error_message is None else self.error_message
+
+    async def wait(self):
+        """Wait until the callback has been triggered the expected times.
+
+        Returns:
+            *: Result returned by the last callback call that was not None.
+
+        Raises:
+            TimeoutError: If the callback has not been triggered the expected times before the timeout.
+        """
+        async for _ in self.iter_matches():
+            pass
+
+        return self.callback_result
+
+    async def iter_matches(self):
+        """Iterate over the callback results of the matching lines, until the callback has been triggered the expected
+        times.
+
+        Yields:
+            *: Result returned by the callback for each matching line.
+
+        Raises:
+            TimeoutError: If the callback has not been triggered the expected times before the timeout.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        encoding = get_file_encoding(self.monitoring.monitored_file)
+        # The watcher is created before opening the file, so that any change made from that moment will wake it up
+        watcher = get_file_watcher(self.monitoring.monitored_file, self.wakeup_backend)
+        _file = None
+        file_changed = None
+
+        try:
+            _file = open(self.monitoring.monitored_file, encoding=encoding, errors='replace')
+            _file.seek(self.__start_offset)
+
+            # The inotify events are waited in the event loop, registering its file descriptor
+            if isinstance(watcher, InotifyFileWatcher):
+                file_changed = asyncio.Event()
+                loop.add_reader(watcher.fileno(), file_changed.set)
+
+            while self.matches < self.accumulations:
+                lines = self.__read_available_lines(_file)
+                for line in lines:
+                    callback_result = self.monitoring.callback(line)
+                    self.callback_result = callback_result if callback_result is not None else self.callback_result
+                    if callback_result:
+                        self.matches += 1
+                        yield callback_result
+                        if self.matches >= self.accumulations:
+                            return
+
+                remaining_time = self.monitoring.timeout - (time.time() - start_time)
+                if remaining_time <= 0:
+                    raise TimeoutError(self.__get_timeout_message())
+
+                if lines:
+                    # Give control back to the event loop between batches of lines
+                    await asyncio.sleep(0)
+                    continue
+
+                file_change = get_file_change(_file, self.monitoring.monitored_file, _file.tell())
+                if file_change == FILE_ROTATED:
+                    watcher, _file = self.__reopen(loop, watcher, _file, file_changed, encoding)
+                elif file_change == FILE_TRUNCATED:
+                    _file.seek(0)
+                elif file_change is None and file_changed is not None:
+                    await self.__wait_inotify_event(watcher, file_changed, remaining_time)
+                else:
+                    # The watcher would not notice the creation of a removed file, so it is checked periodically
+                    await asyncio.sleep(min(DEFAULT_POLLING_INTERVAL, remaining_time))
+        finally:
+            if file_changed is not None:
+                loop.remove_reader(watcher.fileno())
+            if _file is not None:
+                _file.close()
+            watcher.close()
+
+    @staticmethod
+    def __read_available_lines(file_object):
+        """Read the available lines of the file without blocking, up to the max number of lines of an iteration.
+
+        Args:
+            file_object (file): Opened file.
+
+        Returns:
+            list(str): Read lines.
+        """
+        lines = []
+        while len(lines) < LINES_PER_ITERATION:
+            current_position = file_object.tell()
+            line = file_object.readline()
+            # If we have not new changes, go back to the last position
+            if not line:
+                file_object.seek(current_position)
+                break
+            lines.append(line)
+
+        return lines
+
+    @staticmethod
+    async def __wait_inotify_event(watcher, file_changed, timeout):
+        """Wait until the inotify file descriptor is readable or the timeout expires.
+
+        Args:
+            watcher (InotifyFileWatcher): File watcher.
+            file_changed (asyncio.Event): Event set when the inotify file descriptor is readable.
+            timeout (float): Max number of seconds to wait.
+        """
+        try:
+            await asyncio.wait_for(file_changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+        file_changed.clear()
+        watcher.consume_events()
+
+    def __reopen(self, loop, watcher, file_object, file_changed, encoding):
+        """Open the new file after a rotation, closing the previous one and its watcher.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): Running event loop.
+            watcher (FileWatcher): Watcher of the previous file.
+            file_object (file): Previous opened file.
+            file_changed (asyncio.Event): Event set when the inotify file descriptor is readable, or None.
+            encoding (str): File encoding.
+
+        Returns:
+            FileWatcher, file: Watcher and opened file to use. The previous ones if the new file does not exist yet.
+        """
+        try:
+            new_file = open(self.monitoring.monitored_file, encoding=encoding, errors='replace')
+        except FileNotFoundError:
+            return watcher, file_object
+
+        try:
+            new_watcher = get_file_watcher(self.monitoring.monitored_file, self.wakeup_backend)
+        except Exception:
+            new_file.close()
+            raise
+
+        if file_changed is not None:
+            loop.remove_reader(watcher.fileno())
+        watcher.close()
+        file_object.close()
+
+        # The new watcher could use a different backend if the inotify instance could not be created
+        if isinstance(new_watcher, InotifyFileWatcher) and file_changed is not None:
+            loop.add_reader(new_watcher.fileno(), file_changed.set)
+
+        return new_watcher, new_file
+
+
+async def wait_first(monitors):
+    """Wait until any of the monitors has been triggered the expected times, cancelling the other ones.
+
+    Args:
+        monitors (list(AsyncFileRegexMonitor)): Monitors to wait.
+
+    Returns:
+        AsyncFileRegexMonitor: First monitor that has been triggered the expected times.
+
+    Raises:
+        TimeoutError: If none of the monitors has been triggered the expected times before its timeout.
+    """
+    tasks = {asyncio.ensure_future(monitor.wait()): monitor for monitor in monitors}
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exception = task.exception()
+                if exception is None:
+                    return tasks[task]
+                if not isinstance(exception, TimeoutError):
+                    raise exception
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    raise TimeoutError(f"None of the monitors matched: {', '.join(str(monitor.monitoring) for monitor in monitors)}")
+
+
+async def wait_all(monitors):
+    """Wait until all the monitors have been triggered the expected times.
+
+    If any monitor fails, the other ones are cancelled and its exception is raised.
+
+    Args:
+        monitors (list(AsyncFileRegexMonitor)): Monitors to wait.
+
+    Returns:
+        list(*): Callback result of each monitor, in the same order.
+
+    Raises:
+        TimeoutError: If any monitor has not been triggered the expected times before its timeout.
+    """
+    tasks = [asyncio.ensure_future(monitor.wait()) for monitor in monitors]
+
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in tasks:
+            if task in done and task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return [task.result() for task in tasks]
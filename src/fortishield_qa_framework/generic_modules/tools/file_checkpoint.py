@@ -0,0 +1,118 @@
+"""
+Module to build a tool that persists the position reached while reading a file, so that a later scan of the same file
+can resume from it instead of reading it again from the beginning.
+
+The checkpoint stores the file identity (device and inode), the byte offset of the end of the last processed line and
+an optional state (for example, the patterns already found by a failed search of the file_regex_checker module). It is
+saved in a JSON file, so it survives between processes.
+
+When the file is rotated (its identity changes) or truncated (it is smaller than the offset), the checkpoint is not
+valid anymore, so the file is read again from the beginning and the state is discarded.
+
+This module contains the following:
+
+- FileCheckpoint:
+    - load
+    - save
+    - reset
+    - get_offset
+    - update
+"""
+
+import os
+import json
+
+
+class FileCheckpoint:
+    """Class to persist the offset reached in a file.
+
+    Args:
+        checkpoint_file (str): Path of the JSON file where the checkpoint is persisted.
+
+    Attributes:
+        checkpoint_file (str): Path of the JSON file where the checkpoint is persisted.
+        device (int): Device of the checkpoint file. None if the checkpoint is empty.
+        inode (int): Inode of the checkpoint file. None if the checkpoint is empty.
+        offset (int): Byte offset of the end of the last processed line.
+        state (dict): Additional data saved with the checkpoint.
+    """
+    def __init__(self, checkpoint_file):
+        self.checkpoint_file = checkpoint_file
+        self.device = None
+        self.inode = None
+        self.offset = 0
+        self.state = {}
+
+        self.load()
+
+    def load(self):
+        """Load the checkpoint from its JSON file.
+
+        If the file does not exist or its content is not valid, the checkpoint is empty, so the file will be read from
+        the beginning.
+        """
+        try:
+            with open(self.checkpoint_file) as _file:
+                checkpoint = json.load(_file)
+
+            self.device = checkpoint['device']
+            self.inode = checkpoint['inode']
+            self.offset = checkpoint['offset']
+            self.state = checkpoint.get('state', {})
+        except (OSError, ValueError, KeyError, TypeError):
+            self.reset()
+
+    def save(self):
+        """Save the checkpoint in its JSON file.
+
+        The content is written in a temporary file that replaces the previous one, so a reader never gets a partially
+        written checkpoint.
+        """
+        temporary_file = f"{self.checkpoint_file}.tmp"
+        with open(temporary_file, 'w') as _file:
+            json.dump({'device': self.device, 'inode': self.inode, 'offset': self.offset, 'state': self.state}, _file)
+
+        os.replace(temporary_file, self.checkpoint_file)
+
+    def reset(self):
+        """Empty the checkpoint, so the file will be read from the beginning."""
+        self.device = None
+        self.inode = None
+        self.offset = 0
+        self.state = {}
+
+    def get_offset(self, file_object):
+        """Get the offset from which an opened file has to be read.
+
+        If the file is not the one of the checkpoint (it has been rotated) or it is smaller than the offset (it has
+        been truncated), the checkpoint is reset.
+
+        Args:
+            file_object (file): Opened file.
+
+        Returns:
+            int: Byte offset to resume the reading.
+        """
+        file_status = os.fstat(file_object.fileno())
+
+        if (file_status.st_dev, file_status.st_ino) != (self.device, self.inode) or file_status.st_size < self.offset:
+            self.reset()
+
+        return self.offset
+
+    def update(self, file_object, offset, state=None):
+        """Update the checkpoint with the offset reached in an opened file and save it.
+
+        Args:
+            file_object (file): Opened file.
+            offset (int): Byte offset of the end of the last processed line.
+            state (dict): Additional data to save with the checkpoint. If it is not specified, the current one is kept.
+        """
+        file_status = os.fstat(file_object.fileno())
+
+        self.device = file_status.st_dev
+        self.inode = file_status.st_ino
+        self.offset = offset
+        self.state = self.state if state is None else state
+
+        self.save()
@@ -0,0 +1,237 @@
+"""
+Module to build a sparse index of the timestamps of a log file, to jump to the log lines from a specific time without
+reading the file from its beginning.
+
+The index stores samples of (timestamp, byte offset) taken every interval bytes: the timestamp of the first line that
+starts after each sample position. Building it only reads a few bytes around each sample position instead of the
+whole file, and when the file grows, only the new positions are sampled. With an index file (sidecar), the samples are
+persisted, so the next checks of the same file do not have to sample it again.
+
+To get the position of the lines logged from a specific time, the samples are binary searched. The position returned
+is the one of the last sample older than that time, so at most an interval of older lines has to be skipped.
+
+The lines are expected to start with a timestamp with the Fortishield logs format (2023/02/14 09:49:47) and the
+timestamps are expected to be in ascending order. The lines without timestamp (like the ones of multi-line messages)
+are ignored when sampling.
+
+This module contains the following:
+
+- LogTimestampIndex:
+    - load
+    - save
+    - update
+    - get_offset
+- get_timestamp_key
+- get_line_timestamp_key
+- skip_lines_before
+"""
+
+import os
+import re
+import json
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
+
+
+# Bytes between two consecutive samples of the index (64 KiB)
+DEFAULT_INDEX_INTERVAL = 65536
+LOG_TIMESTAMP_FORMAT = '%Y/%m/%d %H:%M:%S'
+LOG_TIMESTAMP_REGEX = re.compile(rb'(\d{4})/(\d{2})/(\d{2}) (\d{2}):(\d{2}):(\d{2})')
+
+
+def get_timestamp_key(timestamp):
+    """Get the numeric key of a timestamp, which keeps the timestamps order.
+
+    Args:
+        timestamp (str or datetime): Timestamp, with the Fortishield logs format if it is a string.
+
+    Returns:
+        int: Timestamp key.
+
+    Raises:
+        ValidationError: If the timestamp does not have the expected format.
+    """
+    if isinstance(timestamp, str):
+        try:
+            timestamp = datetime.strptime(timestamp, LOG_TIMESTAMP_FORMAT)
+        except ValueError:
+            raise ValidationError(f"Timestamp {timestamp} does not match the format {LOG_TIMESTAMP_FORMAT}")
+
+    return int(timestamp.strftime('%Y%m%d%H%M%S'))
+
+
+def get_line_timestamp_key(line):
+    """Get the numeric key of the timestamp at the beginning of a log line.
+
+    Args:
+        line (bytes or str): Log line.
+
+    Returns:
+        int: Timestamp key, or None if the line does not start with a timestamp.
+    """
+    match = LOG_TIMESTAMP_REGEX.match(line.encode() if isinstance(line, str) else line)
+
+    return int(b''.join(match.groups())) if match else None
+
+
+def skip_lines_before(lines, timestamp_key):
+    """Skip the log lines until the first one whose timestamp is not older than the specified one.
+
+    Args:
+        lines (iterator(bytes or str)): Log lines.
+        timestamp_key (int): Timestamp key.
+
+    Yields:
+        bytes or str: Log lines from the first one whose timestamp is not older than the specified one.
+    """
+    lines = iter(lines)
+    for line in lines:
+        line_timestamp_key = get_line_timestamp_key(line)
+        if line_timestamp_key is not None and line_timestamp_key >= timestamp_key:
+            yield line
+            break
+
+    yield from lines
+
+
+class LogTimestampIndex:
+    """Class to build and search a sparse index of the timestamps of a log file.
+
+    Args:
+        file_path (str): Log file path.
+        index_file (str): Path of the JSON file where the index is persisted. If it is not specified, the index is only
+            kept in memory.
+        interval (int): Bytes between two consecutive samples.
+
+    Attributes:
+        file_path (str): Log file path.
+        index_file (str): Path of the JSON file where the index is persisted, or None.
+        interval (int): Bytes between two consecutive samples.
+        device (int): Device of the indexed file. None if the index is empty.
+        inode (int): Inode of the indexed file. None if the index is empty.
+        next_position (int): Position of the next sample to take.
+        timestamps (array): Timestamp key of each sample, in ascending order.
+        offsets (array): Offset of the line of each sample.
+    """
+    def __init__(self, file_path, index_file=None, interval=DEFAULT_INDEX_INTERVAL):
+        self.file_path = file_path
+        self.index_file = index_file
+        self.interval = interval
+        self.__reset()
+
+        if self.index_file is not None:
+            self.load()
+
+    def __reset(self):
+        """Empty the index."""
+        self.device = None
+        self.inode = None
+        self.next_position = 0
+        self.timestamps = array('q')
+        self.offsets = array('q')
+
+    def load(self):
+        """Load the index from its JSON file.
+
+        If the file does not exist, its content is not valid or it was built with a different interval, the index is
+        empty.
+        """
+        try:
+            with open(self.index_file) as _file:
+                index = json.load(_file)
+
+            if index['interval'] != self.interval:
+                raise ValueError('The index interval does not match')
+
+            self.device = index['device']
+            self.inode = index['inode']
+            self.next_position = index['next_position']
+            self.timestamps = array('q', index['timestamps'])
+            self.offsets = array('q', index['offsets'])
+        except (OSError, ValueError, KeyError, TypeError):
+            self.__reset()
+
+    def save(self):
+        """Save the index in its JSON file, replacing the previous one."""
+        temporary_file = f"{self.index_file}.tmp"
+        with open(temporary_file, 'w') as _file:
+            json.dump({'interval': self.interval, 'device': self.device, 'inode': self.inode,
+                       'next_position': self.next_position, 'timestamps': self.timestamps.tolist(),
+                       'offsets': self.offsets.tolist()}, _file)
+
+        os.replace(temporary_file, self.index_file)
+
+    def update(self):
+        """Sample the positions of the file that have not been indexed yet.
+
+        If the file has been rotated or truncated, the index is built again.
+        """
+        with open(self.file_path, 'rb') as _file:
+            file_status = os.fstat(_file.fileno())
+
+            if (file_status.st_dev, file_status.st_ino) != (self.device, self.inode) or \
+                    file_status.st_size < self.next_position:
+                self.__reset()
+                self.device = file_status.st_dev
+                self.inode = file_status.st_ino
+
+            initial_position = self.next_position
+            while self.next_position < file_status.st_size:
+                if not self.__take_sample(_file):
+                    break
+                self.next_position += self.interval
+
+        if self.index_file is not None and self.next_position != initial_position:
+            self.save()
+
+    def __take_sample(self, file_object):
+        """Sample the timestamp of the first line that starts after the next sample position.
+
+        Args:
+            file_object (io.BufferedReader): Log file opened in binary mode.
+
+        Returns:
+            boolean: True if the position has been sampled, False if the file has not enough complete lines yet.
+        """
+        file_object.seek(self.next_position)
+        # The line of the sample position could have started before it
+        if self.next_position > 0 and not file_object.readline().endswith(b'\n'):
+            return False
+
+        # Look for a line with timestamp until the next sample position
+        while file_object.tell() < self.next_position + self.interval:
+            offset = file_object.tell()
+            line = file_object.readline()
+            if not line.endswith(b'\n'):
+                return False
+
+            timestamp_key = get_line_timestamp_key(line)
+            if timestamp_key is not None:
+                # Keep the timestamps in ascending order, even if the clock went back
+                if self.timestamps and timestamp_key < self.timestamps[-1]:
+                    timestamp_key = self.timestamps[-1]
+                self.timestamps.append(timestamp_key)
+                self.offsets.append(offset)
+                break
+
+        return True
+
+    def get_offset(self, timestamp):
+        """Get the offset from which the lines logged from the specified time have to be searched.
+
+        The index is updated before searching the offset. The returned offset is the one of the last sample older than
+        the timestamp, so some older lines could be read before the searched ones (see skip_lines_before).
+
+        Args:
+            timestamp (str or datetime): Timestamp, with the Fortishield logs format if it is a string.
+
+        Returns:
+            int: Offset of a line not newer than the first line logged from the specified time.
+        """
+        self.update()
+        sample_index = bisect_left(self.timestamps, get_timestamp_key(timestamp)) - 1
+
+        return self.offsets[sample_index] if sample_index >= 0 else 0
@@ -4,6 +4,24 @@ Module to build a tool that allow us to check if a file contains a sequence of s
 For example, if we want to check that a file contains first line 1 and then line 2, this tool is useful, because if
 line 2 appears first and then line 1, or either of them does not appear, an exception will be generated.
 
+The file is read as a stream in a single pass (its content is never fully loaded in memory), the patterns are compiled
+only once and the search stops as soon as all the patterns have been found. When the order is not checked, the pending
+patterns are merged in a PatternSet, so each line is scanned once regardless of the number of patterns, and all the
+missing patterns are reported at once.
+
+With a checkpoint (see file_checkpoint module), the search starts where the previous one using the same checkpoint
+stopped, and the reached offset is saved when it finishes. A final line without line break is still being written, so
+it is checked again by the next search. If the search fails, the patterns already found are saved as the checkpoint
+state, so that a new search of the same patterns from the checkpoint only looks for the missing ones (after the found
+ones, if the order is checked).
+
+With the reverse parameter, the file is read backwards from its end in large blocks, searching the patterns from the
+last one to the first one. The result is the same as the forward search, but it finishes much sooner when the
+patterns are logged near the end of the file, for example, when checking the most recent events of a big log.
+
+With the since parameter, only the lines logged from that time are checked. The position of the first of them is
+found with a sparse timestamp index (see file_index module), so the older content of the file is not read.
+
 >Note: It is important to note that this tool does not monitor, but has to be launched once the logs have been produced.
 
 This module contains the following:
@@ -13,31 +31,61 @@ This module contains the following:
 
 import re
 import os
-from collections import deque
 
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError, ValidationError
+from fortishield_qa_framework.generic_modules.file.file import get_file_encoding, is_ascii_compatible_encoding, \
+    read_lines, read_lines_reverse
+from fortishield_qa_framework.generic_modules.tools.pattern_set import PatternSet
+from fortishield_qa_framework.generic_modules.tools.file_checkpoint import FileCheckpoint
+from fortishield_qa_framework.generic_modules.tools.file_index import LogTimestampIndex, get_timestamp_key, \
+    skip_lines_before
 
 
 class FileRegexChecker:
     """Class to check if a file contains the specified patterns.
 
     Args:
-        patterns (str): File path to check.
+        file (str): File path to check.
         patterns (list(str)): List of patterns in string format to search.
         check_order (boolean): True to take into account the patterns list order, False otherwise.
+        encoding (str): File encoding. If it is not specified, it will be detected. The bytes that can not be decoded
+            are replaced, so that they do not stop the search.
+        checkpoint (FileCheckpoint or str): Checkpoint (or its file path) to resume the search from the offset
+            reached by a previous one. The file encoding must be ASCII compatible.
+        reverse (boolean): True to read the file from its end, False to read it from its beginning. The files whose
+            encoding is not ASCII compatible are always read from their beginning.
+        since (str or datetime): Only check the lines logged from this time. Format: 2023/02/14 09:49:47. The file
+            encoding must be ASCII compatible.
+        timestamp_index (LogTimestampIndex or str): Timestamp index (or the path of its index file) used to find the
+            lines logged from the since time. If it is not specified, a new one is built in memory.
 
     Attributes:
-        patterns (str): File path to check.
+        file (str): File path to check.
         patterns (list(str)): List of patterns in string format to search.
         check_order (boolean): True to take into account the patterns list order, False otherwise.
+        encoding (str): File encoding.
+        checkpoint (FileCheckpoint): Checkpoint to resume the search from, or None.
+        reverse (boolean): True to read the file from its end, False to read it from its beginning.
+        since (str or datetime): Only check the lines logged from this time, or None to check all of them.
+        timestamp_index (LogTimestampIndex): Timestamp index used to find the lines logged from the since time.
+        regexes (list(re.Pattern)): Compiled regex of each pattern.
     """
 
-    def __init__(self, file, patterns, check_order=True):
+    def __init__(self, file, patterns, check_order=True, encoding=None, checkpoint=None, reverse=False, since=None,
+                 timestamp_index=None):
         self.file = file
         self.patterns = patterns
         self.check_order = check_order
+        self.encoding = encoding
+        self.checkpoint = FileCheckpoint(checkpoint) if isinstance(checkpoint, str) else checkpoint
+        self.reverse = reverse
+        self.since = since
+        self.timestamp_index = timestamp_index
+        self.__offset = 0
+        self.__found_indexes = []
 
         self.__validate_parameters()
+        self.regexes = [re.compile(rf"{pattern}") for pattern in self.patterns]
         self.__start()
 
     def __validate_parameters(self):
@@ -61,37 +109,156 @@ class FileRegexChecker:
         if not os.access(self.file, os.R_OK):
             raise ValidationError(f"{self.file} is not readable")
 
+        # Check that the checkpoint is not used with the reverse search, which does not reach an offset to resume from
+        if self.checkpoint is not None and self.reverse:
+            raise ValidationError('Checkpoints can not be used with the reverse search')
+
+        # Check that the search start is not set by more than one parameter
+        if self.since is not None and (self.checkpoint is not None or self.reverse):
+            raise ValidationError('The since parameter can not be used with checkpoints or the reverse search')
+
+        if self.since is not None:
+            # Check the since timestamp format
+            get_timestamp_key(self.since)
+            if not isinstance(self.timestamp_index, LogTimestampIndex):
+                self.timestamp_index = LogTimestampIndex(self.file, index_file=self.timestamp_index)
+
+    def __read_lines(self, file_object):
+        """Read the file lines as a stream.
+
+        Files with an ASCII compatible encoding are read in large binary chunks and split in bulk, decoding each line
+        and keeping the byte offset of the end of the last complete line read. Otherwise, the file is read in text mode
+        line by line.
+
+        Args:
+            file_object (file): Opened file, in binary mode if the encoding is ASCII compatible.
+
+        Yields:
+            str: File line.
+        """
+        if 'b' not in file_object.mode:
+            yield from file_object
+            return
+
+        for line in read_lines(file_object):
+            # A line without line break is still being written, so the offset is not moved past it
+            if line.endswith(b'\n'):
+                self.__offset += len(line)
+            yield line.decode(self.encoding, errors='replace')
+
     def __start(self):
         """Start the search process.
 
         Raises:
-            ElementNotFoundError: If the pattern was not found in file or was not in order (if selected).
+            ValidationError: If a checkpoint is used with a file whose encoding is not ASCII compatible.
+        """
+        if self.encoding is None:
+            self.encoding = get_file_encoding(self.file)
+
+        binary = is_ascii_compatible_encoding(self.encoding)
+        if (self.checkpoint is not None or self.since is not None) and not binary:
+            raise ValidationError(f"Checkpoints and the since parameter can not be used with {self.encoding} encoded "
+                                  'files')
+
+        with open(self.file, 'rb') if binary else open(self.file, encoding=self.encoding, errors='replace') as _file:
+            found_indexes = []
+            if self.checkpoint is not None:
+                self.__offset = self.checkpoint.get_offset(_file)
+                _file.seek(self.__offset)
+                found_indexes = self.__get_checkpoint_found_indexes()
+            elif self.since is not None:
+                self.__offset = self.timestamp_index.get_offset(self.since)
+                _file.seek(self.__offset)
+
+            try:
+                if self.reverse and binary:
+                    self.__search((line.decode(self.encoding, errors='replace') for line in read_lines_reverse(_file)),
+                                  reverse=True)
+                elif self.since is not None:
+                    self.__search(skip_lines_before(self.__read_lines(_file), get_timestamp_key(self.since)))
+                else:
+                    self.__search(self.__read_lines(_file), found_indexes=found_indexes)
+            finally:
+                if self.checkpoint is not None:
+                    state = {'patterns': self.patterns, 'check_order': self.check_order,
+                             'found_indexes': self.__found_indexes} if self.__found_indexes else {}
+                    self.checkpoint.update(_file, self.__offset, state)
+
+    def __get_checkpoint_found_indexes(self):
+        """Get the patterns found before the checkpoint offset by a previous failed search of the same patterns.
+
+        Returns:
+            list(int): Indexes of the found patterns. Empty if the checkpoint state is from another search.
         """
-        queue_data = deque()
+        state = self.checkpoint.state
+        if state.get('patterns') != self.patterns or state.get('check_order') != self.check_order:
+            return []
 
-        # Read the file content and save every line into a queue data structure
-        with open(self.file) as _file:
-            for line in _file.readlines():
-                queue_data.append(line)
+        return state.get('found_indexes', [])
 
+    def __search(self, lines, reverse=False, found_indexes=()):
+        """Search the patterns in the file lines.
+
+        If the search fails, the indexes of the patterns found in the complete lines are kept, to save them in the
+        checkpoint.
+
+        Args:
+            lines (iterator(str)): File lines.
+            reverse (boolean): True if the lines are read from the end of the file, so the patterns order is reversed.
+            found_indexes (list(int)): Indexes of the patterns already found before the lines. If the order is checked,
+                they must be the first ones.
+
+        Raises:
+            ElementNotFoundError: If the pattern was not found in file or was not in order (if selected). When the order
+                is not checked, all the missing patterns are reported.
+        """
+        line = '\n'
         if self.check_order:
-            # Check that every pattern is found in the file content in order.
-            for pattern in self.patterns:
-                pattern_found = False
-                while len(queue_data) > 0:
-                    line = queue_data.popleft()
-
-                    if re.match(rf"{pattern}", line):
-                        pattern_found = True
-                        break
-
-                if len(queue_data) == 0 and not pattern_found:
-                    raise ElementNotFoundError(f"The pattern {pattern} was not found in {self.file}")
+            # Check that every pattern is found in the file content in order. Each line can only match one pattern.
+            pattern_indexes = list(range(len(self.regexes)))
+            if reverse:
+                pattern_indexes.reverse()
+
+            position = len(found_indexes)
+            line_matched = False
+            for line in lines:
+                line_matched = self.regexes[pattern_indexes[position]].match(line) is not None
+                if line_matched:
+                    position += 1
+                    if position == len(pattern_indexes):
+                        return
+
+            # A line without line break will be checked again, so its match is not kept
+            self.__found_indexes = pattern_indexes[:position - (line_matched and not line.endswith('\n'))]
+
+            raise ElementNotFoundError(f"The pattern {self.patterns[pattern_indexes[position]]} was not found in "
+                                       f"{self.file}")
         else:
-            # Check that every pattern is found in the file content.
-            for pattern in self.patterns:
-                for line in queue_data:
-                    if re.match(rf"{pattern}", line):
-                        break
-                else:
-                    raise ElementNotFoundError(f"The pattern {pattern} was not found in {self.file}")
+            # Check that every pattern is found in the file content, discarding the patterns already found. The pending
+            # patterns are matched with a single scan of each line. The set is rebuilt when half of them have been
+            # found, so that the found patterns do not keep being evaluated.
+            pending_indexes = set(range(len(self.regexes))).difference(found_indexes)
+            set_indexes = sorted(pending_indexes)
+            pattern_set = PatternSet(self.regexes[index].pattern for index in set_indexes)
+            line_indexes = ()
+            for line in lines:
+                matches = pattern_set.match(line)
+                if not matches:
+                    line_indexes = ()
+                    continue
+
+                line_indexes = {set_indexes[position] for position in matches} & pending_indexes
+                pending_indexes.difference_update(line_indexes)
+                if not pending_indexes:
+                    return
+
+                if len(pending_indexes) <= len(set_indexes) // 2:
+                    set_indexes = sorted(pending_indexes)
+                    pattern_set = PatternSet(self.regexes[index].pattern for index in set_indexes)
+
+            # A line without line break will be checked again, so its matches are not kept
+            if not line.endswith('\n'):
+                pending_indexes.update(line_indexes)
+            self.__found_indexes = sorted(set(range(len(self.regexes))) - pending_indexes)
+            missing_patterns = [self.patterns[index] for index in sorted(pending_indexes)]
+            raise ElementNotFoundError(f"The patterns {missing_patterns} were not found in {self.file}")
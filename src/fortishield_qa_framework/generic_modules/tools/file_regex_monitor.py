@@ -7,6 +7,35 @@ callback is not matched, a TimeoutError exception will be raised.
 
 The monitoring will start as soon as the object is created. We don't need to do anymore.
 
+While waiting for new lines, the monitor blocks on a wakeup backend (see file_watcher module) instead of sleeping a
+fixed time, so that it reacts as soon as the file is modified. When the file is rotated or truncated while waiting, the
+new content is read from its beginning.
+
+When there are new lines, all the available ones are read in bulk and processed in batches, checking the timeout once
+per batch instead of once per line, so the monitor keeps up with files written at high rates (like the debug logs of
+remoted).
+
+When many monitors watch the same file, they can share a single reader (see file_tailer module) with the shared_tailer
+parameter, so that each line is read only once regardless of the number of monitors.
+
+With the binary parameter, files with an ASCII compatible encoding are read as bytes in large chunks and the lines are
+matched with a bytes regex, so they are not decoded (only the lines passed to a custom callback are decoded). With the
+default callback, the chunks that do not contain the literal text required by the pattern are skipped entirely. A bytes
+regex would match the non ASCII characters byte by byte (for example, '.' would match a single byte of a UTF-8
+character), so the lines with non ASCII characters are decoded and matched with the text regex, and the patterns with
+non ASCII characters are always matched in text mode.
+
+With a checkpoint (see file_checkpoint module), the check of the current file content starts where the previous
+monitor using the same checkpoint stopped, and the reached offset is saved when the monitoring finishes. A final line
+without line break is still being written, so the saved offset is the one of its beginning and it is checked again.
+
+With the match_records parameter, every match is recorded (see match_records module) with the offset and number of the
+matching line, the time when it was matched and its captured groups, so they can be checked without reading the file
+again.
+
+With the since parameter, the check of the current file content starts with the lines logged from that time, whose
+position is found with a sparse timestamp index (see file_index module).
+
 This module contains the following:
 
 - FileRegexMonitor
@@ -15,9 +44,23 @@ This module contains the following:
 import os
 import re
 import time
+from itertools import islice
 
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError, TimeoutError
-from fortishield_qa_framework.generic_modules.file.file import get_file_encoding
+from fortishield_qa_framework.generic_modules.file.file import get_file_encoding, is_ascii_compatible_encoding, \
+    read_lines, get_file_change, FILE_ROTATED, FILE_TRUNCATED, FILE_REMOVED
+from fortishield_qa_framework.generic_modules.tools.file_watcher import get_file_watcher, AUTO_BACKEND, \
+    WAKEUP_BACKENDS, DEFAULT_POLLING_INTERVAL
+from fortishield_qa_framework.generic_modules.tools.file_tailer import FileTailer
+from fortishield_qa_framework.generic_modules.tools.pattern_set import get_required_literal
+from fortishield_qa_framework.generic_modules.tools.file_checkpoint import FileCheckpoint
+from fortishield_qa_framework.generic_modules.tools.match_records import MatchRecords
+from fortishield_qa_framework.generic_modules.tools.file_index import LogTimestampIndex, get_timestamp_key, \
+    get_line_timestamp_key
+
+
+# Number of lines processed between two checks of the timeout
+LINES_PER_BATCH = 10000
 
 
 class MonitoringObject:
@@ -39,6 +82,7 @@ class MonitoringObject:
         regex (re): Regex created with the prefix and pattern.
         monitored_file (str): File path to monitor.
         callback (function): Callback function that will be evaluated for each log line.
+        uses_default_callback (boolean): True if the callback is the default one (regex match), False otherwise.
         timeout (int): Max time to monitor and trigger the callback.
     """
     def __init__(self, description=None, pattern='.*', prefix='.*', timeout=1, monitored_file=None, callback=None):
@@ -48,9 +92,11 @@ class MonitoringObject:
         self.prefix = prefix
         self.complete_pattern = pattern if prefix is None else fr'{prefix}{pattern}'
         self.regex = re.compile(self.complete_pattern)
+        self.__bytes_regexes = {}
         self.timeout = timeout
         self.monitored_file = monitored_file
         self.callback = callback if callback else self.get_default_callback()
+        self.uses_default_callback = not callback
         self.description = description if description else self.get_default_description()
 
     def __str__(self):
@@ -100,6 +146,32 @@ class MonitoringObject:
         """
         return lambda line: self.regex.match(line.decode() if isinstance(line, bytes) else line) is not None
 
+    def get_bytes_regex(self, encoding='utf-8'):
+        """Get the monitoring regex compiled as bytes regex, to match lines without decoding them.
+
+        It only matches the same lines as the text regex if both the pattern and the lines are ASCII.
+
+        Args:
+            encoding (str): Encoding of the lines to match. It must be ASCII compatible.
+
+        Returns:
+            re.Pattern: Bytes regex created with the prefix and pattern.
+        """
+        if encoding not in self.__bytes_regexes:
+            self.__bytes_regexes[encoding] = re.compile(self.complete_pattern.encode(encoding))
+
+        return self.__bytes_regexes[encoding]
+
+    def matches_bytes(self):
+        """Check if the ASCII lines can be matched with the bytes regex, instead of decoding them.
+
+        The non ASCII characters of the pattern would be matched byte by byte, so the pattern must be ASCII.
+
+        Returns:
+            boolean: True if the default callback can be replaced by a bytes regex match, False otherwise.
+        """
+        return self.uses_default_callback and self.complete_pattern.isascii()
+
     def get_default_description(self):
         """Get the default monitoring description.
 
@@ -121,6 +193,19 @@ class FileRegexMonitor:
         accumulations (int): Number of expected times to match with the callback.
         only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
         error_message (str): Error message to show if the timeout exception is raised.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+        shared_tailer (boolean): True for reading the file through the tailer shared with other monitors.
+        binary (boolean): True for reading and matching the lines as bytes when the file encoding and the monitoring
+            pattern (it must be ASCII with the default callback) allow it.
+        checkpoint (FileCheckpoint or str): Checkpoint (or its file path) to resume the monitoring from the offset
+            reached by a previous one. The file encoding must be ASCII compatible.
+        match_records (MatchRecords or boolean): Container where the matches are recorded, or True to create a new
+            one. Passing the container allows getting the records even if the timeout exception is raised. The file
+            encoding must be ASCII compatible.
+        since (str or datetime): Only check the current file content logged from this time (only_new_events must be
+            False). Format: 2023/02/14 09:49:47. The file encoding must be ASCII compatible.
+        timestamp_index (LogTimestampIndex or str): Timestamp index (or the path of its index file) used to find the
+            lines logged from the since time. If it is not specified, a new one is built in memory.
 
     Attributes:
         monitored_file (str): File path to monitor.
@@ -129,15 +214,42 @@ class FileRegexMonitor:
         accumulations (int): Number of expected times to match with the callback.
         only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
         error_message (str): Error message to show if the timeout exception is raised.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+        shared_tailer (boolean): True for reading the file through the tailer shared with other monitors.
+        binary (boolean): True for reading and matching the lines as bytes when the file encoding and the monitoring
+            pattern allow it.
+        checkpoint (FileCheckpoint): Checkpoint to resume the monitoring from, or None.
+        match_records (MatchRecords): Records of the matches, or None if they are not recorded. The offsets are absolute
+            positions in the file being read (in the new file after a rotation). The line numbers are relative to the
+            reading start (the beginning of the file, the checkpoint offset or the end of the file with
+            only_new_events), and they start again after a rotation or truncation.
+        since (str or datetime): Only check the current file content logged from this time, or None.
+        timestamp_index (LogTimestampIndex): Timestamp index used to find the lines logged from the since time.
         callback_result (*): It will store the result returned by the callback call if it is not None.
     """
 
-    def __init__(self, monitoring, accumulations=1, only_new_events=False, error_message=None):
+    def __init__(self, monitoring, accumulations=1, only_new_events=False, error_message=None,
+                 wakeup_backend=AUTO_BACKEND, shared_tailer=False, binary=False, checkpoint=None, match_records=None,
+                 since=None, timestamp_index=None):
         self.monitoring = monitoring
         self.accumulations = accumulations
         self.only_new_events = only_new_events
         self.error_message = error_message
+        self.wakeup_backend = wakeup_backend
+        self.shared_tailer = shared_tailer
+        self.binary = binary
+        self.checkpoint = FileCheckpoint(checkpoint) if isinstance(checkpoint, str) else checkpoint
+        self.match_records = MatchRecords() if match_records is True else None if match_records is False \
+            else match_records
+        self.since = since
+        self.timestamp_index = timestamp_index
         self.callback_result = None
+        self.__matches = 0
+        self.__offset = 0
+        self.__checkpoint_offset = 0
+        self.__line_number = 0
+        self.__encoding = None
+        self.__match_bytes = False
 
         self.__validate_parameters()
         self.__start()
@@ -156,47 +268,298 @@ class FileRegexMonitor:
         if not os.access(self.monitoring.monitored_file, os.R_OK):
             raise ValidationError(f"{self.monitoring.monitored_file} is not readable")
 
+        # Check that the wakeup backend is valid
+        if self.wakeup_backend not in WAKEUP_BACKENDS:
+            raise ValidationError(f"Wakeup backend {self.wakeup_backend} is not valid. "
+                                  f"Accepted ones: {WAKEUP_BACKENDS}")
+
+        # Check that the checkpoint is not used with the shared tailer, which does not read the file from an offset
+        if self.checkpoint is not None and self.shared_tailer:
+            raise ValidationError('Checkpoints can not be used with the shared tailer')
+
+        # Check that the matches are not recorded with the shared tailer, which does not track the lines offsets
+        if self.match_records is not None and self.shared_tailer:
+            raise ValidationError('Match records can not be used with the shared tailer')
+
+        if self.since is not None:
+            # Check that the since time is only used to check the current file content from a position
+            if self.only_new_events or self.shared_tailer or self.checkpoint is not None:
+                raise ValidationError('The since parameter can not be used with only_new_events, the shared tailer '
+                                      'or checkpoints')
+
+            # Check the since timestamp format
+            get_timestamp_key(self.since)
+            if not isinstance(self.timestamp_index, LogTimestampIndex):
+                self.timestamp_index = LogTimestampIndex(self.monitoring.monitored_file,
+                                                         index_file=self.timestamp_index)
+
+    def __get_timeout_message(self):
+        """Get the message of the timeout exception.
+
+        Returns:
+            str: Timeout exception message.
+        """
+        return f"Events from {self.monitoring.monitored_file} did not match with the callback" + \
+            f" from {self.monitoring}" if self.error_message is None else self.error_message
+
+    def __process_line(self, evaluate, line):
+        """Evaluate a line and count the match.
+
+        Args:
+            evaluate (function): Function that returns the callback result of a line.
+            line (str or bytes): File line.
+
+        Returns:
+            boolean: True if the callback has been triggered the expected times, False otherwise.
+        """
+        callback_result = evaluate(line)
+        self.callback_result = callback_result if callback_result is not None else self.callback_result
+        self.__matches = self.__matches + 1 if callback_result else self.__matches
+
+        if callback_result and self.match_records is not None:
+            self.__record_match(line, callback_result)
+
+        return self.__matches >= self.accumulations
+
+    def __record_match(self, line, callback_result):
+        """Record a match with the offset and number of the line, the current time and the captured groups.
+
+        The groups are the ones captured by the monitoring regex with the default callback, and the callback result
+        (if it is a tuple) with a custom one.
+
+        Args:
+            line (bytes): Matching line.
+            callback_result (*): Result returned by the callback.
+        """
+        if not self.monitoring.uses_default_callback:
+            groups = callback_result if isinstance(callback_result, tuple) else ()
+        elif self.__match_bytes and line.isascii():
+            groups = tuple(group if group is None else group.decode(self.__encoding, errors='replace')
+                           for group in self.monitoring.get_bytes_regex(self.__encoding).match(line).groups())
+        else:
+            groups = self.monitoring.regex.match(line.decode(self.__encoding, errors='replace')).groups()
+
+        self.match_records.append(self.__offset - len(line), self.__line_number, time.time(), groups)
+
+    def __get_binary_evaluator(self, encoding):
+        """Get the function that evaluates the lines read as bytes.
+
+        In binary mode, the default callback is replaced by a bytes regex match, so the ASCII lines are not decoded.
+        Otherwise, the callback receives the decoded line.
+
+        Args:
+            encoding (str): File encoding.
+
+        Returns:
+            function: Function that returns the callback result of a bytes line.
+        """
+        if self.__match_bytes:
+            regex = self.monitoring.get_bytes_regex(encoding)
+            text_regex = self.monitoring.regex
+            return lambda line: (regex.match(line) if line.isascii() else
+                                 text_regex.match(line.decode(encoding, errors='replace'))) is not None
+
+        return lambda line: self.monitoring.callback(line.decode(encoding, errors='replace'))
+
     def __start(self):
         """Start the file regex monitoring"""
-        matches = 0
+        if self.shared_tailer:
+            self.__start_shared()
+            return
+
         encoding = get_file_encoding(self.monitoring.monitored_file)
+        self.__encoding = encoding
+        # The lines are read as bytes to know their offsets when using a checkpoint or recording the matches
+        track_offsets = self.checkpoint is not None or self.match_records is not None
+        # The default callback is replaced by a bytes regex only if it matches like the text one, otherwise the lines
+        # are read as text (unless their offsets are tracked)
+        read_bytes = self.binary and (self.monitoring.matches_bytes() or not self.monitoring.uses_default_callback)
+        binary = (read_bytes or track_offsets) and is_ascii_compatible_encoding(encoding)
+        self.__match_bytes = binary and self.binary and self.monitoring.matches_bytes()
+        if (track_offsets or self.since is not None) and not is_ascii_compatible_encoding(encoding):
+            raise ValidationError(f"Checkpoints, match records and the since parameter can not be used with {encoding} "
+                                  'encoded files')
+
+        evaluate = self.__get_binary_evaluator(encoding) if binary else self.monitoring.callback
+        open_parameters = {'mode': 'rb'} if binary else {'encoding': encoding, 'errors': 'replace'}
+        # Literal that the matching lines must contain, used to skip the chunks without it. The skipped chunks would
+        # not be counted in the offsets.
+        required = get_required_literal(self.monitoring.get_bytes_regex(encoding).pattern) \
+            if self.__match_bytes and not track_offsets else None
+
         # Check if current file content lines triggers the callback (only when new events has False value)
         if not self.only_new_events:
-            with open(self.monitoring.monitored_file, encoding=encoding) as _file:
-                for line in _file:
-                    callback_result = self.monitoring.callback(line)
-                    self.callback_result = callback_result if callback_result is not None else self.callback_result
-                    matches = matches + 1 if callback_result else matches
-                    if matches >= self.accumulations:
-                        return
+            with open(self.monitoring.monitored_file, **open_parameters) as _file:
+                if self.checkpoint is not None:
+                    self.__offset = self.__checkpoint_offset = self.checkpoint.get_offset(_file)
+                    _file.seek(self.__offset)
+                elif self.since is not None:
+                    self.__offset = self.timestamp_index.get_offset(self.since)
+                    _file.seek(self.__offset)
+
+                # The lines logged before the since time are skipped, the ones without timestamp too
+                since_key = get_timestamp_key(self.since) if self.since is not None else None
+
+                try:
+                    for line in read_lines(_file, required=required) if binary else _file:
+                        self.__offset += len(line)
+                        self.__line_number += 1
+                        # A line without line break is still being written, so the checkpoint is not moved past it
+                        if self.checkpoint is not None and line.endswith(b'\n'):
+                            self.__checkpoint_offset = self.__offset
+                        if since_key is not None:
+                            line_timestamp_key = get_line_timestamp_key(line)
+                            if line_timestamp_key is None or line_timestamp_key < since_key:
+                                continue
+                            since_key = None
+
+                        if self.__process_line(evaluate, line):
+                            return
+                finally:
+                    self.__update_checkpoint(_file)
 
         # Start count to set the timeout
         start_time = time.time()
 
-        # Start the file regex monitoring from the last line
-        with open(self.monitoring.monitored_file, encoding=encoding) as _file:
-            # Go to the end of the file
-            _file.seek(0, 2)
+        self.__tail(evaluate, open_parameters, binary, required, track_offsets, start_time)
+
+    def __tail(self, evaluate, open_parameters, binary, required, track_offsets, start_time):
+        """Check the new lines of the file until the callback is triggered the expected times or the timeout expires.
+
+        If the file is rotated, the new one is opened and read from its beginning, and if it is truncated, it is read
+        again from its beginning. The content already read is not checked again.
+
+        Args:
+            evaluate (function): Function that returns the callback result of a line.
+            open_parameters (dict): Parameters to open the file.
+            binary (boolean): True if the file is opened in binary mode, False otherwise.
+            required (bytes): Literal that the matching lines must contain, or None.
+            track_offsets (boolean): True if the offsets of the lines are tracked, False otherwise.
+            start_time (float): Monitoring start time.
+
+        Raises:
+            TimeoutError: If the callback has not been triggered the expected times before the timeout.
+        """
+        _file = None
+        watcher = None
+
+        try:
+            # Start the file regex monitoring from the last line. The watcher is created before going to the end of the
+            # file, so that any change made from that moment will wake it up.
+            _file = open(self.monitoring.monitored_file, **open_parameters)
+            watcher = get_file_watcher(self.monitoring.monitored_file, self.wakeup_backend)
+
+            # Go to the end of the file. When the offsets are tracked, continue from the last checked line, so that the
+            # lines written meanwhile are not missed
+            if track_offsets and not self.only_new_events:
+                _file.seek(self.__offset)
+            else:
+                self.__offset = self.__checkpoint_offset = _file.seek(0, 2)
+
+            lines = None
+
             while True:
-                current_position = _file.tell()
-                line = _file.readline()
-                # If we have not new changes wait for the next try
-                if not line:
-                    _file.seek(current_position)
-                    time.sleep(0.1)
-                # If we have a new line, check if it matches with the callback
+                # Read all the available lines in bulk, in batches of lines
+                if lines is None:
+                    lines = read_lines(_file, required=required) if binary else iter(_file)
+                batch = list(islice(lines, LINES_PER_BATCH))
+                if len(batch) < LINES_PER_BATCH:
+                    lines = None
+
+                for line in batch:
+                    self.__offset += len(line)
+                    self.__line_number += 1
+                    if self.checkpoint is not None and line.endswith(b'\n'):
+                        self.__checkpoint_offset = self.__offset
+                    # If the line has triggered the callback the expected times, leave the loop
+                    if self.__process_line(evaluate, line):
+                        return
+
+                # If we have not new changes, check if the file has been rotated or truncated. Otherwise, wait until
+                # the file changes or the timeout expires
+                if batch:
+                    watcher.reset()
                 else:
-                    callback_result = self.monitoring.callback(line)
-                    self.callback_result = callback_result if callback_result is not None else self.callback_result
-                    matches = matches + 1 if callback_result else matches
-                    # If it has triggered the callback the expected times, break and leave the loop
-                    if matches >= self.accumulations:
-                        break
-
-                # Add the time processing time
+                    current_position = _file.tell()
+                    # Go back to the last position, so that the text decoder state matches it (for example, a UTF-16
+                    # decoder after going to the end of the file would expect a BOM)
+                    if not binary:
+                        _file.seek(current_position)
+
+                    file_change = get_file_change(_file, self.monitoring.monitored_file, current_position)
+                    remaining_time = self.monitoring.timeout - (time.time() - start_time)
+
+                    if file_change == FILE_ROTATED:
+                        watcher, _file = self.__reopen(watcher, _file, open_parameters)
+                    elif file_change == FILE_TRUNCATED:
+                        self.__offset = self.__checkpoint_offset = _file.seek(0)
+                        self.__line_number = 0
+                    elif file_change == FILE_REMOVED:
+                        # The watcher would not notice the creation of the new file, so it is checked periodically
+                        watcher.wait(min(DEFAULT_POLLING_INTERVAL, remaining_time))
+                    else:
+                        watcher.wait(remaining_time)
+
+                # Add the time processing time. It is checked once per batch of lines
                 elapsed_time = time.time() - start_time
 
                 # Raise timeout error if we have passed the timeout
                 if elapsed_time > self.monitoring.timeout:
-                    raise TimeoutError(f"Events from {self.monitoring.monitored_file} did not match with the callback" +
-                                       f" from {self.monitoring}" if self.error_message is None else self.error_message)
+                    raise TimeoutError(self.__get_timeout_message())
+        finally:
+            if _file is not None:
+                self.__update_checkpoint(_file)
+                _file.close()
+            if watcher is not None:
+                watcher.close()
+
+    def __reopen(self, watcher, file_object, open_parameters):
+        """Open the new file after a rotation, closing the previous one and its watcher.
+
+        Args:
+            watcher (FileWatcher): Watcher of the previous file.
+            file_object (file): Previous opened file.
+            open_parameters (dict): Parameters to open the file.
+
+        Returns:
+            FileWatcher, file: Watcher and opened file to use. The previous ones if the new file does not exist yet.
+        """
+        try:
+            new_file = open(self.monitoring.monitored_file, **open_parameters)
+        except FileNotFoundError:
+            return watcher, file_object
+
+        try:
+            new_watcher = get_file_watcher(self.monitoring.monitored_file, self.wakeup_backend)
+        except Exception:
+            new_file.close()
+            raise
+
+        watcher.close()
+        file_object.close()
+        self.__offset = self.__checkpoint_offset = 0
+        self.__line_number = 0
+
+        return new_watcher, new_file
+
+    def __update_checkpoint(self, file_object):
+        """Save the offset of the end of the last complete line read in the checkpoint, if it is used.
+
+        Args:
+            file_object (file): Opened file.
+        """
+        if self.checkpoint is not None:
+            self.checkpoint.update(file_object, self.__checkpoint_offset)
+
+    def __start_shared(self):
+        """Start the file regex monitoring through the tailer shared by all the monitors of the file."""
+        tailer = FileTailer.get_tailer(self.monitoring.monitored_file, self.wakeup_backend)
+        subscription = tailer.subscribe(self.monitoring, self.accumulations, self.only_new_events)
+
+        finished = subscription.wait(self.monitoring.timeout)
+        tailer.unsubscribe(subscription)
+        self.callback_result = subscription.callback_result
+
+        # The subscription could have finished between the timeout and the unsubscription
+        if not finished and not subscription.finished.is_set():
+            raise TimeoutError(self.__get_timeout_message())
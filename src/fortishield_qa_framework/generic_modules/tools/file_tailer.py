@@ -0,0 +1,401 @@
+"""
+Module to build a tool that reads a file once and sends every new line to many monitoring objects.
+
+When several monitors watch the same file, each of them opens, seeks and reads the file on its own, so every line is
+read and decoded once per monitor. The FileTailer reads each file only once in a background thread and dispatches
+every line to all the registered subscriptions, each one with its own accumulations, timeout and result.
+
+The subscriptions that use the default callback are evaluated together through a MonitoringObjectSet, so each line is
+scanned once for all of them instead of once per subscription.
+
+The tailer thread is started when the first subscription is registered and it is stopped when there are no more
+subscriptions, so an idle tailer does not keep the file opened. When the file is rotated or truncated, the new content
+is read from its beginning and sent to all the subscriptions.
+
+This module contains the following:
+
+- TailSubscription:
+    - process_line
+    - process_result
+    - wait
+- FileTailer:
+    - get_tailer
+    - subscribe
+    - unsubscribe
+"""
+
+import os
+import threading
+
+from fortishield_qa_framework.generic_modules.file.file import get_file_encoding, get_file_change, FILE_ROTATED, \
+    FILE_TRUNCATED, FILE_REMOVED
+from fortishield_qa_framework.generic_modules.tools.file_watcher import get_file_watcher, AUTO_BACKEND, \
+    DEFAULT_POLLING_INTERVAL
+from fortishield_qa_framework.generic_modules.tools.pattern_set import MonitoringObjectSet
+
+
+# Max seconds that the tailer thread waits for changes before checking if it has to stop
+MAX_IDLE_WAIT = 0.5
+
+
+class TailSubscription:
+    """Class to represent a monitoring object registered in a FileTailer.
+
+    Args:
+        monitoring (MonitoringObject): Monitoring object whose callback will be evaluated for each line.
+        accumulations (int): Number of expected times to match with the callback.
+        start_offset (int): File offset from which the lines are sent to this subscription.
+
+    Attributes:
+        monitoring (MonitoringObject): Monitoring object whose callback will be evaluated for each line.
+        accumulations (int): Number of expected times to match with the callback.
+        start_offset (int): File offset from which the lines are sent to this subscription.
+        matches (int): Number of times that the callback has been matched.
+        callback_result (*): It will store the result returned by the callback call if it is not None.
+        exception (Exception): Exception raised while processing the lines, if any.
+        finished (threading.Event): Event set when the expected accumulations are reached or an error happens.
+    """
+    def __init__(self, monitoring, accumulations=1, start_offset=0):
+        self.monitoring = monitoring
+        self.accumulations = accumulations
+        self.start_offset = start_offset
+        self.matches = 0
+        self.callback_result = None
+        self.exception = None
+        self.finished = threading.Event()
+
+    def process_line(self, line):
+        """Evaluate the monitoring callback with the given line.
+
+        Args:
+            line (str): File line.
+
+        Returns:
+            boolean: True if the subscription has finished, False otherwise.
+        """
+        try:
+            callback_result = self.monitoring.callback(line)
+        except Exception as exception:
+            self.exception = exception
+            self.finished.set()
+            return True
+
+        return self.process_result(callback_result)
+
+    def process_result(self, callback_result):
+        """Count the result of evaluating the monitoring callback with a line.
+
+        Args:
+            callback_result (*): Result returned by the callback.
+
+        Returns:
+            boolean: True if the subscription has finished, False otherwise.
+        """
+        self.callback_result = callback_result if callback_result is not None else self.callback_result
+        self.matches = self.matches + 1 if callback_result else self.matches
+
+        if self.matches >= self.accumulations:
+            self.finished.set()
+
+        return self.finished.is_set()
+
+    def wait(self, timeout):
+        """Wait until the subscription finishes.
+
+        Args:
+            timeout (float): Max number of seconds to wait.
+
+        Returns:
+            boolean: True if the subscription has finished, False if the timeout expired.
+
+        Raises:
+            Exception: Exception raised by the callback or by the tailer, if any.
+        """
+        finished = self.finished.wait(timeout)
+
+        if self.exception is not None:
+            raise self.exception
+
+        return finished
+
+
+class FileTailer:
+    """Class to read a file once and dispatch every new line to all the registered subscriptions.
+
+    Use get_tailer to get the tailer shared by all the monitors of the same file.
+
+    Args:
+        file_path (str): File path to tail.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+
+    Attributes:
+        file_path (str): File path to tail.
+        wakeup_backend (str): Backend used to wait for file changes. Enum: [auto, inotify, polling].
+        subscriptions (list(TailSubscription)): Active subscriptions.
+        position (int): Offset of the next line that the tailer will read.
+        running (boolean): True if the tailer thread is running, False otherwise.
+    """
+    _tailers = {}
+    _tailers_lock = threading.Lock()
+
+    def __init__(self, file_path, wakeup_backend=AUTO_BACKEND):
+        self.file_path = file_path
+        self.wakeup_backend = wakeup_backend
+        self.subscriptions = []
+        self.position = 0
+        self.running = False
+        self.lock = threading.Lock()
+        self.__encoding = None
+        self.__file = None
+        self.__generation = 0
+        self.__monitoring_set = None
+        self.__default_subscriptions = []
+        self.__custom_subscriptions = []
+
+    @classmethod
+    def get_tailer(cls, file_path, wakeup_backend=AUTO_BACKEND):
+        """Get the tailer shared by all the monitors of the specified file.
+
+        Args:
+            file_path (str): File path to tail.
+            wakeup_backend (str): Backend used to wait for file changes when the tailer is created.
+
+        Returns:
+            FileTailer: Shared tailer of the file.
+        """
+        key = os.path.realpath(file_path)
+
+        with cls._tailers_lock:
+            if key not in cls._tailers:
+                cls._tailers[key] = cls(key, wakeup_backend)
+
+            return cls._tailers[key]
+
+    def subscribe(self, monitoring, accumulations=1, only_new_events=True):
+        """Register a monitoring object to receive the file lines.
+
+        If only_new_events is False, the lines that the tailer has already read are evaluated in the caller thread
+        before registering it, so the subscription receives the whole file content in order. They are read without
+        holding the tailer lock, so that the other subscriptions keep receiving lines meanwhile. Only the lines read by
+        the tailer during that time are evaluated holding the lock, to hand the subscription over to the tailer.
+
+        Args:
+            monitoring (MonitoringObject): Monitoring object whose callback will be evaluated for each line.
+            accumulations (int): Number of expected times to match with the callback.
+            only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
+
+        Returns:
+            TailSubscription: Registered subscription.
+        """
+        with self.lock:
+            if not self.running:
+                self.__start()
+
+            start_offset = 0 if not only_new_events else os.path.getsize(self.file_path)
+            subscription = TailSubscription(monitoring, accumulations, start_offset)
+
+            if start_offset >= self.position:
+                self.__register(subscription)
+                return subscription
+
+            end_offset = self.position
+            encoding = self.__encoding
+
+        # Evaluate the lines already read by the tailer
+        _file = open(self.file_path, encoding=encoding, errors='replace')
+        try:
+            _file.seek(start_offset)
+            self.__evaluate_lines(_file, subscription, end_offset)
+
+            with self.lock:
+                # The other subscriptions could have finished meanwhile, stopping the tailer
+                if not self.running:
+                    self.__start()
+
+                # If the file has been rotated or truncated meanwhile, the tailer reads the new content from its
+                # beginning
+                if not os.path.samestat(os.fstat(_file.fileno()), os.fstat(self.__file.fileno())) or \
+                        os.fstat(_file.fileno()).st_size < _file.tell():
+                    _file.close()
+                    _file = open(self.file_path, encoding=encoding, errors='replace')
+
+                self.__evaluate_lines(_file, subscription, self.position)
+                subscription.start_offset = self.position
+                self.__register(subscription)
+        finally:
+            _file.close()
+
+        return subscription
+
+    @staticmethod
+    def __evaluate_lines(file_object, subscription, end_offset):
+        """Evaluate the lines of a file with a subscription until an offset or until the subscription finishes.
+
+        Args:
+            file_object (file): File opened at the offset of the first line to evaluate.
+            subscription (TailSubscription): Subscription to evaluate the lines with.
+            end_offset (int): Offset where the evaluation stops.
+        """
+        while file_object.tell() < end_offset and not subscription.finished.is_set():
+            line = file_object.readline()
+            if not line:
+                break
+            subscription.process_line(line)
+
+    def __register(self, subscription):
+        """Add a subscription to the ones that receive the new lines, unless it has finished. It must be called holding
+        the lock.
+
+        Args:
+            subscription (TailSubscription): Subscription to add.
+        """
+        if not subscription.finished.is_set():
+            self.subscriptions.append(subscription)
+            self.__monitoring_set = None
+
+    def unsubscribe(self, subscription):
+        """Remove a subscription from the tailer, stopping it if there are no more subscriptions.
+
+        Args:
+            subscription (TailSubscription): Subscription to remove.
+        """
+        with self.lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+                self.__monitoring_set = None
+
+            if self.running and not self.subscriptions:
+                self.__stop()
+
+    def __start(self):
+        """Open the file from its end and start the tailer thread. It must be called holding the lock."""
+        self.__encoding = get_file_encoding(self.file_path)
+        # The watcher is created before going to the end of the file, so that no change is lost
+        watcher = get_file_watcher(self.file_path, self.wakeup_backend)
+        self.__file = open(self.file_path, encoding=self.__encoding, errors='replace')
+        self.__file.seek(0, 2)
+        self.position = self.__file.tell()
+        self.running = True
+        self.__generation += 1
+
+        threading.Thread(target=self.__run, args=(watcher, self.__generation), daemon=True).start()
+
+    def __stop(self):
+        """Close the file and mark the tailer as stopped. It must be called holding the lock."""
+        self.running = False
+        self.__file.close()
+
+    def __run(self, watcher, generation):
+        """Read the new lines and dispatch them to the subscriptions until there are no more subscriptions.
+
+        Args:
+            watcher (FileWatcher): File watcher owned by this thread.
+            generation (int): Tailer start counter, used to detect that this thread has been replaced by a new one.
+        """
+        try:
+            while True:
+                with self.lock:
+                    if not self.running or generation != self.__generation:
+                        return
+
+                    line = self.__file.readline()
+                    if line:
+                        line_offset = self.position
+                        self.position = self.__file.tell()
+                        self.__dispatch(line, line_offset)
+                        watcher.reset()
+
+                        if not self.subscriptions:
+                            self.__stop()
+                            return
+
+                        continue
+
+                    file_change = get_file_change(self.__file, self.file_path, self.position)
+                    if file_change == FILE_ROTATED:
+                        watcher = self.__reopen(watcher)
+                        continue
+
+                    if file_change == FILE_TRUNCATED:
+                        self.__file.seek(0)
+                        self.__reset_position()
+                        continue
+
+                    self.__file.seek(self.position)
+
+                # The watcher would not notice the creation of a removed file, so it is checked periodically
+                watcher.wait(DEFAULT_POLLING_INTERVAL if file_change == FILE_REMOVED else MAX_IDLE_WAIT)
+        except Exception as exception:
+            with self.lock:
+                if self.running and generation == self.__generation:
+                    for subscription in self.subscriptions:
+                        subscription.exception = exception
+                        subscription.finished.set()
+                    self.subscriptions = []
+                    self.__monitoring_set = None
+                    self.__stop()
+        finally:
+            watcher.close()
+
+    def __reopen(self, watcher):
+        """Open the new file after a rotation, closing the previous one. It must be called holding the lock.
+
+        Args:
+            watcher (FileWatcher): Watcher of the previous file.
+
+        Returns:
+            FileWatcher: Watcher to use. The previous one if the new file does not exist yet.
+        """
+        try:
+            new_file = open(self.file_path, encoding=self.__encoding, errors='replace')
+        except FileNotFoundError:
+            return watcher
+
+        try:
+            new_watcher = get_file_watcher(self.file_path, self.wakeup_backend)
+        except Exception:
+            new_file.close()
+            raise
+
+        watcher.close()
+        self.__file.close()
+        self.__file = new_file
+        self.__reset_position()
+
+        return new_watcher
+
+    def __reset_position(self):
+        """Read the file again from its beginning for all the subscriptions. It must be called holding the lock."""
+        self.position = 0
+        for subscription in self.subscriptions:
+            subscription.start_offset = 0
+
+    def __dispatch(self, line, line_offset):
+        """Send a line to every subscription, removing the finished ones. It must be called holding the lock.
+
+        Args:
+            line (str): File line.
+            line_offset (int): Offset where the line starts.
+        """
+        if self.__monitoring_set is None:
+            self.__default_subscriptions = [subscription for subscription in self.subscriptions
+                                            if subscription.monitoring.uses_default_callback]
+            self.__custom_subscriptions = [subscription for subscription in self.subscriptions
+                                           if not subscription.monitoring.uses_default_callback]
+            self.__monitoring_set = MonitoringObjectSet([subscription.monitoring
+                                                         for subscription in self.__default_subscriptions])
+
+        finished = False
+        for index in self.__monitoring_set.match(line):
+            subscription = self.__default_subscriptions[index]
+            if line_offset >= subscription.start_offset:
+                finished = subscription.process_result(True) or finished
+
+        for subscription in self.__custom_subscriptions:
+            if line_offset >= subscription.start_offset:
+                finished = subscription.process_line(line) or finished
+
+        if finished:
+            self.subscriptions = [subscription for subscription in self.subscriptions
+                                  if not subscription.finished.is_set()]
+            self.__monitoring_set = None
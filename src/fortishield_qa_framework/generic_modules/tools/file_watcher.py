@@ -0,0 +1,264 @@
+"""
+Module to build the wakeup backends used by the monitoring tools to wait until a file changes.
+
+Instead of sleeping a fixed time when there is no new data, the monitoring tools block on a watcher until the monitored
+file is modified or the wait times out. The following backends are available:
+
+- inotify: Event-driven backend based on the Linux inotify API. It wakes up as soon as the file is modified.
+- polling: Fallback backend that sleeps between checks. It is available on every platform. The sleep time starts
+  small and is doubled on each wait without new data (up to the polling interval), so the bursts of lines are read
+  with a low latency and an idle file costs few wakeups.
+
+This module contains the following:
+
+- FileWatcher(ABC):
+    - wait
+    - reset
+    - close
+- PollingFileWatcher(FileWatcher)
+- InotifyFileWatcher(FileWatcher):
+    - is_available
+- get_file_watcher
+"""
+
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+from abc import ABC, abstractmethod
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError, RuntimeError
+
+
+AUTO_BACKEND = 'auto'
+INOTIFY_BACKEND = 'inotify'
+POLLING_BACKEND = 'polling'
+WAKEUP_BACKENDS = [AUTO_BACKEND, INOTIFY_BACKEND, POLLING_BACKEND]
+
+DEFAULT_POLLING_INTERVAL = 0.1
+# First sleep of the polling backend after reading new data
+DEFAULT_MIN_POLLING_INTERVAL = 0.005
+
+
+class FileWatcher(ABC):
+    """Class to wait until a file changes.
+
+    Args:
+        file_path (str): File path to watch.
+
+    Attributes:
+        file_path (str): File path to watch.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @abstractmethod
+    def wait(self, timeout):
+        """Block until the watched file changes or the timeout expires.
+
+        Args:
+            timeout (float): Max number of seconds to wait.
+
+        Returns:
+            boolean: True if the file may have changed, False if the timeout expired without changes.
+        """
+
+    def reset(self):
+        """Notify the watcher that new data has been read from the file."""
+
+    def close(self):
+        """Release the resources used by the watcher."""
+
+
+class PollingFileWatcher(FileWatcher):
+    """Class to sleep between file checks, backing off while the file does not change.
+
+    This backend does not know if the file has really changed, so the caller must always check it after waking up. The
+    first wait sleeps the min interval, and each following one doubles the sleep time up to the interval, until the
+    caller notifies that new data has been read (see reset).
+
+    Args:
+        file_path (str): File path to watch.
+        interval (float): Max seconds to sleep on each wait.
+        min_interval (float): Seconds to sleep on the first wait after new data. The same as interval to sleep a fixed
+            time.
+
+    Attributes:
+        file_path (str): File path to watch.
+        interval (float): Max seconds to sleep on each wait.
+        min_interval (float): Seconds to sleep on the first wait after new data.
+        current_interval (float): Seconds to sleep on the next wait.
+    """
+    def __init__(self, file_path, interval=DEFAULT_POLLING_INTERVAL, min_interval=DEFAULT_MIN_POLLING_INTERVAL):
+        super().__init__(file_path)
+        self.interval = interval
+        self.min_interval = min(min_interval, interval)
+        self.current_interval = self.min_interval
+
+    def wait(self, timeout):
+        """Sleep the current interval (or the timeout if it is lower) and double it for the next wait.
+
+        Args:
+            timeout (float): Max number of seconds to wait.
+
+        Returns:
+            boolean: Always True, the file may have changed.
+        """
+        time.sleep(max(min(self.current_interval, timeout), 0))
+        self.current_interval = min(self.current_interval * 2, self.interval)
+
+        return True
+
+    def reset(self):
+        """Sleep the min interval on the next wait, because the file is being written."""
+        self.current_interval = self.min_interval
+
+
+class InotifyFileWatcher(FileWatcher):
+    """Class to wait until a file changes using the Linux inotify API.
+
+    The watch is registered when the object is created, so every change made after that moment will wake up the next
+    wait call, even if it happened while the caller was processing data.
+
+    Args:
+        file_path (str): File path to watch.
+
+    Attributes:
+        file_path (str): File path to watch.
+        fd (int): Inotify instance file descriptor.
+    """
+    # Events that wake up the watcher: content modified, metadata changed, file moved or deleted (rotation)
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_DELETE_SELF | IN_MOVE_SELF
+
+    _libc = None
+
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.fd = None
+
+        if not InotifyFileWatcher.is_available():
+            raise RuntimeError('The inotify backend is not available in this system')
+
+        libc = InotifyFileWatcher._libc
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise RuntimeError(f"Could not create the inotify instance: {os.strerror(ctypes.get_errno())}")
+
+        if libc.inotify_add_watch(fd, os.fsencode(file_path), InotifyFileWatcher.WATCH_MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(fd)
+            raise RuntimeError(f"Could not watch {file_path} with inotify: {os.strerror(error)}")
+
+        self.fd = fd
+        self.poller = select.poll()
+        self.poller.register(self.fd, select.POLLIN)
+
+    @staticmethod
+    def is_available():
+        """Check if the inotify API can be used in the current system.
+
+        Returns:
+            boolean: True if inotify is available, False otherwise.
+        """
+        if not sys.platform.startswith('linux'):
+            return False
+
+        if InotifyFileWatcher._libc is None:
+            try:
+                InotifyFileWatcher._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            except OSError:
+                return False
+
+        return hasattr(InotifyFileWatcher._libc, 'inotify_init1')
+
+    def fileno(self):
+        """Get the inotify file descriptor, so that it can be used in event loops.
+
+        Returns:
+            int: Inotify instance file descriptor.
+        """
+        return self.fd
+
+    def consume_events(self):
+        """Read and discard the pending inotify events without blocking.
+
+        Returns:
+            boolean: True if there were pending events, False otherwise.
+        """
+        events = False
+        while True:
+            try:
+                if not os.read(self.fd, 4096):
+                    break
+                events = True
+            except BlockingIOError:
+                break
+
+        return events
+
+    def wait(self, timeout):
+        """Block until the watched file changes or the timeout expires.
+
+        Args:
+            timeout (float): Max number of seconds to wait.
+
+        Returns:
+            boolean: True if the file has changed, False if the timeout expired without changes.
+        """
+        if self.poller.poll(max(timeout, 0) * 1000):
+            return self.consume_events()
+
+        return False
+
+    def close(self):
+        """Close the inotify instance."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def get_file_watcher(file_path, backend=AUTO_BACKEND):
+    """Build the file watcher for the specified backend.
+
+    With the auto backend, inotify is used when it is available and the polling backend is used otherwise (also when
+    the inotify instance can not be created, for example when the max_user_instances limit has been reached).
+
+    Args:
+        file_path (str): File path to watch.
+        backend (str): Wakeup backend. Enum: [auto, inotify, polling].
+
+    Returns:
+        FileWatcher: File watcher object.
+
+    Raises:
+        ValidationError: If the backend is not valid.
+        RuntimeError: If the inotify backend was requested and it could not be used.
+    """
+    if backend not in WAKEUP_BACKENDS:
+        raise ValidationError(f"Wakeup backend {backend} is not valid. Accepted ones: {WAKEUP_BACKENDS}")
+
+    if backend == POLLING_BACKEND:
+        return PollingFileWatcher(file_path)
+
+    if backend == INOTIFY_BACKEND:
+        return InotifyFileWatcher(file_path)
+
+    if InotifyFileWatcher.is_available():
+        try:
+            return InotifyFileWatcher(file_path)
+        except RuntimeError:
+            pass
+
+    return PollingFileWatcher(file_path)
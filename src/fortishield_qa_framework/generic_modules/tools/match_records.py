@@ -0,0 +1,77 @@
+"""
+Module to build a compact container of the matches found by a monitor.
+
+Each match is recorded with the byte offset where the matching line starts, its line number, the time when it was
+matched and the captured groups. The numeric fields are stored in arrays instead of one Python object per match, so
+the memory used by a monitor with many accumulations stays low. The MatchRecord tuples are only built when the records
+are accessed.
+
+This module contains the following:
+
+- MatchRecord
+- MatchRecords:
+    - append
+    - clear
+"""
+
+from array import array
+from collections import namedtuple
+
+
+MatchRecord = namedtuple('MatchRecord', ['offset', 'line_number', 'timestamp', 'groups'])
+
+
+class MatchRecords:
+    """Class to store the records of the matches found by a monitor.
+
+    Attributes:
+        offsets (array): Byte offset of the start of each matching line.
+        line_numbers (array): Line number (starting at 1) of each matching line, relative to the reading start.
+        timestamps (array): Time (seconds since the epoch) when each line was matched.
+        groups (list(tuple)): Groups captured from each matching line.
+    """
+    __slots__ = ('offsets', 'line_numbers', 'timestamps', 'groups')
+
+    def __init__(self):
+        self.offsets = array('q')
+        self.line_numbers = array('q')
+        self.timestamps = array('d')
+        self.groups = []
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Get a match record.
+
+        Args:
+            index (int): Record index. Negative values are counted from the end.
+
+        Returns:
+            MatchRecord: Offset, line number, timestamp and groups of the match.
+        """
+        return MatchRecord(self.offsets[index], self.line_numbers[index], self.timestamps[index], self.groups[index])
+
+    def __iter__(self):
+        return map(MatchRecord, self.offsets, self.line_numbers, self.timestamps, self.groups)
+
+    def append(self, offset, line_number, timestamp, groups=()):
+        """Record a match.
+
+        Args:
+            offset (int): Byte offset of the start of the matching line.
+            line_number (int): Line number of the matching line.
+            timestamp (float): Time when the line was matched.
+            groups (tuple): Groups captured from the matching line.
+        """
+        self.offsets.append(offset)
+        self.line_numbers.append(line_number)
+        self.timestamps.append(timestamp)
+        self.groups.append(groups)
+
+    def clear(self):
+        """Remove all the records."""
+        del self.offsets[:]
+        del self.line_numbers[:]
+        del self.timestamps[:]
+        self.groups.clear()
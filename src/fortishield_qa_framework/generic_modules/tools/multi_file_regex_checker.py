@@ -0,0 +1,242 @@
+"""
+Module to build a tool that allow us to check if a set of files (for example, a log and its rotated and compressed
+archives) contains the searched patterns, scanning the files in parallel.
+
+Each file is scanned by a worker of a process pool and the per-file results are merged in the files order:
+
+- When the order is not checked, each worker reports the patterns found in its file, and the search finishes as soon
+  as all of them have been found.
+- When the order is checked, the patterns found in a file depend on the patterns found in the previous ones. So each
+  worker computes, for every possible number of patterns already found, how many of them will have been found at the
+  end of its file. Then the results of the files are chained in order. All the starting points are tracked in the same
+  scan, matching each line against the patterns with a PatternSet only once.
+
+The gzip and bzip2 files are decompressed transparently. The files have to be passed in chronological order, for
+example: ossec.log.2.gz, ossec.log.1, ossec.log.
+
+>Note: It is important to note that this tool does not monitor, but has to be launched once the logs have been produced.
+
+This module contains the following:
+
+- MultiFileRegexChecker
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError, ValidationError
+from fortishield_qa_framework.generic_modules.file.file import open_file, read_lines, is_ascii_compatible_encoding
+from fortishield_qa_framework.generic_modules.tools.pattern_set import PatternSet
+
+
+def _scan_file_in_order(file_path, patterns, encoding):
+    """Get the number of patterns found in order at the end of a file, for every number of patterns found before it.
+
+    Args:
+        file_path (str): File path.
+        patterns (list(str)): Patterns to search, in order.
+        encoding (str): File encoding.
+
+    Returns:
+        list(int): Number of patterns found at the end of the file for each number of patterns found before it.
+    """
+    pattern_set = PatternSet(patterns)
+    # Number of found patterns of each starting point, grouping the starting points that have reached the same one
+    states = {state: [state] for state in range(len(patterns) + 1)}
+
+    with open_file(file_path) as _file:
+        for line in read_lines(_file):
+            matches = pattern_set.match(line.decode(encoding, errors='replace'))
+            if not matches:
+                continue
+
+            # Each line can only match one pattern, so each state advances once at most
+            matches = set(matches)
+            new_states = {}
+            for state, starts in states.items():
+                new_states.setdefault(state + 1 if state in matches else state, []).extend(starts)
+            states = new_states
+
+            # All the starting points have found all the patterns
+            if len(states) == 1 and len(patterns) in states:
+                break
+
+    end_states = [0] * (len(patterns) + 1)
+    for state, starts in states.items():
+        for start in starts:
+            end_states[start] = state
+
+    return end_states
+
+
+def _scan_file_patterns(file_path, patterns, encoding):
+    """Get the patterns found in a file.
+
+    Args:
+        file_path (str): File path.
+        patterns (list(str)): Patterns to search.
+        encoding (str): File encoding.
+
+    Returns:
+        set(int): Indexes of the found patterns.
+    """
+    pattern_set = PatternSet(patterns)
+    found_indexes = set()
+
+    with open_file(file_path) as _file:
+        for line in read_lines(_file):
+            found_indexes.update(pattern_set.match(line.decode(encoding, errors='replace')))
+            if len(found_indexes) == len(patterns):
+                break
+
+    return found_indexes
+
+
+class MultiFileRegexChecker:
+    """Class to check if a set of files contains the specified patterns, scanning them in parallel.
+
+    Args:
+        files (list(str)): File paths to check, in chronological order. They can be gzip or bzip2 compressed.
+        patterns (list(str)): List of patterns in string format to search.
+        check_order (boolean): True to take into account the patterns list order across the files, False otherwise.
+        encoding (str): Encoding of the files content. It must be ASCII compatible. The invalid bytes are replaced.
+        workers (int): Max number of worker processes. By default, the number of CPUs.
+
+    Attributes:
+        files (list(str)): File paths to check, in chronological order.
+        patterns (list(str)): List of patterns in string format to search.
+        check_order (boolean): True to take into account the patterns list order across the files, False otherwise.
+        encoding (str): Encoding of the files content.
+        workers (int): Max number of worker processes.
+    """
+
+    def __init__(self, files, patterns, check_order=True, encoding='utf-8', workers=None):
+        self.files = files
+        self.patterns = patterns
+        self.check_order = check_order
+        self.encoding = encoding
+        self.workers = workers if workers else os.cpu_count()
+
+        self.__validate_parameters()
+        self.__start()
+
+    def __validate_parameters(self):
+        """Validate the input parameters"""
+        # Check that files and patterns are lists
+        if type(self.files) is not list:
+            raise ValidationError('Files parameter must be a list')
+
+        if type(self.patterns) is not list:
+            raise ValidationError('Patterns parameter must be a list')
+
+        # Check that files and patterns lists are not empty
+        if len(self.files) == 0:
+            raise ValidationError('Files parameter list cannot be empty')
+
+        if len(self.patterns) == 0:
+            raise ValidationError('Patterns parameter list cannot be empty')
+
+        if not is_ascii_compatible_encoding(self.encoding):
+            raise ValidationError(f"Encoding {self.encoding} is not ASCII compatible")
+
+        for file in self.files:
+            if not os.path.exists(file):
+                raise ValidationError(f"File {file} does not exist")
+
+            # Check that the checked file is a file
+            if not os.path.isfile(file):
+                raise ValidationError(f"{file} is not a file")
+
+            # Check that the program can read the content of the file
+            if not os.access(file, os.R_OK):
+                raise ValidationError(f"{file} is not readable")
+
+    def __start(self):
+        """Start the search process.
+
+        Raises:
+            ElementNotFoundError: If the pattern was not found in the files or was not in order (if selected). When
+                the order is not checked, all the missing patterns are reported.
+        """
+        patterns = [rf"{pattern}" for pattern in self.patterns]
+
+        # A single file does not need worker processes
+        if len(self.files) == 1 or self.workers == 1:
+            self.__search(None, patterns)
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.workers, len(self.files))) as executor:
+            self.__search(executor, patterns)
+
+    def __search(self, executor, patterns):
+        """Scan the files and merge their results.
+
+        Args:
+            executor (ProcessPoolExecutor): Executor to scan the files, or None to scan them in this process.
+            patterns (list(str)): Patterns to search.
+
+        Raises:
+            ElementNotFoundError: If the pattern was not found in the files or was not in order (if selected).
+        """
+        scan_file = _scan_file_in_order if self.check_order else _scan_file_patterns
+
+        if executor is None:
+            self.__check_results((scan_file(file, patterns, self.encoding) for file in self.files), patterns)
+            return
+
+        futures = [executor.submit(scan_file, file, patterns, self.encoding) for file in self.files]
+        try:
+            self.__check_results(self.__get_results(futures), patterns)
+        finally:
+            # Cancel the scans that have not started yet, because the result is already known
+            for future in futures:
+                future.cancel()
+
+    def __check_results(self, results, patterns):
+        """Merge the results of the files scans and check that the patterns have been found.
+
+        Args:
+            results (iterable): Result of each file scan.
+            patterns (list(str)): Searched patterns.
+
+        Raises:
+            ElementNotFoundError: If the pattern was not found in the files or was not in order (if selected).
+        """
+        if self.check_order:
+            # Chain the results of the files in order
+            found_patterns = 0
+            for end_states in results:
+                found_patterns = end_states[found_patterns]
+
+            if found_patterns < len(patterns):
+                raise ElementNotFoundError(f"The pattern {self.patterns[found_patterns]} was not found in "
+                                           f"{self.files}")
+        else:
+            found_indexes = set()
+            for file_found_indexes in results:
+                found_indexes.update(file_found_indexes)
+                if len(found_indexes) == len(patterns):
+                    return
+
+            missing_patterns = [pattern for index, pattern in enumerate(self.patterns) if index not in found_indexes]
+            raise ElementNotFoundError(f"The patterns {missing_patterns} were not found in {self.files}")
+
+    def __get_results(self, futures):
+        """Get the results of the files scans. In order if the order is checked, as they finish otherwise.
+
+        Args:
+            futures (list(concurrent.futures.Future)): Futures of the files scans.
+
+        Yields:
+            *: Result of each file scan.
+        """
+        if self.check_order:
+            for future in futures:
+                yield future.result()
+            return
+
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,291 @@
+"""
+Module to build a tool that matches a line against many regex patterns scanning it only once.
+
+Two techniques are combined, so that the most common case (a line that does not match any pattern) costs a couple of
+regex scans regardless of the number of patterns:
+
+- Literal prefilter: the longest literal substring that every match of a pattern must contain is extracted, and all
+  those literals are merged into a single regex. If it is not found in the line, none of these patterns can match.
+  Only the patterns whose literal is in the line are checked with their own regex.
+- Combined alternation: the patterns without a required literal are merged into a single alternation where every
+  pattern is wrapped in its own named group. If the alternation does not match, none of them match. When it matches,
+  the wrapping group tells us the first matching pattern, and only the patterns after it are checked individually.
+
+Patterns that can not be safely merged (backreferences, global inline flags or repeated group names) are checked
+individually.
+
+The MonitoringObjectSet applies this to the monitoring objects that use the default callback, so that the monitors
+of the same file can be evaluated with a single scan of each line.
+
+This module contains the following:
+
+- PatternSet:
+    - match
+- MonitoringObjectSet:
+    - match
+- get_required_literal
+"""
+
+import re
+
+try:
+    from re import _parser as sre_parser
+except ImportError:
+    import sre_parse as sre_parser
+
+
+# Backreferences and conditional groups refer to group numbers that change when the patterns are merged
+BACKREFERENCE_REGEX = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+BYTES_BACKREFERENCE_REGEX = re.compile(rb'\\[1-9]|\(\?P=|\(\?\(')
+GROUP_NAME_PREFIX = '_pattern_set_'
+# Shorter literals are too common to discard lines efficiently
+MIN_LITERAL_LENGTH = 3
+
+
+def get_required_literal(pattern):
+    """Get the longest literal substring that every match of the pattern must contain.
+
+    Only the literals of the top level of the pattern are taken into account, because the ones inside groups,
+    alternations or repetitions are not always required.
+
+    Args:
+        pattern (str or bytes): Regex pattern.
+
+    Returns:
+        str or bytes: Required literal, or None if the pattern has not any (or it is too short to be useful).
+    """
+    try:
+        parsed_pattern = sre_parser.parse(pattern)
+    except Exception:
+        return None
+
+    # Case insensitive matches can not be prefiltered with substring searches
+    if parsed_pattern.state.flags & (re.IGNORECASE | re.LOCALE):
+        return None
+
+    longest_literal = []
+    current_literal = []
+    for opcode, value in parsed_pattern:
+        if opcode == sre_parser.LITERAL:
+            current_literal.append(value)
+            continue
+
+        longest_literal = max(longest_literal, current_literal, key=len)
+        current_literal = []
+    longest_literal = max(longest_literal, current_literal, key=len)
+
+    if len(longest_literal) < MIN_LITERAL_LENGTH:
+        return None
+
+    return bytes(longest_literal) if isinstance(pattern, bytes) else ''.join(map(chr, longest_literal))
+
+
+class PatternSet:
+    """Class to match a line against a set of regex patterns with re.match semantics.
+
+    Args:
+        patterns (list(str) or list(bytes)): Regex patterns. All of them must be of the same type.
+
+    Attributes:
+        patterns (list(str) or list(bytes)): Regex patterns.
+        regexes (list(re.Pattern)): Compiled regex of each pattern.
+        literals (list(str) or list(bytes)): Required literal of each pattern (None if it has not any).
+        literal_regex (re.Pattern): Regex that searches any of the required literals, or None.
+        literal_indexes (list(int)): Indexes of the patterns with a required literal.
+        combined_regex (re.Pattern): Alternation of the patterns without literal that can be merged, or None.
+        combined_indexes (list(int)): Indexes of the patterns merged in the combined regex, in alternation order.
+        individual_indexes (list(int)): Indexes of the patterns that have to be checked individually.
+    """
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.regexes = [re.compile(pattern) for pattern in self.patterns]
+        self.literals = [get_required_literal(pattern) for pattern in self.patterns]
+        self.literal_regex = None
+        self.literal_indexes = [index for index, literal in enumerate(self.literals) if literal is not None]
+        self.combined_regex = None
+        self.combined_indexes = []
+        self.individual_indexes = []
+        self.__group_positions = {}
+        self.__literal_candidates = {}
+        self.__literal_finder_regex = None
+
+        self.__build_literal_regex()
+        self.__build_combined_regex()
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __is_combinable(self, index, used_group_names):
+        """Check if a pattern can be merged in the combined regex.
+
+        Args:
+            index (int): Pattern index.
+            used_group_names (set(str)): Group names of the patterns already merged.
+
+        Returns:
+            boolean: True if the pattern can be merged, False otherwise.
+        """
+        pattern = self.patterns[index]
+        backreference_regex = BYTES_BACKREFERENCE_REGEX if isinstance(pattern, bytes) else BACKREFERENCE_REGEX
+
+        if backreference_regex.search(pattern) or used_group_names.intersection(self.regexes[index].groupindex):
+            return False
+
+        # Global inline flags, like (?i), would apply to all the merged patterns. Older Python versions only warn when
+        # they are not at the start of the regex, so they are detected from the flags of the compiled pattern
+        return self.regexes[index].flags == re.compile(pattern[:0]).flags
+
+    @staticmethod
+    def __wrap(pattern, group_name):
+        """Wrap a pattern in a named group.
+
+        Args:
+            pattern (str or bytes): Regex pattern.
+            group_name (str): Group name.
+
+        Returns:
+            str or bytes: Wrapped pattern.
+        """
+        if isinstance(pattern, bytes):
+            return b'(?P<' + group_name.encode() + b'>' + pattern + b')'
+
+        return f"(?P<{group_name}>{pattern})"
+
+    def __build_literal_regex(self):
+        """Merge the required literals into a single regex that finds all of them in a line.
+
+        To find them, the alternation is wrapped in a lookahead, so that finditer reports the literals starting at every
+        position even if they overlap. When several literals start at the same position only the longest one is
+        reported, so each literal also has as candidates the patterns of the literals that are its prefix.
+        """
+        if not self.literal_indexes:
+            return
+
+        literal_patterns = {}
+        for index in self.literal_indexes:
+            literal_patterns.setdefault(self.literals[index], []).append(index)
+
+        literals = sorted(literal_patterns, key=len, reverse=True)
+        for literal in literals:
+            self.__literal_candidates[literal] = sorted(index for prefix, indexes in literal_patterns.items()
+                                                        if literal.startswith(prefix) for index in indexes)
+
+        # The plain alternation is used to discard the lines quickly, the lookahead one to find all the literals
+        separator = b'|' if isinstance(literals[0], bytes) else '|'
+        alternation = separator.join(re.escape(literal) for literal in literals)
+        self.literal_regex = re.compile(alternation)
+        if isinstance(alternation, bytes):
+            self.__literal_finder_regex = re.compile(b'(?=(' + alternation + b'))')
+        else:
+            self.__literal_finder_regex = re.compile(f"(?=({alternation}))")
+
+    def __build_combined_regex(self):
+        """Merge the patterns without required literal that can be combined into a single alternation."""
+        used_group_names = set()
+        wrapped_patterns = []
+
+        for index in range(len(self.patterns)):
+            if self.literals[index] is not None:
+                continue
+
+            if self.__is_combinable(index, used_group_names):
+                used_group_names.update(self.regexes[index].groupindex)
+                wrapped_patterns.append(self.__wrap(self.patterns[index], f"{GROUP_NAME_PREFIX}{index}"))
+                self.combined_indexes.append(index)
+            else:
+                self.individual_indexes.append(index)
+
+        if not wrapped_patterns:
+            return
+
+        separator = b'|' if isinstance(self.patterns[0], bytes) else '|'
+        self.combined_regex = re.compile(separator.join(wrapped_patterns))
+
+        # Map each wrapping group number to its position in the alternation
+        for position, index in enumerate(self.combined_indexes):
+            self.__group_positions[self.combined_regex.groupindex[f"{GROUP_NAME_PREFIX}{index}"]] = position
+
+    def match(self, line):
+        """Get the patterns that match with the given line.
+
+        Args:
+            line (str or bytes): Line to check. It must be of the same type as the patterns.
+
+        Returns:
+            list(int): Indexes of the matching patterns, in ascending order.
+        """
+        matches = []
+
+        if self.literal_regex is not None and self.literal_regex.search(line):
+            found_literals = {match.group(1) for match in self.__literal_finder_regex.finditer(line)}
+            candidates = {index for literal in found_literals for index in self.__literal_candidates[literal]}
+            matches.extend(index for index in candidates if self.regexes[index].match(line))
+
+        if self.combined_regex is not None:
+            match = self.combined_regex.match(line)
+            if match is not None:
+                # The wrapping group is the last one to be closed, so lastindex is the first matching alternative.
+                # The previous alternatives did not match, but the next ones could also match.
+                position = self.__group_positions[match.lastindex]
+                matches.append(self.combined_indexes[position])
+                matches.extend(index for index in self.combined_indexes[position + 1:]
+                               if self.regexes[index].match(line))
+
+        if self.individual_indexes:
+            matches.extend(index for index in self.individual_indexes if self.regexes[index].match(line))
+
+        if len(matches) > 1:
+            matches.sort()
+
+        return matches
+
+
+class MonitoringObjectSet:
+    """Class to evaluate many monitoring objects scanning each line only once.
+
+    The patterns of the monitoring objects that use the default callback are merged in a PatternSet (the repeated
+    ones only once). The monitoring objects with a custom callback are evaluated calling it.
+
+    Args:
+        monitorings (list(MonitoringObject)): Monitoring objects to evaluate.
+
+    Attributes:
+        monitorings (list(MonitoringObject)): Monitoring objects to evaluate.
+        pattern_set (PatternSet): Pattern set with the unique patterns of the default callback monitoring objects.
+        pattern_monitorings (list(list(int))): Indexes of the monitoring objects that use each pattern of the set.
+        custom_indexes (list(int)): Indexes of the monitoring objects with a custom callback.
+    """
+    def __init__(self, monitorings):
+        self.monitorings = list(monitorings)
+        self.custom_indexes = []
+        pattern_monitorings = {}
+
+        for index, monitoring in enumerate(self.monitorings):
+            if monitoring.uses_default_callback:
+                pattern_monitorings.setdefault(monitoring.complete_pattern, []).append(index)
+            else:
+                self.custom_indexes.append(index)
+
+        self.pattern_set = PatternSet(pattern_monitorings.keys())
+        self.pattern_monitorings = list(pattern_monitorings.values())
+
+    def __len__(self):
+        return len(self.monitorings)
+
+    def match(self, line):
+        """Get the monitoring objects that match with the given line.
+
+        Args:
+            line (str): Log line.
+
+        Returns:
+            list(int): Indexes of the matching monitoring objects, in ascending order.
+        """
+        matches = [index for pattern_index in self.pattern_set.match(line)
+                   for index in self.pattern_monitorings[pattern_index]]
+        matches.extend(index for index in self.custom_indexes if self.monitorings[index].callback(line))
+
+        if len(matches) > 1:
+            matches.sort()
+
+        return matches
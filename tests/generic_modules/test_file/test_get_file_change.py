@@ -0,0 +1,66 @@
+"""
+Module to test the get_file_change function from file module.
+
+Test cases:
+    - Check the change detected after rotating, truncating, removing or appending content to an opened file.
+"""
+
+import os
+import sys
+import pytest
+
+from fortishield_qa_framework.generic_modules.file.file import get_file_change, FILE_ROTATED, FILE_TRUNCATED, \
+    FILE_REMOVED
+from fortishield_qa_framework.meta_testing.utils import write_file, append_log, remove_file
+
+
+WINDOWS_SKIP = pytest.mark.skipif(sys.platform == 'win32', reason='The opened files can not be renamed on Windows')
+
+
+@pytest.mark.parametrize('file_change, expected_change', [pytest.param('rotation', FILE_ROTATED, marks=WINDOWS_SKIP),
+                                                          ('truncation', FILE_TRUNCATED),
+                                                          pytest.param('removal', FILE_REMOVED, marks=WINDOWS_SKIP),
+                                                          ('append', None)])
+def test_get_file_change(file_change, expected_change, create_destroy_sample_file):
+    """Check the change detected after rotating, truncating, removing or appending content to an opened file.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content, open it and read it.
+            - Apply the change to the file.
+            - Check that the detected change is the expected one.
+        - teardown:
+            - Remove the create file in the setup phase and the rotated one.
+
+    parameters:
+        - file_change (str): Parametrized variable.
+        - expected_change (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    rotated_file = f"{log_file}.1"
+    write_file(log_file, 'first line\nsecond line\n')
+
+    with open(log_file, 'rb') as _file:
+        position = len(_file.read())
+
+        if file_change == 'rotation':
+            os.rename(log_file, rotated_file)
+            write_file(log_file, 'new line\n')
+        elif file_change == 'truncation':
+            write_file(log_file, 'new line\n')
+        elif file_change == 'removal':
+            os.rename(log_file, rotated_file)
+        else:
+            append_log(log_file, 'third line\n')
+
+        try:
+            assert get_file_change(_file, log_file, position) == expected_change
+        finally:
+            # The removed file is restored, so the fixture can remove it
+            if file_change == 'removal':
+                os.rename(rotated_file, log_file)
+            elif os.path.exists(rotated_file):
+                remove_file(rotated_file)
@@ -4,6 +4,9 @@ Module to test the get_file_encoding function from file module.
 Test cases:
     - Write encoded strings and check that it detected by the function.
     - Write a non supported encoded string and check that an exception is raised.
+    - Write a large file with non ASCII characters at the end and check the detection with the sampling settings.
+    - Write a large file with non ASCII characters in the middle and check that they are not detected as ASCII.
+    - Modify a file after detecting its encoding and check that the cached result is not used.
 """
 
 import os
@@ -13,11 +16,13 @@ from tempfile import gettempdir
 
 from fortishield_qa_framework.generic_modules.file.file import get_file_encoding
 from fortishield_qa_framework.meta_testing.configuration import get_test_cases_data
-from fortishield_qa_framework.meta_testing.utils import write_file, remove_file
+from fortishield_qa_framework.meta_testing.utils import write_file, remove_file, append_log
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValueError
 
 
 DEFAULT_SAMPLE_FILE = os.path.join(gettempdir(), 'file.log')
+ASCII_LOG_LINE = '2023/02/14 09:49:47 fortishield-analysisd: INFO: Plain ASCII line\n'
+UTF_8_LOG_LINE = '2H₂ + O₂\n'
 
 # Test cases data path
 TEST_DATA_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'data')
@@ -98,3 +103,81 @@ def test_invalid_get_file_encoding(encoding, text, create_ephemeral_file):
     with pytest.raises(ValueError):
         get_file_encoding(DEFAULT_SAMPLE_FILE)
         pytest.fail('Function get_file_encoding did not raise an expected exception when encoding is unknown')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Not supported for Windows')
+@pytest.mark.parametrize('sample_size, sample_tail, expected_encoding', [(65536, True, 'utf-8'),
+                                                                         (65536, False, 'utf-8'),
+                                                                         (None, False, 'utf-8')])
+def test_get_file_encoding_sampling(sample_size, sample_tail, expected_encoding, create_destroy_sample_file):
+    """Write a large file with non ASCII characters at the end and check the detection with the sampling settings.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write ASCII lines and some UTF-8 lines at the end of the file.
+            - Check that the detected encoding is UTF-8 with any sampling settings.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - sample_size (int): Parametrized variable.
+        - sample_tail (boolean): Parametrized variable.
+        - expected_encoding (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, ASCII_LOG_LINE * 20000 + UTF_8_LOG_LINE * 10)
+
+    assert get_file_encoding(create_destroy_sample_file, sample_size=sample_size, sample_tail=sample_tail,
+                             use_cache=False) == expected_encoding
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Not supported for Windows')
+def test_get_file_encoding_partial_sample(create_destroy_sample_file):
+    """Write a large file with non ASCII characters in the middle and check that they are not detected as ASCII.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write ASCII lines with a UTF-8 line in the middle of the file.
+            - Check that the detected encoding is UTF-8, although the UTF-8 line is not in the analyzed sample.
+            - Check that the whole file can be decoded with the detected encoding.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, ASCII_LOG_LINE * 40000 + UTF_8_LOG_LINE + ASCII_LOG_LINE * 40000)
+
+    encoding = get_file_encoding(create_destroy_sample_file, sample_size=65536, use_cache=False)
+
+    assert encoding == 'utf-8'
+    with open(create_destroy_sample_file, encoding=encoding) as _file:
+        assert UTF_8_LOG_LINE in _file.read()
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='Not supported for Windows')
+def test_get_file_encoding_cache(create_destroy_sample_file):
+    """Modify a file after detecting its encoding and check that the cached result is not used.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write ASCII lines and detect the file encoding.
+            - Append UTF-8 lines and check that the new encoding is detected.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, ASCII_LOG_LINE)
+    assert get_file_encoding(create_destroy_sample_file) == 'ascii'
+    assert get_file_encoding(create_destroy_sample_file) == 'ascii'
+
+    append_log(create_destroy_sample_file, UTF_8_LOG_LINE)
+    assert get_file_encoding(create_destroy_sample_file) == 'utf-8'
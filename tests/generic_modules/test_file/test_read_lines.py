@@ -0,0 +1,84 @@
+"""
+Module to test the read_lines function from file module.
+
+Test cases:
+    - Read a file with different chunk sizes and check that the lines are the same as reading them one by one.
+    - Read a file with a required substring and check that the lines that contain it are yielded.
+    - Read a file backwards with different block sizes and check that the lines are the same ones in reverse order.
+    - Check the ASCII compatible encodings detection.
+"""
+
+import io
+import pytest
+
+from fortishield_qa_framework.generic_modules.file.file import read_lines, read_lines_reverse, \
+    is_ascii_compatible_encoding
+
+
+CONTENT = b'first line\nsecond line\r\nthird line\rfourth line with \xc3\xb1\n\nlast line without line break'
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 11, 1048576])
+def test_read_lines(chunk_size):
+    """Read a file with different chunk sizes and check that the lines are the same as reading them one by one.
+
+    test_phases:
+        - test:
+            - Read the lines of a binary file object with the specified chunk size.
+            - Check that the lines are the expected ones, even if they are split between chunks.
+
+    parameters:
+        - chunk_size (int): Parametrized variable.
+    """
+    assert list(read_lines(io.BytesIO(CONTENT), chunk_size)) == CONTENT.splitlines(keepends=True)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 5, 1048576])
+def test_read_lines_required(chunk_size):
+    """Read a file with a required substring and check that the lines that contain it are yielded.
+
+    test_phases:
+        - test:
+            - Read the lines of a binary file object with a required substring.
+            - Check that all the lines that contain the substring have been yielded.
+
+    parameters:
+        - chunk_size (int): Parametrized variable.
+    """
+    lines = list(read_lines(io.BytesIO(CONTENT), chunk_size, required=b'line'))
+
+    assert [line for line in CONTENT.splitlines(keepends=True) if b'line' in line] == \
+        [line for line in lines if b'line' in line]
+
+
+@pytest.mark.parametrize('content', [CONTENT, CONTENT + b'\n', b'', b'\n\n', b'line\r\n' * 5])
+@pytest.mark.parametrize('block_size', [1, 2, 5, 11, 1048576])
+def test_read_lines_reverse(content, block_size):
+    """Read a file backwards with different block sizes and check that the lines are the same ones in reverse order.
+
+    test_phases:
+        - test:
+            - Read the lines of a binary file object from its end with the specified block size.
+            - Check that the lines are the expected ones, even if they are split between blocks.
+
+    parameters:
+        - content (bytes): Parametrized variable.
+        - block_size (int): Parametrized variable.
+    """
+    assert list(read_lines_reverse(io.BytesIO(content), block_size)) == content.splitlines(keepends=True)[::-1]
+
+
+@pytest.mark.parametrize('encoding, expected_result', [('utf-8', True), ('ascii', True), ('ISO-8859-1', True),
+                                                       ('UTF-16', False), ('non-existing', False)])
+def test_is_ascii_compatible_encoding(encoding, expected_result):
+    """Check the ASCII compatible encodings detection.
+
+    test_phases:
+        - test:
+            - Check if the encoding is ASCII compatible.
+
+    parameters:
+        - encoding (str): Parametrized variable.
+        - expected_result (boolean): Parametrized variable.
+    """
+    assert is_ascii_compatible_encoding(encoding) == expected_result
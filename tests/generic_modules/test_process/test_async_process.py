@@ -0,0 +1,167 @@
+"""
+Module to test the AsyncProcess class.
+
+Test cases:
+    - Case 1: Run a command capturing its stdout and stderr.
+    - Case 2: Run many commands concurrently in the same event loop.
+    - Case 3: Run a command that exceeds its timeout and check that it is killed.
+    - Case 4: Consume the stdout lines of a command while it is running.
+    - Case 5: Stop consuming the stdout lines of a command before it has finished and check that it is killed.
+    - Case 6: Consume stdout lines longer than the stream buffer limit.
+"""
+
+import sys
+import time
+import asyncio
+import subprocess
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.async_process import AsyncLinuxProcess
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_1():
+    """Check that AsyncProcess captures the output and return code of a command.
+
+    case: Run a command capturing its stdout and stderr.
+
+    test_phases:
+        - test:
+            - Run a command that writes in stdout and stderr and exits with a specific code.
+            - Check the captured stdout, stderr and return code.
+    """
+    process = AsyncLinuxProcess(command='echo hello; echo error >&2; exit 3', capture_stdout=True,
+                                capture_stderr=True)
+
+    asyncio.run(process.run())
+
+    assert process.get_stdout() == 'hello\n'
+    assert process.get_stderr() == 'error\n'
+    assert process.get_return_code() == 3
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_2():
+    """Check that AsyncProcess runs many commands concurrently.
+
+    case: Run many commands concurrently in the same event loop.
+
+    test_phases:
+        - test:
+            - Run 50 commands that sleep 1 second concurrently.
+            - Check that all of them have finished in less time than running them one after another.
+    """
+    processes = [AsyncLinuxProcess(command=f"sleep 1; echo {index}", capture_stdout=True) for index in range(50)]
+
+    async def run_all():
+        await asyncio.gather(*(process.run() for process in processes))
+
+    start_time = time.time()
+    asyncio.run(run_all())
+
+    assert time.time() - start_time < 10
+    assert [process.stdout for process in processes] == [f"{index}\n" for index in range(50)]
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_3():
+    """Check that AsyncProcess kills the commands that exceed their timeout.
+
+    case: Run a command that exceeds its timeout and check that it is killed.
+
+    test_phases:
+        - test:
+            - Run a command that sleeps longer than its timeout.
+            - Check that subprocess.TimeoutExpired has been raised on time and the process has been killed.
+    """
+    process = AsyncLinuxProcess(command='sleep 10', capture_stdout=True, timeout=0.5)
+    start_time = time.time()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        asyncio.run(process.run())
+
+    assert time.time() - start_time < 5
+    assert process.get_return_code() != 0
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_4():
+    """Check that AsyncProcess yields the stdout lines while the command is running.
+
+    case: Consume the stdout lines of a command while it is running.
+
+    test_phases:
+        - test:
+            - Start a command that prints a line, sleeps and prints another one.
+            - Check that the first line is received before the command has finished.
+            - Check that all the lines and the return code have been received.
+    """
+    process = AsyncLinuxProcess(command='echo first; sleep 1; echo second', capture_stdout=True, capture_stderr=True)
+
+    async def read_lines():
+        await process.start()
+        lines = []
+        async for line in process.iter_stdout():
+            lines.append((line, process.get_status() != 'dead'))
+
+        return lines
+
+    lines = asyncio.run(read_lines())
+
+    assert lines[0] == ('first\n', True)
+    assert [line for line, _ in lines] == ['first\n', 'second\n']
+    assert process.get_return_code() == 0 and process.get_stderr() == ''
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_5():
+    """Check that AsyncProcess kills the command when the stdout iteration is stopped before it has finished.
+
+    case: Stop consuming the stdout lines of a command before it has finished and check that it is killed.
+
+    test_phases:
+        - test:
+            - Start a command that prints a line and sleeps.
+            - Stop the iteration after the first line and close the iterator.
+            - Check that the command has been killed on time.
+    """
+    process = AsyncLinuxProcess(command='echo first; sleep 30', capture_stdout=True)
+
+    async def read_first_line():
+        await process.start()
+        lines = process.iter_stdout()
+        async for line in lines:
+            break
+        await lines.aclose()
+
+        return line
+
+    start_time = time.time()
+
+    assert asyncio.run(read_first_line()) == 'first\n'
+    assert time.time() - start_time < 5
+    assert process.get_status() == 'dead' and process.get_return_code() != 0
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_async_process_case_6():
+    """Check that AsyncProcess yields the stdout lines longer than the stream buffer limit.
+
+    case: Consume stdout lines longer than the stream buffer limit.
+
+    test_phases:
+        - test:
+            - Run a command that prints a 1MB line and a short one.
+            - Check that both lines have been received complete.
+    """
+    process = AsyncLinuxProcess(command=[sys.executable, '-c', "print('a' * 1048576); print('b')"],
+                                capture_stdout=True)
+
+    async def read_lines():
+        await process.start()
+        return [line async for line in process.iter_stdout()]
+
+    lines = asyncio.run(read_lines())
+
+    assert lines == ['a' * 1048576 + '\n', 'b\n']
+    assert process.get_return_code() == 0
@@ -0,0 +1,115 @@
+"""
+Module to test the CpuTracker class.
+
+Test cases:
+    - Case 1: Measure the CPU usage of a process with a busy thread and check the process and thread usages.
+    - Case 2: Measure the CPU usage of an idle process and check that the measures do not block.
+    - Case 3: Monitor a process without permissions to read its CPU times and track its CPU usage later.
+"""
+
+import os
+import sys
+import time
+import threading
+import psutil
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.monitor.cpu_tracker import CpuTracker
+from fortishield_qa_framework.generic_modules.process.monitor.linux_process_monitor import LinuxProcessMonitor
+
+
+def busy_loop(duration, thread_ids):
+    """Use the CPU during some time.
+
+    Args:
+        duration (float): Seconds to use the CPU.
+        thread_ids (list(int)): List where the thread ID is appended.
+    """
+    thread_ids.append(threading.get_native_id())
+    end_time = time.monotonic() + duration
+    while time.monotonic() < end_time:
+        pass
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_cpu_tracker_case_1():
+    """Check that CpuTracker measures the CPU usage of a process and its threads since the previous measure.
+
+    case: Measure the CPU usage of a process with a busy thread and check the process and thread usages.
+
+    test_phases:
+        - test:
+            - Start tracking the current process, resetting the tracker.
+            - Run a thread that uses the CPU for half a second.
+            - Check that the process and the busy thread have used the CPU.
+    """
+    tracker = CpuTracker(psutil.Process(os.getpid()))
+    tracker.reset()
+    thread_ids = []
+    busy_thread = threading.Thread(target=busy_loop, args=(0.5, thread_ids))
+    busy_thread.start()
+    time.sleep(0.3)
+
+    threads_cpu_usage = tracker.get_threads_cpu_usage()
+    busy_thread.join()
+    cpu_usage = tracker.get_cpu_usage()
+
+    assert threads_cpu_usage[thread_ids[0]] > 20
+    assert cpu_usage > 20
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_cpu_tracker_case_2():
+    """Check that the CPU usage measures of a process monitor do not block.
+
+    case: Measure the CPU usage of an idle process and check that the measures do not block.
+
+    test_phases:
+        - test:
+            - Measure the CPU usage of a sleeping process many times.
+            - Check that it has taken much less time than blocking measures and that the usages are valid.
+    """
+    process = psutil.Popen(['sleep', '30'])
+
+    try:
+        monitor = LinuxProcessMonitor(process.pid)
+        start_time = time.monotonic()
+        measures = [monitor.get_total_cpu_usage() for _ in range(20)]
+        threads_cpu_usage = monitor.get_threads_cpu_usage()
+
+        assert time.monotonic() - start_time < 0.5
+        assert all(0 <= float(measure[:-1]) < 100 for measure in measures)
+        assert list(threads_cpu_usage.keys()) == [process.pid]
+    finally:
+        process.kill()
+        process.wait()
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_cpu_tracker_case_3(monkeypatch):
+    """Check that a process monitor can be created without permissions to read the CPU times of the process.
+
+    case: Monitor a process without permissions to read its CPU times and track its CPU usage later.
+
+    test_phases:
+        - test:
+            - Deny the access to the CPU times of the processes and monitor the current process.
+            - Check that the memory usage of the process is returned.
+            - Allow the access to the CPU times again.
+            - Check that the first CPU usage measure is 0 and the next one is measured since the first one.
+    """
+    def deny_access(process):
+        raise psutil.AccessDenied(process.pid)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(psutil.Process, 'cpu_times', deny_access)
+        patch.setattr(psutil.Process, 'threads', deny_access)
+        monitor = LinuxProcessMonitor(os.getpid())
+
+        assert monitor.get_memory_usage()
+
+    assert monitor.get_cpu_usage() == 0
+    assert all(usage == 0 for usage in monitor.get_threads_cpu_usage().values())
+
+    busy_loop(0.2, [])
+    assert monitor.get_cpu_usage() > 20
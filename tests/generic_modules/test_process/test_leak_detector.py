@@ -0,0 +1,158 @@
+"""
+Module to test the LeakDetector class and the leak_detector fixture.
+
+Test cases:
+    - Case 1: Fit a streaming linear regression to points with and without noise and check the slope and t-statistic.
+    - Case 2: Check a process that leaks file descriptors and memory, and expect the leaks to be reported.
+    - Case 3: Check a stable process with the leak_detector fixture and expect no leaks.
+    - Case 4: Fail the background sampling of a process and expect the error to be raised when stopping the detector.
+"""
+
+import sys
+import math
+import time
+import random
+import subprocess
+import psutil
+import pytest
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ResourceLeakError
+from fortishield_qa_framework.generic_modules.process.monitor.linux_process_monitor import LinuxProcessMonitor
+from fortishield_qa_framework.generic_modules.process.monitor.leak_detector import LeakDetector, \
+    StreamingLinearRegression
+from fortishield_qa_framework.generic_modules.process.monitor.pytest_leak_detector import leak_detector  # noqa: F401
+
+
+class UnreadableProcessMonitor(LinuxProcessMonitor):
+    """Process monitor without permissions to read the process resources."""
+    def get_metrics(self):
+        raise psutil.AccessDenied(self.pid)
+
+
+LEAKING_SCRIPT = """
+import time
+files, memory = [], []
+while True:
+    files.append(open('/dev/null'))
+    memory.append(bytearray(1024 * 1024))
+    time.sleep(0.02)
+"""
+
+
+def test_leak_detector_case_1():
+    """Check that StreamingLinearRegression fits a line to the points added.
+
+    case: Fit a streaming linear regression to points with and without noise and check the slope and t-statistic.
+
+    test_phases:
+        - test:
+            - Add points of a line and check that the slope is exact and the t-statistic infinite.
+            - Add noisy points around a flat line and check that the slope is not significant.
+            - Add noisy points around a steep line and check that the slope is significant.
+    """
+    exact_regression = StreamingLinearRegression()
+    flat_regression = StreamingLinearRegression()
+    steep_regression = StreamingLinearRegression()
+    noise = random.Random(1)
+
+    for x in range(100):
+        exact_regression.add(x, 1e9 + 2 * x)
+        flat_regression.add(x, 1e9 + noise.gauss(0, 10))
+        steep_regression.add(x, 1e9 + 5 * x + noise.gauss(0, 10))
+
+    assert math.isclose(exact_regression.get_slope(), 2) and exact_regression.get_t_statistic() == math.inf
+    assert abs(flat_regression.get_t_statistic()) < 3
+    assert 4 < steep_regression.get_slope() < 6 and steep_regression.get_t_statistic() > 3
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_leak_detector_case_2():
+    """Check that LeakDetector reports the resources that grow more than their budget.
+
+    case: Check a process that leaks file descriptors and memory, and expect the leaks to be reported.
+
+    test_phases:
+        - setup:
+            - Run a process that opens a file and allocates 1MB every 20 milliseconds.
+        - test:
+            - Sample the process during a second.
+            - Check that file descriptors and memory are leaking, and the threads are not.
+            - Check that no leak is reported with budgets greater than the growth.
+        - teardown:
+            - Kill the process.
+    """
+    process = subprocess.Popen([sys.executable, '-c', LEAKING_SCRIPT])
+
+    try:
+        with LeakDetector(LinuxProcessMonitor(process.pid), interval=0.05) as detector:
+            time.sleep(1)
+
+        leaks = detector.get_leaks()
+        with pytest.raises(ResourceLeakError):
+            detector.check()
+
+        detector.budgets = {'rss': 1024 ** 3, 'num_fds': 1000, 'num_threads': 0}
+        detector.check()
+    finally:
+        process.kill()
+        process.wait()
+
+    assert set(leaks) == {'rss', 'num_fds'}
+    assert 10 < leaks['num_fds'] < 60
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_leak_detector_case_3(leak_detector):  # noqa: F811
+    """Check that the leak_detector fixture does not fail when the process does not leak resources.
+
+    case: Check a stable process with the leak_detector fixture and expect no leaks.
+
+    test_phases:
+        - test:
+            - Check a sleeping process with the leak_detector fixture for half a second.
+            - Check that no leak has been detected.
+
+    parameters:
+        - leak_detector (fixture): Check processes for resource leaks until the test finishes.
+    """
+    process = subprocess.Popen(['sleep', '30'])
+
+    try:
+        detector = leak_detector(process.pid, interval=0.05)
+        time.sleep(0.5)
+        detector.stop()
+
+        assert detector.regressions['rss'].samples >= 5
+        assert detector.get_leaks() == {}
+    finally:
+        process.kill()
+        process.wait()
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_leak_detector_case_4():
+    """Check that LeakDetector raises the errors of the background sampling instead of ignoring them.
+
+    case: Fail the background sampling of a process and expect the error to be raised when stopping the detector.
+
+    test_phases:
+        - test:
+            - Sample a process in background without permissions to read its resources.
+            - Check that the error is raised when the detector is stopped.
+            - Check that all the resources are reported as undersampled.
+    """
+    process = subprocess.Popen(['sleep', '30'])
+
+    try:
+        detector = LeakDetector(UnreadableProcessMonitor(process.pid), interval=0.05)
+        detector.start()
+        time.sleep(0.2)
+
+        with pytest.raises(psutil.AccessDenied):
+            detector.stop()
+
+        assert detector.get_undersampled_metrics() == ['rss', 'num_fds', 'num_threads']
+        assert detector.get_leaks() == {}
+    finally:
+        process.kill()
+        process.wait()
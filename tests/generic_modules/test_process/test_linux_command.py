@@ -0,0 +1,67 @@
+"""
+Module to test how LinuxProcess builds the commands to run.
+
+Test cases:
+    - Case 1: Build the command of a string or list command, with and without shell features.
+    - Case 2: Run commands with and without shell features and check their output.
+"""
+
+import sys
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.linux_process import LinuxProcess, get_linux_command
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+@pytest.mark.parametrize('command, expected_command', [
+    ('ls /', ['ls', '/']),
+    ("grep 'ERROR: x' /var/ossec/logs/ossec.log", ['grep', 'ERROR: x', '/var/ossec/logs/ossec.log']),
+    (['ls', '-l', '/'], ['ls', '-l', '/']),
+    ('sleep 1; echo hello', ['/bin/bash', '-c', 'sleep 1; echo hello']),
+    ('cat /var/ossec/logs/*.log', ['/bin/bash', '-c', 'cat /var/ossec/logs/*.log']),
+    ('echo $HOME', ['/bin/bash', '-c', 'echo $HOME']),
+    ('LANG=C ls', ['/bin/bash', '-c', 'LANG=C ls']),
+    ('cd /tmp', ['/bin/bash', '-c', 'cd /tmp']),
+    ('echo "unterminated', ['/bin/bash', '-c', 'echo "unterminated'])
+], ids=['simple', 'quotes', 'list', 'sequence', 'glob', 'variable', 'assignment', 'builtin', 'non_valid_quotes'])
+def test_linux_command_case_1(command, expected_command):
+    """Check that get_linux_command only uses a shell when it is needed.
+
+    case: Build the command of a string or list command, with and without shell features.
+
+    test_phases:
+        - test:
+            - Build the command to run.
+            - Check that it is executed directly or with a single bash as expected.
+
+    parameters:
+        - command (str or list(str)): Parametrized variable.
+        - expected_command (list(str)): Parametrized variable.
+    """
+    assert get_linux_command(command) == expected_command
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+@pytest.mark.parametrize('command, expected_stdout', [
+    ("echo 'hello  world'", 'hello  world\n'),
+    ('echo "hello" | tr a-z A-Z', 'HELLO\n'),
+    ('X=1; echo "x is $X"', 'x is 1\n')
+])
+def test_linux_command_case_2(command, expected_stdout):
+    """Check that LinuxProcess runs the commands as bash would do.
+
+    case: Run commands with and without shell features and check their output.
+
+    test_phases:
+        - test:
+            - Run the command capturing its stdout.
+            - Check that the stdout is the expected one.
+
+    parameters:
+        - command (str): Parametrized variable.
+        - expected_stdout (str): Parametrized variable.
+    """
+    process = LinuxProcess(command=command, capture_stdout=True)
+    process.run()
+
+    assert process.get_stdout() == expected_stdout
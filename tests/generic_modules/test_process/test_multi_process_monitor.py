@@ -0,0 +1,101 @@
+"""
+Module to test the MultiProcessMonitor class.
+
+Test cases:
+    - Case 1: Monitor several running processes and a missing one, and check the PIDs resolved.
+    - Case 2: Take snapshots of several processes and check their values.
+    - Case 3: Take a snapshot after a monitored process has finished.
+"""
+
+import sys
+import subprocess
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.monitor.multi_process_monitor import MultiProcessMonitor
+
+
+@pytest.fixture
+def run_dummy_processes():
+    """Run some dummy processes and kill them in the teardown."""
+    processes = [subprocess.Popen(['sleep', '30']), subprocess.Popen(['sleep', '30']),
+                 subprocess.Popen(['cat'], stdin=subprocess.PIPE)]
+
+    yield processes
+
+    for process in processes:
+        process.kill()
+        process.wait()
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_multi_process_monitor_case_1(run_dummy_processes):
+    """Check that MultiProcessMonitor resolves the PIDs of all the processes of each name.
+
+    case: Monitor several running processes and a missing one, and check the PIDs resolved.
+
+    test_phases:
+        - test:
+            - Monitor the sleep, cat and a non-existing process.
+            - Check that all the dummy processes have been found, and none for the non-existing one.
+
+    parameters:
+        - run_dummy_processes (fixture): Run some dummy processes.
+    """
+    monitor = MultiProcessMonitor(['sleep', 'cat', 'non-existing-daemon'])
+    pids = monitor.get_pids()
+
+    assert {process.pid for process in run_dummy_processes[:2]} <= set(pids['sleep'])
+    assert run_dummy_processes[2].pid in pids['cat']
+    assert pids['non-existing-daemon'] == []
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_multi_process_monitor_case_2(run_dummy_processes):
+    """Check that MultiProcessMonitor gets the resources of all the processes in each snapshot.
+
+    case: Take snapshots of several processes and check their values.
+
+    test_phases:
+        - test:
+            - Take two snapshots of the sleep and cat processes.
+            - Check that each metric has a value per process, in the same order as the PIDs.
+
+    parameters:
+        - run_dummy_processes (fixture): Run some dummy processes.
+    """
+    monitor = MultiProcessMonitor(['sleep', 'cat'])
+    monitor.get_snapshot()
+    snapshot = monitor.get_snapshot()
+    dummy_pids = [process.pid for process in run_dummy_processes]
+
+    assert all(pid in snapshot.pids for pid in dummy_pids)
+    assert [snapshot.names[snapshot.pids.index(pid)] for pid in dummy_pids] == ['sleep', 'sleep', 'cat']
+    for metric in ['rss', 'vms', 'cpu_percent', 'num_fds', 'num_threads']:
+        assert len(getattr(snapshot, metric)) == len(snapshot.pids)
+    assert all(value > 0 for value in snapshot.rss + snapshot.num_fds + snapshot.num_threads)
+    assert all(value >= 0 for value in snapshot.cpu_percent)
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_multi_process_monitor_case_3(run_dummy_processes):
+    """Check that MultiProcessMonitor stops monitoring the finished processes.
+
+    case: Take a snapshot after a monitored process has finished.
+
+    test_phases:
+        - test:
+            - Monitor the cat process and finish it.
+            - Check that the snapshot does not contain it.
+
+    parameters:
+        - run_dummy_processes (fixture): Run some dummy processes.
+    """
+    cat_process = run_dummy_processes[2]
+    monitor = MultiProcessMonitor(['cat'])
+    cat_process.kill()
+    cat_process.wait()
+
+    snapshot = monitor.get_snapshot()
+
+    assert cat_process.pid not in snapshot.pids
+    assert cat_process.pid not in monitor.get_pids()['cat']
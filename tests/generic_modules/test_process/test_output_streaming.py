@@ -0,0 +1,126 @@
+"""
+Module to test the output streaming of Process class.
+
+Test cases:
+    - Case 1: Iterate over the stdout and stderr lines of a command with a large output.
+    - Case 2: Search a line in the output of a command that keeps running and check that it is killed.
+    - Case 3: Iterate over the output of a command that exceeds its timeout.
+    - Case 4: Iterate over the output of a command without capturing it.
+    - Case 5: Iterate over the output of a command whose background child keeps running after its timeout.
+"""
+
+import sys
+import time
+import subprocess
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.linux_process import LinuxProcess
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_output_streaming_case_1():
+    """Check that iter_output yields all the output lines of each stream.
+
+    case: Iterate over the stdout and stderr lines of a command with a large output.
+
+    test_phases:
+        - test:
+            - Run a command that prints many lines in stdout and one in stderr.
+            - Check that every line has been yielded with its stream, and the return code.
+    """
+    process = LinuxProcess(command='seq 1 200000; echo error >&2', capture_stdout=True, capture_stderr=True)
+
+    stdout_lines = 0
+    stderr_lines = []
+    for stream, line in process.iter_output():
+        if stream == 'stdout':
+            stdout_lines += 1
+            assert line == f"{stdout_lines}\n"
+        else:
+            stderr_lines.append(line)
+
+    assert stdout_lines == 200000
+    assert stderr_lines == ['error\n']
+    assert process.get_return_code() == 0 and process.get_stdout() is None
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_output_streaming_case_2():
+    """Check that search_output stops the process when the pattern is found.
+
+    case: Search a line in the output of a command that keeps running and check that it is killed.
+
+    test_phases:
+        - test:
+            - Run a command that prints a line and sleeps, searching the line.
+            - Check that the line has been found before the command has finished and the command has been killed.
+    """
+    process = LinuxProcess(command='echo service ready on port 1514; sleep 10', capture_stdout=True)
+    start_time = time.time()
+
+    match = process.search_output(r'ready on port (\d+)')
+
+    assert match.group(1) == '1514'
+    assert time.time() - start_time < 5
+    assert process.get_return_code() != 0
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_output_streaming_case_3():
+    """Check that iter_output raises a timeout exception when the process exceeds its timeout.
+
+    case: Iterate over the output of a command that exceeds its timeout.
+
+    test_phases:
+        - test:
+            - Run a command that sleeps longer than its timeout, iterating over its output.
+            - Check that subprocess.TimeoutExpired has been raised on time and the command has been killed.
+    """
+    process = LinuxProcess(command='echo started; sleep 10', capture_stdout=True, timeout=0.5)
+    start_time = time.time()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        for _ in process.iter_output():
+            pass
+
+    assert time.time() - start_time < 5
+    assert process.get_return_code() != 0
+
+
+def test_output_streaming_case_4():
+    """Check that iter_output requires capturing the output.
+
+    case: Iterate over the output of a command without capturing it.
+
+    test_phases:
+        - test:
+            - Iterate over the output of a process without capturing stdout nor stderr.
+            - Check that ValidationError has been raised.
+    """
+    process = LinuxProcess(command='echo hello')
+
+    with pytest.raises(ValidationError):
+        next(process.iter_output())
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_output_streaming_case_5():
+    """Check that iter_output does not wait for a background child that keeps the output opened.
+
+    case: Iterate over the output of a command whose background child keeps running after its timeout.
+
+    test_phases:
+        - test:
+            - Run a command that finishes at once, leaving a background child with its output opened.
+            - Iterate over its output with a timeout shorter than the child duration.
+            - Check that subprocess.TimeoutExpired has been raised on time, without waiting for the child.
+    """
+    process = LinuxProcess(command='sleep 4 & echo started', capture_stdout=True, timeout=1)
+    start_time = time.time()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        for _ in process.iter_output():
+            pass
+
+    assert time.time() - start_time < 3
@@ -4,6 +4,8 @@ Module to test the Process Monitor class.
 Test cases:
     - Case 1: Run process monitor with invalid PID.
     - Case 2: Run a process and check that all methods run without errors.
+    - Case 3: Run a process and check that its metrics are numbers consistent with the formatted getters.
+    - Case 4: Monitor a process of another user and check that the metrics that do not need privileges are returned.
 
 Note: It is tested in a general way, without taking into account the exact values returned, due to the difficulty of
 creating processes with exact values of resources ... and that are independent of the environment.
@@ -16,7 +18,7 @@ import time
 import multiprocessing
 import pytest
 
-from fortishield_qa_framework.generic_modules.process.monitor.process_monitor import ProcessMonitor
+from fortishield_qa_framework.generic_modules.process.monitor.process_monitor import ProcessMonitor, ProcessMetrics
 from fortishield_qa_framework.generic_modules.process.monitor.linux_process_monitor import LinuxProcessMonitor
 from fortishield_qa_framework.generic_modules.process.monitor.windows_process_monitor import WindowsProcessMonitor
 from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValueError
@@ -122,3 +124,53 @@ def test_windows_process_monitor(run_dummy_process):
     assert windows_process.get_ppid()
     assert windows_process.get_creation_time()
     assert windows_process.get_num_threads()
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_monitor_metrics(run_dummy_process):
+    """Check that the process monitor metrics are numbers consistent with the formatted getters.
+
+    case: Run a process and check that its metrics are numbers consistent with the formatted getters.
+
+    test_phases:
+        - setup:
+            - Run a dummy process
+        - test:
+            - Get the metrics of the dummy process.
+            - Check the type of each metric.
+            - Check that the formatted memory usage matches the metrics.
+        - teardown:
+            - Kill the dummy process
+
+    parameters:
+        - run_dummy_process (fixture): Fixture to run a dummy process.
+    """
+    linux_process = LinuxProcessMonitor(run_dummy_process)
+
+    metrics = linux_process.get_metrics()
+
+    assert isinstance(metrics, ProcessMetrics)
+    for value in (metrics.rss, metrics.vms, metrics.num_fds, metrics.num_threads):
+        assert isinstance(value, int) and value > 0
+    assert 0 < metrics.memory_percent < 100 and metrics.cpu_time >= 0
+    assert linux_process.get_memory_usage(unit='B') == f"{metrics.rss}B"
+    assert isinstance(linux_process.get_cpu_usage(), float)
+
+
+@pytest.mark.skipif(sys.platform != 'linux' or os.geteuid() == 0, reason='Requires Linux and a non root user')
+def test_process_monitor_without_privileges():
+    """Check that the process monitor returns the metrics that do not need privileges for a process of another user.
+
+    case: Monitor a process of another user and check that the metrics that do not need privileges are returned.
+
+    test_phases:
+        - test:
+            - Monitor the init process (owned by root).
+            - Check that the memory usage is returned and the number of file descriptors is unknown.
+    """
+    linux_process = LinuxProcessMonitor(1)
+
+    metrics = linux_process.get_metrics()
+
+    assert metrics.rss > 0 and metrics.num_fds is None
+    assert linux_process.get_memory_usage() and linux_process.get_memory_usage_percentage()
@@ -0,0 +1,125 @@
+"""
+Module to test the run_processes function.
+
+Test cases:
+    - Case 1: Run several commands that finish in reverse order and check that the results keep the submission order.
+    - Case 2: Run a command that exceeds its timeout with other ones and check that only that one is killed.
+    - Case 3: Run several commands with a max number of workers and check that they run concurrently.
+    - Case 4: Run a command without captured output that exceeds the timeout and check that it is killed.
+    - Case 5: Run commands without wait nor timeout and check that they are waited without modifying their settings.
+"""
+
+import sys
+import time
+import psutil
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.linux_process import LinuxProcess
+from fortishield_qa_framework.generic_modules.process.process_pool import run_processes
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_pool_case_1():
+    """Check that the results of run_processes are returned in the submission order.
+
+    case: Run several commands that finish in reverse order and check that the results keep the submission order.
+
+    test_phases:
+        - test:
+            - Run several commands that sleep a decreasing time, print their index and exit with it.
+            - Check the stdout, stderr and return code of each result.
+    """
+    processes = [LinuxProcess(command=f"sleep 0.{4 - index}; echo {index}; echo error >&2; exit {index}",
+                              capture_stdout=True, capture_stderr=True) for index in range(4)]
+
+    results = run_processes(processes, max_workers=4)
+
+    assert [result.stdout for result in results] == [f"{index}\n" for index in range(4)]
+    assert [result.stderr for result in results] == ['error\n'] * 4
+    assert [result.return_code for result in results] == list(range(4))
+    assert not any(result.timed_out for result in results)
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_pool_case_2():
+    """Check that run_processes kills the processes that exceed their timeout.
+
+    case: Run a command that exceeds its timeout with other ones and check that only that one is killed.
+
+    test_phases:
+        - test:
+            - Run a command that prints a line and sleeps longer than the timeout, and a quick one.
+            - Check that the first one has been killed on time, keeping its output.
+            - Check that the quick one has finished successfully.
+    """
+    processes = [LinuxProcess(command='echo started; sleep 10', capture_stdout=True),
+                 LinuxProcess(command='echo hello', capture_stdout=True)]
+    start_time = time.time()
+
+    results = run_processes(processes, timeout=0.5)
+
+    assert time.time() - start_time < 5
+    assert results[0].timed_out and results[0].stdout == 'started\n' and results[0].return_code != 0
+    assert not results[1].timed_out and results[1].stdout == 'hello\n' and results[1].return_code == 0
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_pool_case_3():
+    """Check that run_processes runs the processes concurrently.
+
+    case: Run several commands with a max number of workers and check that they run concurrently.
+
+    test_phases:
+        - test:
+            - Run 4 commands that sleep 1 second with 4 workers.
+            - Check that all of them have finished in less time than running them one after another.
+    """
+    processes = [LinuxProcess(command='sleep 1') for _ in range(4)]
+    start_time = time.time()
+
+    results = run_processes(processes, max_workers=4)
+
+    assert time.time() - start_time < 3
+    assert [result.return_code for result in results] == [0] * 4
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_pool_case_4():
+    """Check that run_processes kills the processes without captured output that exceed their timeout.
+
+    case: Run a command without captured output that exceeds the timeout and check that it is killed.
+
+    test_phases:
+        - test:
+            - Run a command that sleeps longer than the timeout, without capturing its output.
+            - Check that it has been killed on time and that no exception has been raised.
+    """
+    process = LinuxProcess(command=['sleep', '30'])
+    start_time = time.time()
+
+    results = run_processes([process], timeout=0.5)
+
+    assert time.time() - start_time < 5
+    assert results[0].timed_out and results[0].return_code != 0
+    assert not psutil.pid_exists(process.get_pid())
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_pool_case_5():
+    """Check that run_processes waits for the processes without modifying their settings.
+
+    case: Run commands without wait nor timeout and check that they are waited without modifying their settings.
+
+    test_phases:
+        - test:
+            - Run a quick command and a command that exceeds the timeout, both without wait nor timeout.
+            - Check that the quick one has been waited for and the slow one has been killed.
+            - Check that the wait and timeout settings of both processes have not been modified.
+    """
+    processes = [LinuxProcess(command='echo hello', capture_stdout=True), LinuxProcess(command=['sleep', '30'])]
+
+    results = run_processes(processes, timeout=0.5)
+
+    assert results[0].stdout == 'hello\n' and not results[0].timed_out
+    assert results[1].timed_out
+    assert all(process.wait is False and process.timeout is None for process in processes)
@@ -0,0 +1,98 @@
+"""
+Module to test the ProcessSampler class.
+
+Test cases:
+    - Case 1: Sample a process in background and check the stored samples.
+    - Case 2: Take more samples than the sampler capacity and check that the oldest ones are overwritten.
+    - Case 3: Export the samples as percentiles and as a CSV file.
+"""
+
+import os
+import csv
+import sys
+import time
+import pytest
+
+from fortishield_qa_framework.generic_modules.process.monitor.linux_process_monitor import LinuxProcessMonitor
+from fortishield_qa_framework.generic_modules.process.monitor.process_sampler import ProcessSampler, METRICS
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_sampler_case_1():
+    """Check that ProcessSampler samples a process in background at the specified rate.
+
+    case: Sample a process in background and check the stored samples.
+
+    test_phases:
+        - test:
+            - Sample the current process every 50 milliseconds for half a second.
+            - Check the number of samples and that the metrics have valid values.
+    """
+    with ProcessSampler(LinuxProcessMonitor(os.getpid()), interval=0.05) as sampler:
+        time.sleep(0.5)
+
+    assert 5 <= sampler.samples <= 12
+    columns = sampler.get_columns()
+    assert all(len(values) == sampler.samples for values in columns.values())
+    assert columns['timestamp'] == sorted(columns['timestamp'])
+    assert all(value > 0 for value in columns['rss'] + columns['num_fds'] + columns['num_threads'])
+    assert all(value >= 0 for value in columns['cpu_percent'])
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_sampler_case_2():
+    """Check that ProcessSampler overwrites the oldest samples when it is full.
+
+    case: Take more samples than the sampler capacity and check that the oldest ones are overwritten.
+
+    test_phases:
+        - test:
+            - Take 7 samples with a sampler whose capacity is 3.
+            - Check that only the last 3 samples are stored, from the oldest to the newest.
+    """
+    sampler = ProcessSampler(LinuxProcessMonitor(os.getpid()), capacity=3)
+    timestamps = []
+    for _ in range(7):
+        sampler.sample()
+        timestamps.append(time.time())
+        time.sleep(0.01)
+
+    stored_timestamps = sampler.get_samples('timestamp')
+
+    assert sampler.samples == 7 and len(stored_timestamps) == 3
+    assert stored_timestamps == sorted(stored_timestamps)
+    assert stored_timestamps[0] > timestamps[3]
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_process_sampler_case_3(tmp_path):
+    """Check that ProcessSampler exports the samples.
+
+    case: Export the samples as percentiles and as a CSV file.
+
+    test_phases:
+        - test:
+            - Take several samples.
+            - Check that the percentiles are within the range of the samples.
+            - Write the samples in a CSV file and check its content.
+
+    parameters:
+        - tmp_path (fixture): Temporary directory.
+    """
+    sampler = ProcessSampler(LinuxProcessMonitor(os.getpid()))
+    for _ in range(5):
+        sampler.sample()
+
+    rss_values = sampler.get_samples('rss')
+    percentiles = sampler.get_percentiles('rss', percentiles=(0, 50, 100))
+
+    assert percentiles[0] == min(rss_values) and percentiles[100] == max(rss_values)
+    assert min(rss_values) <= percentiles[50] <= max(rss_values)
+
+    csv_file = os.path.join(tmp_path, 'samples.csv')
+    sampler.write_csv(csv_file)
+    with open(csv_file) as _file:
+        rows = list(csv.reader(_file))
+
+    assert rows[0] == METRICS
+    assert [float(row[METRICS.index('rss')]) for row in rows[1:]] == rss_values
@@ -0,0 +1,174 @@
+"""
+Module to test the AsyncFileRegexMonitor class and the wait_first and wait_all helpers.
+
+Test cases:
+    - Case 1: Pre-logged event, log another event while awaiting the monitor and expect 2 matches.
+    - Case 2: Pre-logged event with only_new_events enabled and expect a timeout.
+    - Case 3: Iterate over the matches of the events logged while monitoring.
+    - Case 4: Wait for the first or all the monitors of several files in the same event loop.
+"""
+
+import os
+import asyncio
+import pytest
+from tempfile import gettempdir
+
+from fortishield_qa_framework.meta_testing.utils import append_log, write_file, remove_file, CUSTOM_PATTERN, \
+    DEFAULT_LOG_MESSAGE
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject
+from fortishield_qa_framework.generic_modules.tools.async_file_regex_monitor import AsyncFileRegexMonitor, \
+    wait_first, wait_all
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import TimeoutError
+
+
+async def append_log_later(log_file, content, delay=0.2):
+    """Append content to a file after a delay, without blocking the event loop.
+
+    Args:
+        log_file (str): File path.
+        content (str): Content to append.
+        delay (float): Seconds to wait before appending the content.
+    """
+    await asyncio.sleep(delay)
+    append_log(log_file, content)
+
+
+@pytest.mark.parametrize('wakeup_backend', ['auto', 'polling'])
+def test_async_file_regex_monitor_case_1(wakeup_backend, create_destroy_sample_file):
+    """Check the AsyncFileRegexMonitor behavior when events are logged before and while awaiting it.
+
+    case: Pre-logged event, log another event while awaiting the monitor and expect 2 matches.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a line that triggers the monitoring callback.
+            - Await the monitor while another line that triggers the callback is logged.
+            - Check that no TimeoutError exception has been raised and the callback has been triggered twice.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - wakeup_backend (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+
+    async def run():
+        monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=5, monitored_file=log_file)
+        monitor = AsyncFileRegexMonitor(monitoring, accumulations=2, wakeup_backend=wakeup_backend)
+        await asyncio.gather(monitor.wait(), append_log_later(log_file, f"{DEFAULT_LOG_MESSAGE}\n"))
+
+        return monitor
+
+    assert asyncio.run(run()).matches == 2
+
+
+def test_async_file_regex_monitor_case_2(create_destroy_sample_file):
+    """Check that the AsyncFileRegexMonitor ignores the previous events with only_new_events enabled.
+
+    case: Pre-logged event with only_new_events enabled and expect a timeout.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a line that triggers the monitoring callback.
+            - Await the monitor with only_new_events enabled.
+            - Check that TimeoutError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=0.5, monitored_file=log_file)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(AsyncFileRegexMonitor(monitoring, only_new_events=True).wait())
+
+
+def test_async_file_regex_monitor_case_3(create_destroy_sample_file):
+    """Check the matches yielded when iterating over the AsyncFileRegexMonitor.
+
+    case: Iterate over the matches of the events logged while monitoring.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Iterate over the monitor matches while 3 events and a non matching line are logged.
+            - Check that the callback result of each event has been yielded.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    def callback(line):
+        return line.split()[-1] if 'processed' in line else None
+
+    async def run():
+        monitoring = MonitoringObject(callback=callback, timeout=5, monitored_file=log_file)
+        monitor = AsyncFileRegexMonitor(monitoring, accumulations=3, only_new_events=True)
+        writer = asyncio.ensure_future(append_log_later(log_file, 'processed 1\nnoise\nprocessed 2\nprocessed 3\n'))
+        results = [result async for result in monitor]
+        await writer
+
+        return results
+
+    assert asyncio.run(run()) == ['1', '2', '3']
+
+
+@pytest.mark.parametrize('wait_function', [wait_first, wait_all])
+def test_async_file_regex_monitor_case_4(wait_function, create_destroy_sample_file):
+    """Check the wait_first and wait_all helpers with monitors of several files.
+
+    case: Wait for the first or all the monitors of several files in the same event loop.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Create other 2 files and a monitor for each file.
+            - Log a matching event in each file with different delays while waiting for the monitors.
+            - Check that the first monitor or all of them have been triggered.
+        - teardown:
+            - Remove the create files.
+
+    parameters:
+        - wait_function (function): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_files = [create_destroy_sample_file] + [os.path.join(gettempdir(), f"file_{index}.log") for index in (1, 2)]
+
+    async def run():
+        monitors = [AsyncFileRegexMonitor(MonitoringObject(pattern=CUSTOM_PATTERN, timeout=5, monitored_file=log_file),
+                                          only_new_events=True) for log_file in log_files]
+        writers = [append_log_later(log_file, f"{DEFAULT_LOG_MESSAGE}\n", delay=0.2 * (index + 1))
+                   for index, log_file in enumerate(log_files)]
+        result, *_ = await asyncio.gather(wait_function(monitors), *writers)
+
+        return monitors, result
+
+    try:
+        for log_file in log_files[1:]:
+            write_file(log_file)
+
+        monitors, result = asyncio.run(run())
+
+        if wait_function is wait_first:
+            assert result is monitors[0]
+            assert [monitor.matches for monitor in monitors] == [1, 0, 0]
+        else:
+            assert result == [True, True, True]
+            assert [monitor.matches for monitor in monitors] == [1, 1, 1]
+    finally:
+        for log_file in log_files[1:]:
+            remove_file(log_file)
@@ -0,0 +1,218 @@
+"""
+Module to test the FileCheckpoint class and its use in FileRegexChecker and FileRegexMonitor.
+
+Test cases:
+    - Case 1: Resume a FileRegexChecker search from the offset reached by the previous one.
+    - Case 2: Read the file from the beginning when it has been truncated or rotated.
+    - Case 3: Resume a FileRegexMonitor from the offset reached by the previous one.
+    - Case 4: Check a line again when it was not complete in the previous search.
+        - case 4.1 [FileRegexChecker]
+        - case 4.2 [FileRegexMonitor]
+    - Case 5: Resume a failed FileRegexChecker search with the patterns that it found.
+        - case 5.1 [check_order enabled]
+        - case 5.2 [check_order disabled]
+        - case 5.3 [pattern found in a line without line break]
+"""
+
+import os
+import pytest
+
+from fortishield_qa_framework.generic_modules.tools.file_checkpoint import FileCheckpoint
+from fortishield_qa_framework.generic_modules.tools.file_regex_checker import FileRegexChecker
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError, TimeoutError
+from fortishield_qa_framework.meta_testing.utils import write_file, append_log, remove_file
+
+
+@pytest.fixture
+def checkpoint_file(create_destroy_sample_file):
+    """Get the path of the checkpoint of the sample file and remove it after finishing."""
+    checkpoint_file = f"{create_destroy_sample_file}.checkpoint"
+
+    yield checkpoint_file
+
+    remove_file(checkpoint_file)
+
+
+def test_file_checkpoint_case_1(create_destroy_sample_file, checkpoint_file):
+    """Check that a FileRegexChecker search resumes from the checkpoint offset.
+
+    case: Resume a FileRegexChecker search from the offset reached by the previous one.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content and check a pattern with a checkpoint.
+            - Check that the pattern can not be found again with the same checkpoint.
+            - Append a matching line and check that it is found with the same checkpoint.
+        - teardown:
+            - Remove the create file and the checkpoint.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - checkpoint_file (fixture): Get the path of the checkpoint and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, '1\n2\n3\n')
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['2'], checkpoint=checkpoint_file)
+    assert FileCheckpoint(checkpoint_file).offset == len('1\n2\n')
+
+    with pytest.raises(ElementNotFoundError):
+        FileRegexChecker(file=create_destroy_sample_file, patterns=['2'], checkpoint=checkpoint_file)
+    assert FileCheckpoint(checkpoint_file).offset == len('1\n2\n3\n')
+
+    append_log(create_destroy_sample_file, '2\n')
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['2'], checkpoint=checkpoint_file)
+
+
+@pytest.mark.parametrize('rotation', [False, True], ids=['truncation', 'rotation'])
+def test_file_checkpoint_case_2(rotation, create_destroy_sample_file, checkpoint_file):
+    """Check that the file is read from the beginning when it has been truncated or rotated.
+
+    case: Read the file from the beginning when it has been truncated or rotated.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content and check a pattern with a checkpoint.
+            - Truncate or rotate the file and write a shorter content.
+            - Check that the first line of the new content is found with the same checkpoint.
+        - teardown:
+            - Remove the create file and the checkpoint.
+
+    parameters:
+        - rotation (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - checkpoint_file (fixture): Get the path of the checkpoint and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, 'first line\nsecond line\n')
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['second'], checkpoint=checkpoint_file)
+
+    if rotation:
+        rotated_file = f"{create_destroy_sample_file}.1"
+        os.rename(create_destroy_sample_file, rotated_file)
+        write_file(create_destroy_sample_file, 'new line\nthird line\nfourth line\n')
+        remove_file(rotated_file)
+    else:
+        write_file(create_destroy_sample_file, 'new line\n')
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['new'], checkpoint=checkpoint_file)
+
+
+def test_file_checkpoint_case_3(create_destroy_sample_file, checkpoint_file):
+    """Check that a FileRegexMonitor resumes from the checkpoint offset.
+
+    case: Resume a FileRegexMonitor from the offset reached by the previous one.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content and monitor a pattern with a checkpoint.
+            - Check that a new monitor with the same checkpoint does not match the same line.
+            - Append a matching line and check that a new monitor with the same checkpoint matches it.
+        - teardown:
+            - Remove the create file and the checkpoint.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - checkpoint_file (fixture): Get the path of the checkpoint and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, 'event 1\nevent 2\n')
+    monitoring = MonitoringObject(pattern='event', timeout=0.2, monitored_file=create_destroy_sample_file)
+
+    FileRegexMonitor(monitoring, accumulations=2, checkpoint=checkpoint_file)
+
+    with pytest.raises(TimeoutError):
+        FileRegexMonitor(monitoring, checkpoint=checkpoint_file)
+
+    append_log(create_destroy_sample_file, 'event 3\n')
+    FileRegexMonitor(monitoring, checkpoint=checkpoint_file)
+
+
+@pytest.mark.parametrize('monitor', [False, True], ids=['checker', 'monitor'])
+def test_file_checkpoint_case_4(monitor, create_destroy_sample_file, checkpoint_file):
+    """Check that a line without line break is checked again by the next search with the same checkpoint.
+
+    case: Check a line again when it was not complete in the previous search.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the beginning of a line and check a pattern of the full line with a checkpoint.
+            - Check that the checkpoint offset is the beginning of the line.
+            - Write the rest of the line and check that the pattern is found with the same checkpoint.
+        - teardown:
+            - Remove the create file and the checkpoint.
+
+    parameters:
+        - monitor (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - checkpoint_file (fixture): Get the path of the checkpoint and remove it after finishing.
+    """
+    def check_pattern():
+        if monitor:
+            monitoring = MonitoringObject(pattern='Started remoted', timeout=0.2,
+                                          monitored_file=create_destroy_sample_file)
+            FileRegexMonitor(monitoring, checkpoint=checkpoint_file)
+        else:
+            FileRegexChecker(file=create_destroy_sample_file, patterns=['.*Started remoted'],
+                             checkpoint=checkpoint_file)
+
+    write_file(create_destroy_sample_file, 'first line\n2023 partial ')
+
+    with pytest.raises(TimeoutError if monitor else ElementNotFoundError):
+        check_pattern()
+    assert FileCheckpoint(checkpoint_file).offset == len('first line\n')
+
+    append_log(create_destroy_sample_file, 'Started remoted\n')
+    check_pattern()
+
+
+@pytest.mark.parametrize('check_order, content, new_content, found_indexes',
+                         [(True, '1\n', '2\n', [0]), (False, '2\n', '1\n', [1]), (True, '1', '\n2\n', None)],
+                         ids=['check_order', 'no_check_order', 'partial_line'])
+def test_file_checkpoint_case_5(check_order, content, new_content, found_indexes, create_destroy_sample_file,
+                                checkpoint_file):
+    """Check that a failed FileRegexChecker search saves the found patterns to resume the search with them.
+
+    case: Resume a failed FileRegexChecker search with the patterns that it found.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write a line that only matches one of the patterns and check them with a checkpoint.
+            - Check that the found pattern is saved in the checkpoint state, unless its line is not complete.
+            - Write a line that matches the other pattern and check that the search of both patterns succeeds.
+            - Check that the checkpoint state is empty and the patterns are not found again.
+        - teardown:
+            - Remove the create file and the checkpoint.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - content (str): Parametrized variable.
+        - new_content (str): Parametrized variable.
+        - found_indexes (list(int)): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - checkpoint_file (fixture): Get the path of the checkpoint and remove it after finishing.
+    """
+    patterns = ['1', '2']
+    write_file(create_destroy_sample_file, content)
+
+    with pytest.raises(ElementNotFoundError):
+        FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=check_order,
+                         checkpoint=checkpoint_file)
+    assert FileCheckpoint(checkpoint_file).state.get('found_indexes') == found_indexes
+
+    append_log(create_destroy_sample_file, new_content)
+    FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=check_order,
+                     checkpoint=checkpoint_file)
+    assert FileCheckpoint(checkpoint_file).state == {}
+
+    with pytest.raises(ElementNotFoundError):
+        FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=check_order,
+                         checkpoint=checkpoint_file)
@@ -0,0 +1,169 @@
+"""
+Module to test the LogTimestampIndex class and the since parameter of FileRegexChecker and FileRegexMonitor.
+
+Test cases:
+    - Case 1: Get the offset of the lines logged from a time and check that no newer line is skipped.
+    - Case 2: Update the index incrementally when the file grows and persist it.
+    - Case 3: Check patterns only in the lines logged from a time.
+        - case 3.1 [FileRegexChecker]
+        - case 3.2 [FileRegexMonitor]
+"""
+
+import pytest
+
+from fortishield_qa_framework.generic_modules.tools.file_index import LogTimestampIndex, get_line_timestamp_key, \
+    get_timestamp_key
+from fortishield_qa_framework.generic_modules.tools.file_regex_checker import FileRegexChecker
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError, TimeoutError
+from fortishield_qa_framework.meta_testing.utils import write_file, append_log, remove_file
+
+
+INDEX_INTERVAL = 256
+
+
+def get_log_content(first_second=0, seconds=60, lines_per_second=5):
+    """Build log lines, with some lines without timestamp.
+
+    Args:
+        first_second (int): Second of the first line.
+        seconds (int): Number of seconds with lines.
+        lines_per_second (int): Number of lines logged in each second.
+
+    Returns:
+        str: Log content.
+    """
+    lines = []
+    for second in range(first_second, first_second + seconds):
+        for number in range(lines_per_second):
+            lines.append(f"2023/02/14 10:{second // 60:02d}:{second % 60:02d} fortishield-db: INFO: Event {second}-"
+                         f"{number}\n")
+        lines.append('    multi-line message without timestamp\n')
+
+    return ''.join(lines)
+
+
+@pytest.fixture
+def index_file(create_destroy_sample_file):
+    """Get the path of the index file of the sample file and remove it after finishing."""
+    index_file = f"{create_destroy_sample_file}.index"
+
+    yield index_file
+
+    remove_file(index_file)
+
+
+@pytest.mark.parametrize('since_second', [0, 1, 17, 59, 60])
+def test_file_index_case_1(since_second, create_destroy_sample_file):
+    """Check the offset of the lines logged from a time.
+
+    case: Get the offset of the lines logged from a time and check that no newer line is skipped.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the log content.
+            - Get the offset of the lines logged from the since time.
+            - Check that the lines before the offset are older and that it does not go back more than the interval.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - since_second (int): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, get_log_content())
+    since = f"2023/02/14 10:{since_second // 60:02d}:{since_second % 60:02d}"
+    offset = LogTimestampIndex(create_destroy_sample_file, interval=INDEX_INTERVAL).get_offset(since)
+
+    with open(create_destroy_sample_file, 'rb') as _file:
+        skipped_lines = _file.read(offset).splitlines()
+        next_line = _file.readline()
+
+    assert all(get_line_timestamp_key(line) < get_timestamp_key(since) for line in skipped_lines
+               if get_line_timestamp_key(line) is not None)
+    assert offset == 0 or next_line.startswith(b'2023')
+    first_newer_line_offset = next((index for index, line in enumerate(get_log_content().encode().splitlines())
+                                    if (get_line_timestamp_key(line) or 0) >= get_timestamp_key(since)), None)
+    assert first_newer_line_offset is None or len(skipped_lines) <= first_newer_line_offset
+
+
+def test_file_index_case_2(create_destroy_sample_file, index_file):
+    """Check that the index is updated incrementally and persisted.
+
+    case: Update the index incrementally when the file grows and persist it.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the log content and update the index.
+            - Append more lines and update the index again.
+            - Check that the previous samples have been kept and new ones have been added.
+            - Check that a loaded index has the same samples.
+            - Truncate the file and check that the index is built again.
+        - teardown:
+            - Remove the create file and the index file.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - index_file (fixture): Get the path of the index file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, get_log_content(0, 30))
+    timestamp_index = LogTimestampIndex(create_destroy_sample_file, index_file, interval=INDEX_INTERVAL)
+    timestamp_index.update()
+    first_samples = list(zip(timestamp_index.timestamps, timestamp_index.offsets))
+
+    append_log(create_destroy_sample_file, get_log_content(30, 30))
+    timestamp_index.update()
+    samples = list(zip(timestamp_index.timestamps, timestamp_index.offsets))
+
+    assert len(first_samples) > 0 and len(samples) > len(first_samples)
+    assert samples[:len(first_samples)] == first_samples
+    assert list(sorted(samples)) == samples
+
+    loaded_index = LogTimestampIndex(create_destroy_sample_file, index_file, interval=INDEX_INTERVAL)
+    assert list(zip(loaded_index.timestamps, loaded_index.offsets)) == samples
+
+    write_file(create_destroy_sample_file, get_log_content(0, 5))
+    loaded_index.update()
+    assert len(loaded_index.timestamps) < len(first_samples)
+
+
+@pytest.mark.parametrize('tool', ['checker', 'monitor'])
+def test_file_index_case_3(tool, create_destroy_sample_file, index_file):
+    """Check that only the lines logged from the since time are checked.
+
+    case: Check patterns only in the lines logged from a time.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the log content.
+            - Check that a line logged before the since time is not found.
+            - Check that a line logged from the since time is found.
+        - teardown:
+            - Remove the create file and the index file.
+
+    parameters:
+        - tool (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+        - index_file (fixture): Get the path of the index file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, get_log_content())
+    since = '2023/02/14 10:00:40'
+
+    def check(pattern):
+        if tool == 'checker':
+            FileRegexChecker(file=create_destroy_sample_file, patterns=[pattern], since=since,
+                             timestamp_index=index_file)
+        else:
+            monitoring = MonitoringObject(pattern=pattern, timeout=0.2, monitored_file=create_destroy_sample_file)
+            FileRegexMonitor(monitoring, since=since, timestamp_index=index_file)
+
+    with pytest.raises(ElementNotFoundError if tool == 'checker' else TimeoutError):
+        check('.*Event 39-4')
+
+    check('.*Event 40-0')
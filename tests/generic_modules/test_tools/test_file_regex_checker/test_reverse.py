@@ -0,0 +1,81 @@
+"""
+Module to test the reverse parameter of FileRegexChecker.
+
+Test cases:
+    - Case 1: Check patterns reading the file from its end and expect the same result as reading it from its beginning.
+        - case 1.1 [check_order enabled]
+        - case 1.2 [check_order disabled]
+    - Case 2: Check patterns reading backwards a file whose encoding is not ASCII compatible.
+"""
+
+import pytest
+
+from fortishield_qa_framework.generic_modules.tools.file_regex_checker import FileRegexChecker
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError
+from fortishield_qa_framework.meta_testing.utils import write_file
+
+
+CONTENT = 'Started 1\nnoise\nStarted 2\nStopped 2\r\nnoise\nStarted 3\n'
+
+
+@pytest.mark.parametrize('patterns, expected_exception', [
+    (['Started 1', 'Started 3'], False),
+    (['Started 3', 'Started 1'], True),
+    (['Started 2', 'Stopped 2', 'Started 3'], False),
+    (['Stopped 2', 'Started 2'], True),
+    (['Started 4'], True)
+])
+@pytest.mark.parametrize('check_order', [True, False])
+def test_reverse_case_1(check_order, patterns, expected_exception, create_destroy_sample_file):
+    """Check the FileRegexChecker behavior when reading the file from its end.
+
+    case: Check patterns reading the file from its end and expect the same result as reading it from its beginning.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content.
+            - Check the patterns reading the file from its end.
+            - Check if ElementNotFoundError exception has been raised, like when reading it from its beginning.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - patterns (list(str)): Parametrized variable.
+        - expected_exception (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, CONTENT)
+    # Without order, only the missing patterns raise the exception
+    expected_exception = expected_exception and (check_order or 'Started 4' in patterns)
+
+    if expected_exception:
+        with pytest.raises(ElementNotFoundError):
+            FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=check_order,
+                             reverse=True)
+    else:
+        FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=check_order, reverse=True)
+
+
+def test_reverse_case_2(create_destroy_sample_file):
+    """Check the FileRegexChecker behavior when reading backwards a file whose encoding is not ASCII compatible.
+
+    case: Check patterns reading backwards a file whose encoding is not ASCII compatible.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content with UTF-16 encoding.
+            - Check that the patterns have been found.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, CONTENT, encoding='utf-16')
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['Started 1', 'Started 3'], reverse=True)
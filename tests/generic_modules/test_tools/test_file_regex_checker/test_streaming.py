@@ -0,0 +1,117 @@
+"""
+Module to test the streaming read of FileRegexChecker.
+
+Test cases:
+    - Case 1: Check patterns in a file whose encoding is not ASCII compatible.
+    - Case 2: Check that the search stops as soon as all the patterns have been found.
+    - Case 3: Report every missing pattern at once with check_order disabled.
+    - Case 4: Check patterns in a large UTF-8 file whose non ASCII characters are only in the middle.
+"""
+
+import pytest
+
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError
+from fortishield_qa_framework.generic_modules.tools.file_regex_checker import FileRegexChecker
+from fortishield_qa_framework.meta_testing.utils import write_file
+
+
+@pytest.mark.parametrize('check_order', [True, False])
+def test_streaming_case_1(check_order, create_destroy_sample_file):
+    """Check the FileRegexChecker behavior with a file whose encoding is not ASCII compatible.
+
+    case: Check patterns in a file whose encoding is not ASCII compatible.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content with UTF-16 encoding.
+            - Check that the patterns have been found.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, 'ЄЃЂ 1\nЄЃЂ 2\nЄЃЂ 3\n', encoding='utf-16')
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['.*1', '.*2', '.*3'], check_order=check_order)
+
+
+@pytest.mark.parametrize('check_order', [True, False])
+def test_streaming_case_2(check_order, create_destroy_sample_file):
+    """Check that the FileRegexChecker stops reading the file when all the patterns have been found.
+
+    case: Check that the search stops as soon as all the patterns have been found.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content with a non decodable line after the searched ones.
+            - Check that the patterns have been found without decoding the last line.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, '1\n2\n3\n')
+    with open(create_destroy_sample_file, 'ab') as _file:
+        _file.write(b'\xff\xfe non decodable line\n')
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=[3, 1, 2] if not check_order else [1, 2, 3],
+                     check_order=check_order, encoding='utf-8')
+
+
+def test_streaming_case_3(create_destroy_sample_file):
+    """Check that the FileRegexChecker reports all the missing patterns when the order is not checked.
+
+    case: Report every missing pattern at once with check_order disabled.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write the file content.
+            - Check that the raised error contains all the missing patterns.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    write_file(create_destroy_sample_file, '1\n2\n3\n')
+    patterns = [f"pattern-{index}" for index in range(200)] + ['2', '1']
+
+    with pytest.raises(ElementNotFoundError) as error:
+        FileRegexChecker(file=create_destroy_sample_file, patterns=patterns, check_order=False)
+
+    assert str(patterns[:200]) in str(error.value)
+
+
+@pytest.mark.parametrize('encoding', [None, 'ascii'])
+def test_streaming_case_4(encoding, create_destroy_sample_file):
+    """Check the FileRegexChecker behavior with a large UTF-8 file whose non ASCII characters are only in the middle.
+
+    case: Check patterns in a large UTF-8 file whose non ASCII characters are only in the middle.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write many ASCII lines with a UTF-8 line in the middle and a searched line at the end.
+            - Check that the searched line has been found, with the detected encoding and with a wrong one.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - encoding (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    ascii_lines = 'fortishield-analysisd: INFO: Plain ASCII line\n' * 40000
+    write_file(create_destroy_sample_file, f"{ascii_lines}H₂O\n{ascii_lines}Last line\n")
+
+    FileRegexChecker(file=create_destroy_sample_file, patterns=['Last line'], encoding=encoding)
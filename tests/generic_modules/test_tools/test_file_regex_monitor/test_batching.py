@@ -0,0 +1,128 @@
+"""
+Module to test the batched reading of the new lines of FileRegexMonitor.
+
+Test cases:
+    - Case 1: Log many events in several writes while monitoring and check that all of them are read once, in order.
+        - case 1.1 [text]
+        - case 1.2 [binary]
+    - Case 2: Log events continuously while monitoring and expect the timeout to expire on time.
+"""
+
+import time
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import append_log
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor, \
+    LINES_PER_BATCH
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import TimeoutError
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+LAST_LINE = 'end of the test events\n'
+
+
+def log_events(log_file, events, events_per_write=500, duration=None):
+    """Log numbered events in several writes.
+
+    Args:
+        log_file (str): File path.
+        events (int): Number of events to log.
+        events_per_write (int): Number of events logged on each write.
+        duration (float): If it is specified, the events are logged again until this number of seconds has passed.
+
+    Returns:
+        str: Logged content.
+    """
+    content = ''.join(f"2023/02/14 09:49:47 fortishield-remoted: DEBUG: Received event {event}\n"
+                      for event in range(events))
+    write_size = len(content) // events * events_per_write
+    start_time = time.time()
+
+    while True:
+        for position in range(0, len(content), write_size):
+            append_log(log_file, content[position:position + write_size])
+        if duration is None or time.time() - start_time > duration:
+            break
+
+    return content
+
+
+@pytest.mark.parametrize('binary', [False, True], ids=['text', 'binary'])
+def test_batching_case_1(binary, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when many events are logged while monitoring.
+
+    case: Log many events in several writes while monitoring and check that all of them are read once, in order.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring with a callback that stores every line and matches the last one.
+            - Log more events than the lines of a batch, in several writes, and the last line.
+            - Check that the callback has been called with all the logged content, in order.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - binary (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    read_lines = []
+
+    def store_line(line):
+        read_lines.append(line)
+        return line == LAST_LINE
+
+    # Start the file regex monitoring
+    monitoring = MonitoringObject(callback=store_line, timeout=10, monitored_file=log_file)
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'only_new_events': True, 'binary': binary}
+    file_regex_monitor_process = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    file_regex_monitor_process.start()
+
+    # Waiting time for log to be written
+    time.sleep(0.25)
+    content = log_events(log_file, LINES_PER_BATCH * 2 + 1)
+    append_log(log_file, LAST_LINE)
+
+    # Check that the callback has been triggered and every line has been read once
+    file_regex_monitor_process.join()
+
+    assert ''.join(read_lines) == content + LAST_LINE
+
+
+def test_batching_case_2(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when events are logged continuously while monitoring.
+
+    case: Log events continuously while monitoring and expect the timeout to expire on time.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring of the new events with a non matching pattern.
+            - Log events continuously for longer than the monitoring timeout.
+            - Check that the TimeoutError exception has been raised before the events have stopped.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    log_events_parameters = {'log_file': log_file, 'events': LINES_PER_BATCH, 'duration': 4}
+    log_events_process = Thread(target=log_events, parameters=log_events_parameters)
+    log_events_process.start()
+
+    monitoring = MonitoringObject(pattern='non matching event', timeout=0.5, monitored_file=log_file)
+    start_time = time.time()
+
+    try:
+        with pytest.raises(TimeoutError):
+            FileRegexMonitor(monitoring, only_new_events=True)
+            pytest.fail('FileRegexMonitor did not raise a TimeoutError exception')
+
+        assert time.time() - start_time < 3.5
+    finally:
+        log_events_process.join()
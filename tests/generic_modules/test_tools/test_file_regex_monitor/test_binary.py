@@ -0,0 +1,175 @@
+"""
+Module to test the binary parameter of FileRegexMonitor.
+
+Test cases:
+    - Case 1: Pre-logged event, log another event while monitoring and expect 2 matches.
+        - case 1.1 [default callback]
+        - case 1.2 [custom callback]
+    - Case 2: Log a matching event in a file whose encoding is not ASCII compatible.
+    - Case 3: Log several non matching events while monitoring.
+    - Case 4: Pre-logged event with non ASCII characters and monitor it with patterns that match its characters.
+        - case 4.1 [any character]
+        - case 4.2 [character class]
+        - case 4.3 [literal]
+        - case 4.4 [ASCII file with a non ASCII pattern]
+"""
+
+import time
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import custom_callback, append_log, CUSTOM_PATTERN, \
+    DEFAULT_LOG_MESSAGE
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import TimeoutError
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+def start_binary_monitor(monitoring, accumulations=1, only_new_events=False):
+    """Start a FileRegexMonitor in binary mode in a thread.
+
+    Args:
+        monitoring (MonitoringObject): Monitoring object.
+        accumulations (int): Number of expected times to match with the callback.
+        only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
+
+    Returns:
+        Thread: Thread running the monitor.
+    """
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'accumulations': accumulations,
+                                     'only_new_events': only_new_events, 'binary': True}
+    file_regex_monitor_process = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    file_regex_monitor_process.start()
+
+    return file_regex_monitor_process
+
+
+@pytest.mark.parametrize('callback', [None, custom_callback], ids=['default_callback', 'custom_callback'])
+def test_binary_case_1(callback, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when reading the file in binary mode.
+
+    case: Pre-logged event, log another event while monitoring and expect 2 matches.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a line that triggers the monitoring callback.
+            - Start file monitoring in binary mode.
+            - Log a line that triggers the monitoring callback.
+            - Check that no TimeoutError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - callback (function): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, callback=callback, timeout=5, monitored_file=log_file)
+    monitor_process = start_binary_monitor(monitoring, accumulations=2)
+
+    # Waiting time for log to be written
+    time.sleep(0.25)
+    append_log(log_file, DEFAULT_LOG_MESSAGE)
+
+    monitor_process.join()
+
+
+def test_binary_case_2(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior in binary mode when the file encoding is not ASCII compatible.
+
+    case: Log a matching event in a file whose encoding is not ASCII compatible.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a UTF-16 line that triggers the monitoring callback.
+            - Start file monitoring in binary mode.
+            - Check that no TimeoutError exception has been raised (the text mode has been used).
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE} ЄЃЂ\n", encoding='utf-16')
+
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=1, monitored_file=log_file)
+    start_binary_monitor(monitoring).join()
+
+
+def test_binary_case_3(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior in binary mode when logging non matching events.
+
+    case: Log several non matching events while monitoring.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring in binary mode.
+            - Log several lines that don't trigger the monitoring callback.
+            - Check that TimeoutError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=1, monitored_file=log_file)
+    monitor_process = start_binary_monitor(monitoring, only_new_events=True)
+
+    for index in range(3):
+        append_log(log_file, f"Non matching event {index}\n")
+        time.sleep(0.1)
+
+    with pytest.raises(TimeoutError):
+        monitor_process.join()
+        pytest.fail('A TimeoutError exception has not been generated with non matching events')
+
+
+# The non ASCII events have several UTF-8 characters, so that their encoding is detected reliably
+@pytest.mark.parametrize('pattern, event', [('h.llo', 'héllo ñandú café'), ('h[é]llo', 'héllo ñandú café'),
+                                            ('héllo', 'héllo ñandú café'), ('h[é]llo', 'hello')],
+                         ids=['any_character', 'character_class', 'literal', 'ascii_file'])
+def test_binary_case_4(pattern, event, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior in binary mode with patterns that match non ASCII characters.
+
+    case: Pre-logged event with non ASCII characters and monitor it with patterns that match its characters.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a UTF-8 line (or an ASCII one) with the event.
+            - Start file monitoring in binary mode with a pattern that matches (or contains) non ASCII characters.
+            - Check that the pattern has matched like in text mode, or timed out if the event does not match it.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - pattern (str): Parametrized variable.
+        - event (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE} {event}\n")
+
+    monitoring = MonitoringObject(pattern=pattern, timeout=1, monitored_file=log_file)
+    monitor_process = start_binary_monitor(monitoring)
+
+    if event.isascii():
+        with pytest.raises(TimeoutError):
+            monitor_process.join()
+            pytest.fail('A TimeoutError exception has not been generated with a non matching event')
+    else:
+        monitor_process.join()
@@ -5,6 +5,7 @@ Test cases:
     - Start monitoring a written log file and write a new line with specific enconding.
     - Start monitoring an empty log file and write a new line with specific encoding.
     - Start monitoring a written log file and write a new line with different encoding.
+    - Start monitoring a large ASCII log file with a byte of another encoding out of the detection sample.
 """
 
 import time
@@ -12,6 +13,7 @@ import os
 import sys
 import pytest
 
+from fortishield_qa_framework.generic_modules.file.file import DEFAULT_ENCODING_SAMPLE_SIZE
 from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
 from fortishield_qa_framework.generic_modules.threading.thread import Thread
 from fortishield_qa_framework.meta_testing.utils import append_log
@@ -157,3 +159,34 @@ def test_new_encoding(create_destroy_sample_file):
 
     # Check that callback has been triggered
     file_regex_monitor_process.join()
+
+
+@pytest.mark.parametrize('shared_tailer', [False, True], ids=['own_reader', 'shared_tailer'])
+def test_undecodable_byte(shared_tailer, create_destroy_sample_file):
+    """Start monitoring a large ASCII log file with a byte of another encoding out of the detection sample.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Write more ASCII lines than the encoding detection sample, with a latin-1 byte in the middle.
+            - Start file monitoring of all the file lines with a pattern logged after the latin-1 byte.
+            - Check that the line has been matched instead of failing to decode the file.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - shared_tailer (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    ascii_lines = '2023/02/14 09:49:47 fortishield-remoted: DEBUG: Received event\n' * \
+        (DEFAULT_ENCODING_SAMPLE_SIZE // 60)
+
+    with open(log_file, 'wb') as _file:
+        _file.write(ascii_lines.encode())
+        _file.write(b'2023/02/14 09:49:47 fortishield-remoted: Caf\xe9 agent connected\n')
+        _file.write(ascii_lines.encode())
+
+    monitoring = MonitoringObject(pattern='Caf. agent connected', timeout=5, monitored_file=log_file)
+    FileRegexMonitor(monitoring, only_new_events=False, shared_tailer=shared_tailer)
@@ -0,0 +1,145 @@
+"""
+Module to test the match_records parameter of FileRegexMonitor.
+
+Test cases:
+    - Case 1: Pre-logged events, log other events while monitoring and check the records of all of them.
+        - case 1.1 [text mode]
+        - case 1.2 [binary mode]
+    - Case 2: Record the groups returned by a custom callback.
+    - Case 3: Get the records of the matches found before a timeout.
+"""
+
+import re
+import time
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import append_log
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.tools.match_records import MatchRecords
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import TimeoutError
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+EVENT_PATTERN = r'.*Event (\d+) processed by (\w+)'
+
+
+def event_line(number):
+    """Build a matching event line.
+
+    Args:
+        number (int): Event number.
+
+    Returns:
+        str: Event line.
+    """
+    return f"2023/02/14 09:49:47 fortishield-analysisd: INFO: Event {number} processed by agent{number}\n"
+
+
+@pytest.mark.parametrize('binary', [False, True], ids=['text', 'binary'])
+def test_match_records_case_1(binary, create_destroy_sample_file):
+    """Check the records of the matches found by the FileRegexMonitor.
+
+    case: Pre-logged events, log other events while monitoring and check the records of all of them.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log lines that trigger the monitoring callback and non matching lines.
+            - Start file monitoring recording the matches.
+            - Log other lines that trigger the monitoring callback.
+            - Check that the offsets, line numbers, timestamps and groups of all the matches have been recorded.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - binary (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    append_log(log_file, f"noise\n{event_line(1)}{event_line(2)}noise\n")
+    monitoring = MonitoringObject(pattern=EVENT_PATTERN, prefix=None, timeout=5, monitored_file=log_file)
+    start_time = time.time()
+    monitor_process = Thread(target=FileRegexMonitor, parameters={'monitoring': monitoring, 'accumulations': 4,
+                                                                  'binary': binary, 'match_records': True})
+    monitor_process.start()
+
+    # Waiting time for log to be written
+    time.sleep(0.25)
+    append_log(log_file, f"{event_line(3)}noise\n{event_line(4)}")
+    match_records = monitor_process.join().match_records
+
+    assert [record.line_number for record in match_records] == [2, 3, 5, 7]
+    assert [record.groups for record in match_records] == [(str(number), f"agent{number}") for number in range(1, 5)]
+    assert all(start_time <= record.timestamp <= time.time() for record in match_records)
+
+    # The offsets point to the matching lines
+    with open(log_file, 'rb') as _file:
+        for number, record in enumerate(match_records, 1):
+            _file.seek(record.offset)
+            assert _file.readline().decode() == event_line(number)
+
+
+def test_match_records_case_2(create_destroy_sample_file):
+    """Check that the groups returned by a custom callback are recorded.
+
+    case: Record the groups returned by a custom callback.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log lines that trigger the monitoring callback.
+            - Start file monitoring with a custom callback that returns the captured groups.
+            - Check that the groups of each match have been recorded.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    append_log(log_file, f"{event_line(1)}noise\n{event_line(2)}")
+    regex = re.compile(EVENT_PATTERN)
+
+    def callback(line):
+        match = regex.match(line)
+        return match.groups() if match else None
+
+    monitoring = MonitoringObject(callback=callback, timeout=1, monitored_file=log_file)
+    match_records = MatchRecords()
+    FileRegexMonitor(monitoring, accumulations=2, match_records=match_records)
+
+    assert match_records.groups == [('1', 'agent1'), ('2', 'agent2')]
+    assert list(match_records.line_numbers) == [1, 3]
+
+
+def test_match_records_case_3(create_destroy_sample_file):
+    """Check that the records of a given container are available after a timeout.
+
+    case: Get the records of the matches found before a timeout.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a line that triggers the monitoring callback.
+            - Start file monitoring expecting 2 matches and recording them in a given container.
+            - Check that TimeoutError exception has been raised and the match has been recorded.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    append_log(log_file, f"noise\n{event_line(1)}")
+    monitoring = MonitoringObject(pattern=EVENT_PATTERN, prefix=None, timeout=0.5, monitored_file=log_file)
+    match_records = MatchRecords()
+
+    with pytest.raises(TimeoutError):
+        FileRegexMonitor(monitoring, accumulations=2, match_records=match_records)
+
+    assert len(match_records) == 1
+    assert match_records[0].offset == len('noise\n')
+    assert match_records[0].line_number == 2
@@ -0,0 +1,142 @@
+"""
+Module to test the FileRegexMonitor behavior when the monitored file is rotated or truncated.
+
+Test cases:
+    - Case 1: Rotate or truncate the file under a heavy write load while monitoring and expect the events logged before
+              and after the change, but not the ones logged before starting the monitoring.
+"""
+
+import os
+import re
+import sys
+import time
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import append_log, remove_file
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+EVENT_REGEX = re.compile(r'.*Event (\d+) processed')
+NOISE_LINE = '2023/02/14 09:49:47 fortishield-remoted: INFO: Reading message from agent 001\n'
+
+
+def write_noise(file_object, bursts=20, burst_lines=1000):
+    """Write non matching lines in bursts.
+
+    Args:
+        file_object (file): File opened in append mode.
+        bursts (int): Number of bursts.
+        burst_lines (int): Number of lines of each burst.
+    """
+    for _ in range(bursts):
+        file_object.write(NOISE_LINE * burst_lines)
+        file_object.flush()
+
+
+def write_events_under_load(log_file, file_change):
+    """Write matching events surrounded by many non matching lines, rotating or truncating the file in the middle.
+
+    Args:
+        log_file (str): File path.
+        file_change (str): Change to apply to the file. Enum: [rotation, truncation].
+    """
+    with open(log_file, 'a') as _file:
+        write_noise(_file)
+        _file.write('Event 2 processed\n')
+        write_noise(_file)
+        _file.flush()
+        # Give the monitor time to read the lines, the ones that are truncated before being read are lost
+        time.sleep(0.5)
+
+        if file_change == 'rotation':
+            os.rename(log_file, f"{log_file}.1")
+            # The writer keeps writing to the rotated file until it opens the new one
+            write_noise(_file, bursts=1)
+        else:
+            os.truncate(log_file, 0)
+            # The truncation is only noticed if the file is smaller than the reached position when it is checked
+            time.sleep(0.5)
+
+    with open(log_file, 'a') as _file:
+        write_noise(_file)
+        _file.write('Event 3 processed\n')
+        write_noise(_file)
+
+
+def start_event_monitor(log_file, events, **monitor_parameters):
+    """Start a FileRegexMonitor that expects 2 events in a thread, saving the number of each matched event.
+
+    Args:
+        log_file (str): File path to monitor.
+        events (list(int)): List where the numbers of the matched events are appended.
+        monitor_parameters (dict): Additional FileRegexMonitor parameters.
+
+    Returns:
+        Thread: Thread running the monitor.
+    """
+    def callback(line):
+        match = EVENT_REGEX.match(line)
+        if match:
+            events.append(int(match.group(1)))
+            return True
+
+        return None
+
+    monitoring = MonitoringObject(callback=callback, timeout=10, monitored_file=log_file)
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'accumulations': 2, 'only_new_events': True,
+                                     **monitor_parameters}
+    file_regex_monitor_process = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    file_regex_monitor_process.start()
+
+    return file_regex_monitor_process
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='The opened files can not be renamed or truncated on Windows')
+@pytest.mark.parametrize('wakeup_backend', ['auto', 'polling'])
+@pytest.mark.parametrize('monitor_parameters', [{}, {'binary': True}, {'shared_tailer': True}],
+                         ids=['text', 'binary', 'shared_tailer'])
+@pytest.mark.parametrize('file_change', ['rotation', 'truncation'])
+def test_rotation_case_1(file_change, monitor_parameters, wakeup_backend, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when the monitored file is rotated or truncated under a heavy write load.
+
+    case: Rotate or truncate the file under a heavy write load while monitoring and expect the events logged before and
+          after the change, but not the ones logged before starting the monitoring.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a matching event.
+            - Start file monitoring.
+            - Log many lines with a matching event, rotate or truncate the file and log many lines with another event.
+            - Check that no TimeoutError exception has been raised.
+            - Check that only the events logged while monitoring have been matched, in order.
+        - teardown:
+            - Remove the create file in the setup phase and the rotated one.
+
+    parameters:
+        - file_change (str): Parametrized variable.
+        - monitor_parameters (dict): Parametrized variable.
+        - wakeup_backend (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    events = []
+
+    try:
+        append_log(log_file, 'Event 1 processed\n')
+        monitor_process = start_event_monitor(log_file, events, wakeup_backend=wakeup_backend, **monitor_parameters)
+
+        # Waiting time for the monitoring to start
+        time.sleep(0.25)
+
+        write_events_under_load(log_file, file_change)
+
+        # Check that the callback has been triggered and no exception has been raised
+        monitor_process.join()
+
+        assert events == [2, 3]
+    finally:
+        if os.path.exists(f"{log_file}.1"):
+            remove_file(f"{log_file}.1")
@@ -0,0 +1,200 @@
+"""
+Module to test the shared_tailer parameter of FileRegexMonitor.
+
+Test cases:
+    - Case 1: Several monitors with different accumulations share the tailer and log matching events.
+    - Case 2: Pre-logged event and does not log anything while monitoring.
+        - case 2.1 [only_new_events enabled]
+        - case 2.2 [only_new_events disabled]
+    - Case 3: Log several non matching events while monitoring.
+    - Case 4: Log a matching event while a new monitor is checking the pre-logged events.
+"""
+
+import time
+import threading
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import append_log, CUSTOM_PATTERN, DEFAULT_LOG_MESSAGE
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.tools.file_tailer import FileTailer
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import TimeoutError
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+def start_shared_monitor(log_file, accumulations=1, only_new_events=True, timeout=5):
+    """Start a FileRegexMonitor that uses the shared tailer in a thread.
+
+    Args:
+        log_file (str): File path to monitor.
+        accumulations (int): Number of expected times to match with the callback.
+        only_new_events (boolean): True for only checking new lines, False to take into account all file lines.
+        timeout (int): Max time to monitor and trigger the callback.
+
+    Returns:
+        Thread: Thread running the monitor.
+    """
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=timeout, monitored_file=log_file)
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'accumulations': accumulations,
+                                     'only_new_events': only_new_events, 'shared_tailer': True}
+    file_regex_monitor_process = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    file_regex_monitor_process.start()
+
+    return file_regex_monitor_process
+
+
+def test_shared_tailer_case_1(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when several monitors share the tailer.
+
+    case: Several monitors with different accumulations share the tailer and log matching events.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start several file monitors with different accumulations.
+            - Log lines that trigger the monitoring callbacks.
+            - Check that TimeoutError exception has not been raised.
+            - Check that all the monitors have used the same tailer and it has no subscriptions left.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    monitor_processes = [start_shared_monitor(log_file, accumulations) for accumulations in [1, 2, 3] * 3]
+
+    # Waiting time for log to be written
+    time.sleep(0.25)
+
+    # Write the events
+    for _ in range(3):
+        append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+
+    # Check that the callbacks have been triggered and no exception has been raised
+    for monitor_process in monitor_processes:
+        monitor_process.join()
+
+    assert FileTailer.get_tailer(log_file).subscriptions == []
+
+
+@pytest.mark.parametrize('only_new_events, expected_exception', [(True, True), (False, False)],
+                         ids=['enabled', 'disabled'])
+def test_shared_tailer_case_2(only_new_events, expected_exception, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior with the shared tailer when we enable/disable the only_new_events setting.
+
+    case: Pre-logged event and does not log anything while monitoring.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log a line that triggers the monitoring callback.
+            - Start file monitoring.
+            - Check if TimeoutError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - only_new_events (boolean): Parametrized variable.
+        - expected_exception (boolean): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    # Add a log message
+    append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+
+    monitor_process = start_shared_monitor(log_file, only_new_events=only_new_events, timeout=1)
+
+    # Check if the callback has been triggered and if a timeout exception has been raised
+    if expected_exception:
+        with pytest.raises(TimeoutError):
+            monitor_process.join()
+            pytest.fail('FileRegexMonitor has not raised a TimeoutError exception when it was expected')
+    else:
+        monitor_process.join()
+
+
+def test_shared_tailer_case_3(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior with the shared tailer when logging non matching events.
+
+    case: Log several non matching events while monitoring.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring.
+            - Log several lines that don't trigger the monitoring callback.
+            - Check that TimeoutError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    monitor_process = start_shared_monitor(log_file, timeout=1)
+
+    # Write multiple non matching events
+    for index in range(3):
+        append_log(log_file, f"Non matching event {index}\n")
+        time.sleep(0.1)
+
+    with pytest.raises(TimeoutError):
+        monitor_process.join()
+        pytest.fail('A TimeoutError exception has not been generated with non matching events')
+
+
+def test_shared_tailer_case_4(create_destroy_sample_file):
+    """Check that a monitor checking the pre-logged events does not block the other monitors of the shared tailer.
+
+    case: Log a matching event while a new monitor is checking the pre-logged events.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Log several lines and start file monitoring of the new events.
+            - Start file monitoring of all the file lines with a callback that blocks on the pre-logged lines.
+            - Log a line that triggers the first monitor callback while the second one is blocked.
+            - Check that the first monitor has finished without TimeoutError while the second one is blocked.
+            - Unblock the second monitor and check that it has finished.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    checking_started = threading.Event()
+    unblock_checking = threading.Event()
+
+    def blocking_callback(line):
+        checking_started.set()
+        unblock_checking.wait(10)
+        return True
+
+    append_log(log_file, 'Pre-logged event\n' * 10)
+    new_events_monitor = start_shared_monitor(log_file, timeout=2)
+    # Waiting time for the first monitor to subscribe
+    time.sleep(0.25)
+
+    monitoring = MonitoringObject(callback=blocking_callback, timeout=10, monitored_file=log_file)
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'only_new_events': False, 'shared_tailer': True}
+    all_events_monitor = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    all_events_monitor.start()
+
+    try:
+        assert checking_started.wait(5)
+        append_log(log_file, f"{DEFAULT_LOG_MESSAGE}\n")
+        new_events_monitor.join()
+        # The first monitor has finished while the second one is still checking the pre-logged events
+        assert all_events_monitor.is_alive()
+    finally:
+        unblock_checking.set()
+
+    all_events_monitor.join()
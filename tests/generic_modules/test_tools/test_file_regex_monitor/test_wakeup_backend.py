@@ -0,0 +1,144 @@
+"""
+Module to test the wakeup_backend parameter of FileRegexMonitor.
+
+Test cases:
+    - Case 1: Log a matching event while monitoring with each wakeup backend.
+    - Case 2: Wait on an inotify watcher with and without file changes.
+    - Case 3: Set a non valid wakeup backend.
+    - Case 4: Wait on a polling watcher several times and after reading new data.
+"""
+
+import sys
+import time
+import pytest
+
+from fortishield_qa_framework.meta_testing.utils import append_log, CUSTOM_PATTERN, DEFAULT_LOG_MESSAGE
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject, FileRegexMonitor
+from fortishield_qa_framework.generic_modules.tools.file_watcher import InotifyFileWatcher, PollingFileWatcher
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ValidationError
+from fortishield_qa_framework.generic_modules.threading.thread import Thread
+
+
+@pytest.mark.parametrize('wakeup_backend', [
+    'auto',
+    'polling',
+    pytest.param('inotify', marks=pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux'))
+])
+def test_wakeup_backend_case_1(wakeup_backend, create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when setting the wakeup backend.
+
+    case: Log a matching event while monitoring with each wakeup backend.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring with the specified wakeup backend.
+            - Log a line that triggers the monitoring callback.
+            - Check that TimeoutError exception has not been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - wakeup_backend (str): Parametrized variable.
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    # Start the file regex monitoring
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=2, monitored_file=log_file)
+    file_regex_monitor_parameters = {'monitoring': monitoring, 'only_new_events': True,
+                                     'wakeup_backend': wakeup_backend}
+    file_regex_monitor_process = Thread(target=FileRegexMonitor, parameters=file_regex_monitor_parameters)
+    file_regex_monitor_process.start()
+
+    # Waiting time for log to be written
+    time.sleep(0.25)
+
+    # Write the event
+    append_log(log_file, DEFAULT_LOG_MESSAGE)
+
+    # Check that the callback has been triggered and no exception has been raised
+    file_regex_monitor_process.join()
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Requires Linux')
+def test_wakeup_backend_case_2(create_destroy_sample_file):
+    """Check the inotify watcher behavior.
+
+    case: Wait on an inotify watcher with and without file changes.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Wait on the watcher without changes and check that the timeout expires.
+            - Log a line and check that the watcher wakes up.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+
+    with InotifyFileWatcher(log_file) as watcher:
+        assert not watcher.wait(0.1)
+
+        append_log(log_file, DEFAULT_LOG_MESSAGE)
+
+        assert watcher.wait(1)
+
+
+def test_wakeup_backend_case_3(create_destroy_sample_file):
+    """Check the FileRegexMonitor behavior when setting a non valid wakeup backend.
+
+    case: Set a non valid wakeup backend.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Start file monitoring with a non valid wakeup backend.
+            - Check that ValidationError exception has been raised.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    monitoring = MonitoringObject(pattern=CUSTOM_PATTERN, timeout=1, monitored_file=create_destroy_sample_file)
+
+    with pytest.raises(ValidationError):
+        FileRegexMonitor(monitoring, only_new_events=True, wakeup_backend='non_valid')
+        pytest.fail('FileRegexMonitor did not raise an exception with a non valid wakeup backend')
+
+
+def test_wakeup_backend_case_4(create_destroy_sample_file):
+    """Check the polling watcher backoff.
+
+    case: Wait on a polling watcher several times and after reading new data.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Wait on the watcher several times and check that the sleep time is doubled up to the interval.
+            - Notify that new data has been read and check that the sleep time is the min interval again.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    with PollingFileWatcher(create_destroy_sample_file, interval=0.04, min_interval=0.01) as watcher:
+        intervals = []
+        for _ in range(4):
+            intervals.append(watcher.current_interval)
+            assert watcher.wait(1)
+
+        assert intervals == [0.01, 0.02, 0.04, 0.04]
+
+        watcher.reset()
+
+        assert watcher.current_interval == 0.01
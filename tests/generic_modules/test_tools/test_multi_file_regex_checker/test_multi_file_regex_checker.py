@@ -0,0 +1,160 @@
+"""
+Module to test the MultiFileRegexChecker class.
+
+Test cases:
+    - Case 1: Check patterns spread across plain, rotated and compressed files.
+        - case 1.1 [check_order enabled]
+        - case 1.2 [check_order disabled]
+    - Case 2: Check patterns that are found in the wrong order across the files.
+    - Case 3: Report every missing pattern at once with check_order disabled.
+    - Case 4: Check patterns in a compressed file with bytes that are not valid in the files encoding.
+        - case 4.1 [check_order enabled]
+        - case 4.2 [check_order disabled]
+"""
+
+import os
+import bz2
+import gzip
+import pytest
+from tempfile import gettempdir
+
+from fortishield_qa_framework.generic_modules.tools.multi_file_regex_checker import MultiFileRegexChecker
+from fortishield_qa_framework.generic_modules.exceptions.exceptions import ElementNotFoundError
+from fortishield_qa_framework.meta_testing.utils import write_file, remove_file
+
+
+# Content of each file, in chronological order
+FILES_CONTENT = {
+    'file.log.3.bz2': '1\nnoise\n2\n',
+    'file.log.2.gz': 'noise\n3\n1\n',
+    'file.log.1': '4\nnoise\n',
+    'file.log': '2\n5\n'
+}
+
+
+@pytest.fixture
+def log_files():
+    """Create the plain and compressed files and remove them after finishing."""
+    files = []
+    for file_name, content in FILES_CONTENT.items():
+        file = os.path.join(gettempdir(), file_name)
+        if file.endswith('.gz'):
+            with gzip.open(file, 'wt') as _file:
+                _file.write(content)
+        elif file.endswith('.bz2'):
+            with bz2.open(file, 'wt') as _file:
+                _file.write(content)
+        else:
+            write_file(file, content)
+        files.append(file)
+
+    yield files
+
+    for file in files:
+        remove_file(file)
+
+
+@pytest.mark.parametrize('check_order', [True, False])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_multi_file_regex_checker_case_1(check_order, workers, log_files):
+    """Check the MultiFileRegexChecker behavior with patterns spread across plain and compressed files.
+
+    case: Check patterns spread across plain, rotated and compressed files.
+
+    test_phases:
+        - setup:
+            - Create the plain and compressed files.
+        - test:
+            - Check patterns that are found across the files, in order.
+            - Check that no ElementNotFoundError exception has been raised.
+        - teardown:
+            - Remove the files.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - workers (int): Parametrized variable.
+        - log_files (fixture): Create the plain and compressed files and remove them after finishing.
+    """
+    MultiFileRegexChecker(files=log_files, patterns=['1', '2', '3', '1', '4', '5'], check_order=check_order,
+                          workers=workers)
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_multi_file_regex_checker_case_2(workers, log_files):
+    """Check the MultiFileRegexChecker behavior when the patterns are found in the wrong order across the files.
+
+    case: Check patterns that are found in the wrong order across the files.
+
+    test_phases:
+        - setup:
+            - Create the plain and compressed files.
+        - test:
+            - Check patterns that are found in the files, but in a different order.
+            - Check that ElementNotFoundError exception has been raised only with check_order enabled.
+        - teardown:
+            - Remove the files.
+
+    parameters:
+        - workers (int): Parametrized variable.
+        - log_files (fixture): Create the plain and compressed files and remove them after finishing.
+    """
+    patterns = ['4', '3', '5']
+
+    with pytest.raises(ElementNotFoundError):
+        MultiFileRegexChecker(files=log_files, patterns=patterns, check_order=True, workers=workers)
+
+    MultiFileRegexChecker(files=log_files, patterns=patterns, check_order=False, workers=workers)
+
+
+def test_multi_file_regex_checker_case_3(log_files):
+    """Check that the MultiFileRegexChecker reports all the missing patterns when the order is not checked.
+
+    case: Report every missing pattern at once with check_order disabled.
+
+    test_phases:
+        - setup:
+            - Create the plain and compressed files.
+        - test:
+            - Check patterns that are not found in any file.
+            - Check that the raised error contains all the missing patterns.
+        - teardown:
+            - Remove the files.
+
+    parameters:
+        - log_files (fixture): Create the plain and compressed files and remove them after finishing.
+    """
+    with pytest.raises(ElementNotFoundError) as error:
+        MultiFileRegexChecker(files=log_files, patterns=['1', '6', '5', '7'], check_order=False, workers=2)
+
+    assert "['6', '7']" in str(error.value)
+
+
+@pytest.mark.parametrize('check_order', [True, False])
+def test_multi_file_regex_checker_case_4(check_order, log_files):
+    """Check the MultiFileRegexChecker behavior with files that contain bytes not valid in their encoding.
+
+    case: Check patterns in a compressed file with bytes that are not valid in the files encoding.
+
+    test_phases:
+        - setup:
+            - Create the plain and compressed files.
+        - test:
+            - Create a gzip file with a latin-1 byte between the lines of the patterns.
+            - Check the patterns in all the files.
+            - Check that the patterns are found instead of failing to decode the file.
+        - teardown:
+            - Remove the files.
+
+    parameters:
+        - check_order (boolean): Parametrized variable.
+        - log_files (fixture): Create the plain and compressed files and remove them after finishing.
+    """
+    file = os.path.join(gettempdir(), 'file.log.4.gz')
+    with gzip.open(file, 'wb') as _file:
+        _file.write(b'0\nCaf\xe9\n1\n')
+
+    try:
+        MultiFileRegexChecker(files=[file] + log_files, patterns=['0', 'Caf', '1', '5'], check_order=check_order,
+                              workers=2)
+    finally:
+        remove_file(file)
@@ -0,0 +1,112 @@
+"""
+Module to test the PatternSet and MonitoringObjectSet classes.
+
+Test cases:
+    - Case 1: Match lines against a set of patterns and check that the result is the same as matching one by one.
+    - Case 2: Match lines against a set of monitoring objects with default and custom callbacks.
+    - Case 3: Match lines against patterns with global inline flags and check that the flags do not affect the others.
+"""
+
+import re
+import pytest
+
+from fortishield_qa_framework.generic_modules.tools.pattern_set import PatternSet, MonitoringObjectSet
+from fortishield_qa_framework.generic_modules.tools.file_regex_monitor import MonitoringObject
+from fortishield_qa_framework.meta_testing.utils import custom_callback, CUSTOM_PATTERN, DEFAULT_LOG_MESSAGE
+
+
+PATTERNS = [
+    r'.*fortishield-modulesd:aws-s3: INFO: Executing Service Analysis',
+    r'.*fortishield-remoted.*',
+    r'.*(INFO|ERROR): (?P<message>.*)',
+    r'.*(?P<message>Executing)',
+    r'(\d+)/\1',
+    r'(?i).*executing service',
+    r'\d{4}/\d{2}/\d{2}',
+    r'.*'
+]
+
+LINES = [
+    DEFAULT_LOG_MESSAGE,
+    '2023/02/14 09:49:47 fortishield-remoted: ERROR: Unable to connect',
+    '2023/2023 Non matching line',
+    'Executing',
+    ''
+]
+
+
+@pytest.mark.parametrize('line', LINES)
+@pytest.mark.parametrize('bytes_mode', [False, True], ids=['str', 'bytes'])
+def test_pattern_set(line, bytes_mode):
+    """Check that the PatternSet gets the same matches as matching the patterns one by one.
+
+    case: Match lines against a set of patterns and check that the result is the same as matching one by one.
+
+    test_phases:
+        - test:
+            - Build the pattern set.
+            - Check that the matching patterns are the same ones that match individually.
+
+    parameters:
+        - line (str): Parametrized variable.
+        - bytes_mode (boolean): Parametrized variable.
+    """
+    patterns = [pattern.encode() for pattern in PATTERNS] if bytes_mode else PATTERNS
+    line = line.encode() if bytes_mode else line
+
+    expected_matches = [index for index, pattern in enumerate(patterns) if re.match(pattern, line)]
+
+    assert PatternSet(patterns).match(line) == expected_matches
+
+
+@pytest.mark.parametrize('line, expected_matches', [('abc', []), ('12 X', []), ('12 x', [2]), ('ERROR', [0]),
+                                                    ('Abc', [1])])
+def test_pattern_set_global_flags(line, expected_matches):
+    """Check that the global inline flags of a pattern do not apply to the other patterns of the set.
+
+    case: Match lines against patterns with global inline flags and check that the flags do not affect the others.
+
+    test_phases:
+        - test:
+            - Build a pattern set with a case insensitive pattern and case sensitive ones.
+            - Check that the case insensitive pattern is not merged with the others.
+            - Check that only the case insensitive pattern matches regardless of the case.
+
+    parameters:
+        - line (str): Parametrized variable.
+        - expected_matches (list(int)): Parametrized variable.
+    """
+    pattern_set = PatternSet(['(?i)er', 'A.*', r'\d+ x'])
+
+    assert 0 not in pattern_set.combined_indexes
+    assert pattern_set.match(line) == expected_matches
+
+
+def test_monitoring_object_set(create_destroy_sample_file):
+    """Check that the MonitoringObjectSet gets the monitoring objects whose callback matches the line.
+
+    case: Match lines against a set of monitoring objects with default and custom callbacks.
+
+    test_phases:
+        - setup:
+            - Create an empty file.
+        - test:
+            - Build the monitoring object set with default and custom callbacks.
+            - Check the matching monitoring objects of a matching and a non matching line.
+        - teardown:
+            - Remove the create file in the setup phase.
+
+    parameters:
+        - create_destroy_sample_file (fixture): Create an empty file and remove it after finishing.
+    """
+    log_file = create_destroy_sample_file
+    monitorings = [
+        MonitoringObject(pattern=CUSTOM_PATTERN, monitored_file=log_file),
+        MonitoringObject(pattern='fortishield-remoted', monitored_file=log_file),
+        MonitoringObject(callback=custom_callback, monitored_file=log_file),
+        MonitoringObject(pattern=CUSTOM_PATTERN, monitored_file=log_file)
+    ]
+    monitoring_set = MonitoringObjectSet(monitorings)
+
+    assert monitoring_set.match(DEFAULT_LOG_MESSAGE) == [0, 2, 3]
+    assert monitoring_set.match('Non matching line') == []